@@ -15,12 +15,19 @@ from git.exc import InvalidGitRepositoryError
 
 import colrev.exceptions as colrev_exceptions
 import colrev.operation
+import colrev.record
 from colrev.constants import ExitCodes
 from colrev.constants import Fields
 
 if TYPE_CHECKING:
     import colrev.review_manager
 
+# (source, dest) -> trigger (later transitions in the RecordStateModel take precedence)
+TRANSITION_TRIGGERS: typing.Dict[tuple, str] = {
+    (transition["source"], transition["dest"]): str(transition["trigger"])
+    for transition in colrev.record.RecordStateModel.transitions
+}
+
 
 class Checker:
     """The CoLRev checker makes sure the project setup is ok"""
@@ -33,6 +40,8 @@ class Checker:
         review_manager: colrev.review_manager.ReviewManager,
     ) -> None:
         self.review_manager = review_manager
+        self.records = {}
+        self.__records_loaded = False
 
         self.review_manager.notified_next_operation = (
             colrev.operation.OperationsType.check
@@ -486,17 +495,25 @@ class Checker:
                 )
 
     def __retrieve_prior(self) -> dict:
-        prior: dict = {Fields.STATUS: [], "persisted_IDs": []}
-        prior_records = next(self.review_manager.dataset.load_records_from_history())
-        for prior_record in prior_records.values():
-            for orig in prior_record[Fields.ORIGIN]:
-                prior[Fields.STATUS].append([orig, prior_record[Fields.STATUS]])
-                if prior_record[
-                    Fields.STATUS
-                ] in colrev.record.RecordState.get_post_x_states(
-                    state=colrev.record.RecordState.md_processed
-                ):
-                    prior["persisted_IDs"].append([orig, prior_record[Fields.ID]])
+        # Note : prior[colrev_status] maps origins to the prior status
+        # (of the first prior record with the origin)
+        prior: dict = {Fields.STATUS: {}, "persisted_IDs": []}
+        post_md_processed_states = colrev.record.RecordState.get_post_x_states(
+            state=colrev.record.RecordState.md_processed
+        )
+        latest_records = (
+            self.review_manager.dataset.records_history.get_latest_records()
+        )
+        for record_id, (status_str, origins) in latest_records.items():
+            if status_str not in colrev.record.RecordState.__members__:
+                continue
+            status = colrev.record.RecordState[status_str]
+            for orig in origins:
+                prior[Fields.STATUS].setdefault(
+                    orig, (len(prior[Fields.STATUS]), status)
+                )
+                if status in post_md_processed_states:
+                    prior["persisted_IDs"].append([orig, record_id])
         return prior
 
     # pylint: disable=too-many-arguments
@@ -509,42 +526,35 @@ class Checker:
         status: colrev.record.RecordState,
         status_data: dict,
     ) -> dict:
-        prior_status = []
-        if Fields.STATUS in prior:
-            prior_status = [
-                stat for (org, stat) in prior[Fields.STATUS] if org in origin
-            ]
+        prior_states = prior.get(Fields.STATUS, {})
+        prior_status_items = [
+            prior_states[org] for org in origin if org in prior_states
+        ]
 
         status_transition = {}
-        if len(prior_status) == 0:
+        if not prior_status_items:
             # pylint: disable=colrev-missed-constant-usage
             status_transition[record_id] = "load"
-        else:
-            proc_transition_list: list = [
-                x["trigger"]
-                for x in colrev.record.RecordStateModel.transitions
-                if str(x["source"]) == prior_status[0] and str(x["dest"]) == status
-            ]
-            if len(proc_transition_list) == 0 and prior_status[0] != status:
-                status_data["start_states"].append(prior_status[0])
-                if prior_status[0] not in colrev.record.RecordState:
-                    raise colrev_exceptions.StatusFieldValueError(
-                        record_id, Fields.STATUS, prior_status[0]
-                    )
-                if status not in colrev.record.RecordState:
-                    raise colrev_exceptions.StatusFieldValueError(
-                        record_id, Fields.STATUS, str(status)
-                    )
-
-                status_data["invalid_state_transitions"].append(
-                    f"{record_id}: {prior_status[0]} to {status}"
+            return status_transition
+
+        _, prior_status = min(prior_status_items, key=lambda item: item[0])
+        proc_transition = TRANSITION_TRIGGERS.get((prior_status, status), "")
+        if not proc_transition and prior_status != status:
+            status_data["start_states"].append(prior_status)
+            if prior_status not in colrev.record.RecordState:
+                raise colrev_exceptions.StatusFieldValueError(
+                    record_id, Fields.STATUS, prior_status
                 )
-            if 0 == len(proc_transition_list):
-                # pylint: disable=colrev-missed-constant-usage
-                status_transition[record_id] = "load"
-            else:
-                proc_transition = proc_transition_list.pop()
-                status_transition[record_id] = proc_transition
+            if status not in colrev.record.RecordState:
+                raise colrev_exceptions.StatusFieldValueError(
+                    record_id, Fields.STATUS, str(status)
+                )
+
+            status_data["invalid_state_transitions"].append(
+                f"{record_id}: {prior_status} to {status}"
+            )
+        # pylint: disable=colrev-missed-constant-usage
+        status_transition[record_id] = proc_transition or "load"
         return status_transition
 
     def __retrieve_status_data(self, *, prior: dict, records: dict) -> dict:
@@ -562,6 +572,9 @@ class Checker:
             "invalid_state_transitions": [],
         }
 
+        post_md_processed_states = colrev.record.RecordState.get_post_x_states(
+            state=colrev.record.RecordState.md_processed
+        )
         for record_dict in records.values():
             status_data["IDs"].append(record_dict[Fields.ID])
 
@@ -571,9 +584,6 @@ class Checker:
                 else:
                     status_data["origin_ID_list"][org] = [record_dict[Fields.ID]]
 
-            post_md_processed_states = colrev.record.RecordState.get_post_x_states(
-                state=colrev.record.RecordState.md_processed
-            )
             if record_dict[Fields.STATUS] in post_md_processed_states:
                 for origin_part in record_dict[Fields.ORIGIN]:
                     status_data["persisted_IDs"].append(
@@ -612,6 +622,14 @@ class Checker:
 
         return status_data
 
+    def __load_records(self) -> None:
+        # Note : the records are loaded once (shared by the checks)
+        if self.__records_loaded:
+            return
+        if self.review_manager.dataset.records_file.is_file():
+            self.records = self.review_manager.dataset.load_records_dict()
+        self.__records_loaded = True
+
     def check_repo_basics(self) -> list:
         """Calls data.main() to update the stats"""
 
@@ -619,8 +637,7 @@ class Checker:
             notify_state_transition_operation=False
         )
 
-        if self.review_manager.dataset.records_file.is_file():
-            self.records = self.review_manager.dataset.load_records_dict()
+        self.__load_records()
 
         check_scripts: list[dict[str, typing.Any]] = []
         data_checks = [
@@ -675,9 +692,7 @@ class Checker:
 
         # pylint: disable=not-a-mapping
 
-        self.records: typing.Dict[str, typing.Any] = {}
-        if self.review_manager.dataset.records_file.is_file():
-            self.records = self.review_manager.dataset.load_records_dict()
+        self.__load_records()
 
         # We work with exceptions because each issue may be raised in different checks.
         # Currently, linting is limited for the scripts.
@@ -3,10 +3,9 @@
 from __future__ import annotations
 
 import io
-import itertools
+import json
 import os
 import re
-import string
 import time
 import typing
 from copy import deepcopy
@@ -19,25 +18,29 @@ import git
 import pybtex.errors
 from git.exc import GitCommandError
 from git.exc import InvalidGitRepositoryError
-from pybtex.database import Person
 from pybtex.database.input import bibtex
 from tqdm import tqdm
 
 import colrev.env.language_service
 import colrev.env.utils
 import colrev.exceptions as colrev_exceptions
+import colrev.id_allocator
 import colrev.operation
 import colrev.record
+import colrev.records_cache
+import colrev.records_history
+import colrev.records_index
+import colrev.records_parser
 import colrev.settings
 from colrev.constants import ExitCodes
 from colrev.constants import Fields
-from colrev.constants import FieldValues
 
 if TYPE_CHECKING:
     import colrev.review_manager
 
 # pylint: disable=too-many-public-methods
 # pylint: disable=too-many-lines
+# pylint: disable=too-many-instance-attributes
 
 
 class Dataset:
@@ -45,6 +48,10 @@ class Dataset:
 
     RECORDS_FILE_RELATIVE = Path("data/records.bib")
     GIT_IGNORE_FILE_RELATIVE = Path(".gitignore")
+    RECORDS_CACHE_RELATIVE = Path(".colrev/records.cache")
+    RECORDS_INDEX_RELATIVE = Path(".colrev/records.index")
+    RECORDS_HISTORY_RELATIVE = Path(".colrev/records_history.index")
+    DECISIONS_FILE_RELATIVE = Path(".colrev/decisions.log")
     DEFAULT_GIT_IGNORE_ITEMS = [
         ".history",
         ".colrev",
@@ -79,12 +86,26 @@ class Dataset:
         self.review_manager = review_manager
         self.records_file = review_manager.path / self.RECORDS_FILE_RELATIVE
         self.git_ignore_file = review_manager.path / self.GIT_IGNORE_FILE_RELATIVE
+        self.decisions_file = review_manager.path / self.DECISIONS_FILE_RELATIVE
+        self.records_cache = colrev.records_cache.RecordsCache(
+            records_file=self.records_file,
+            cache_path=review_manager.path / self.RECORDS_CACHE_RELATIVE,
+        )
+        self.records_index = colrev.records_index.RecordsIndex(
+            records_file=self.records_file,
+            index_path=review_manager.path / self.RECORDS_INDEX_RELATIVE,
+        )
 
         try:
             self.__git_repo = git.Repo(self.review_manager.path)
         except InvalidGitRepositoryError as exc:
             msg = "Not a CoLRev/git repository. Run\n    colrev init"
             raise colrev_exceptions.RepoSetupError(msg) from exc
+        self.records_history = colrev.records_history.RecordsHistory(
+            git_repo=self.__git_repo,
+            records_file_relative=self.RECORDS_FILE_RELATIVE,
+            index_path=review_manager.path / self.RECORDS_HISTORY_RELATIVE,
+        )
 
         if not self.review_manager.verbose_mode:
             temp_f = io.StringIO()
@@ -125,6 +146,8 @@ class Dataset:
         """
 
         current_origin_states_dict = {}
+        if file_object is None:
+            self.merge_decision_journal()
         if self.records_file.is_file():
             for record_header_item in self.__read_record_header_items(
                 file_object=file_object
@@ -192,36 +215,29 @@ class Dataset:
     def get_changed_records(self, *, target_commit: str) -> typing.List[dict]:
         """Get the records that changed in a selected commit"""
 
-        revlist = (
-            (
-                commit.hexsha,
-                (commit.tree / "data" / "records.bib").data_stream.read(),
-            )
-            for commit in self.__git_repo.iter_commits(
-                paths=str(self.RECORDS_FILE_RELATIVE)
-            )
-        )
-        found = False
         records_dict, prior_records_dict = {}, {}
-        for commit, filecontents in list(revlist):
-            if found:  # load the records_file_relative in the following commit
-                prior_records_dict = self.review_manager.dataset.load_records_dict(
-                    load_str=filecontents.decode("utf-8")
-                )
-                break
-            if commit == target_commit:
-                records_dict = self.review_manager.dataset.load_records_dict(
-                    load_str=filecontents.decode("utf-8")
+        filecontents = self.records_history.load_records_file(commit_sha=target_commit)
+        if filecontents is not None:
+            records_dict = self.load_records_dict(load_str=filecontents.decode("utf-8"))
+            prior_filecontents = self.records_history.load_records_file(
+                commit_sha=target_commit, prior=True
+            )
+            if prior_filecontents is not None:
+                prior_records_dict = self.load_records_dict(
+                    load_str=prior_filecontents.decode("utf-8")
                 )
-                found = True
 
         # determine which records have been changed (prepared or merged)
         # in the target_commit
+        prior_records_by_origin: dict = {}
+        for rec in prior_records_dict.values():
+            for origin in rec[Fields.ORIGIN]:
+                prior_records_by_origin.setdefault(origin, rec)
         for record in records_dict.values():
             prior_record_l = [
-                rec
-                for rec in prior_records_dict.values()
-                if any(x in record[Fields.ORIGIN] for x in rec[Fields.ORIGIN])
+                prior_records_by_origin[x]
+                for x in record[Fields.ORIGIN]
+                if x in prior_records_by_origin
             ]
             if not prior_record_l:
                 continue
@@ -232,94 +248,10 @@ class Dataset:
 
         return list(records_dict.values())
 
-    @classmethod
-    def __load_field_dict(cls, *, value: str, field: str) -> dict:
-        # pylint: disable=too-many-branches
-
-        return_dict = {}
-        if field == Fields.MD_PROV:
-            # pylint: disable=colrev-missed-constant-usage
-            if value[:7] == "CURATED":
-                if value.count(";") == 0:
-                    value += ";;"  # Note : temporary fix (old format)
-                if value.count(";") == 1:
-                    value += ";"  # Note : temporary fix (old format)
-
-                if ":" in value:
-                    source = value[value.find(":") + 1 : value[:-1].rfind(";")]
-                else:
-                    source = ""
-                return_dict[FieldValues.CURATED] = {
-                    "source": source,
-                    "note": "",
-                }
-
-            elif value != "":
-                # Pybtex automatically replaces \n in fields.
-                # For consistency, we also do that for header_only mode:
-                if "\n" in value:
-                    value = value.replace("\n", " ")
-                items = [x.lstrip() + ";" for x in (value + " ").split("; ") if x != ""]
-
-                for item in items:
-                    key_source = item[: item[:-1].rfind(";")]
-                    if ":" in key_source:
-                        note = item[item[:-1].rfind(";") + 1 : -1]
-                        key, source = key_source.split(":", 1)
-                        # key = key.rstrip().lstrip()
-                        return_dict[key] = {
-                            "source": source,
-                            "note": note,
-                        }
-                    else:
-                        print(f"problem with masterdata_provenance_item {item}")
-
-        elif field == Fields.D_PROV:
-            if value != "":
-                # Note : pybtex replaces \n upon load
-                for item in (value + " ").split("; "):
-                    if item == "":
-                        continue
-                    item += ";"  # removed by split
-                    key_source = item[: item[:-1].rfind(";")]
-                    note = item[item[:-1].rfind(";") + 1 : -1]
-                    if ":" in key_source:
-                        key, source = key_source.split(":", 1)
-                        return_dict[key] = {
-                            "source": source,
-                            "note": note,
-                        }
-                    else:
-                        print(f"problem with data_provenance_item {item}")
-
-        else:
-            print(f"error loading dict_field: {field}")
-
-        return return_dict
-
     @classmethod
     def parse_records_dict(cls, *, records_dict: dict) -> dict:
         """Parse a records_dict from pybtex to colrev standard"""
 
-        def format_name(person: Person) -> str:
-            def join(name_list: list) -> str:
-                return " ".join([name for name in name_list if name])
-
-            first = person.get_part_as_text("first")
-            middle = person.get_part_as_text("middle")
-            prelast = person.get_part_as_text("prelast")
-            last = person.get_part_as_text("last")
-            lineage = person.get_part_as_text("lineage")
-            name_string = ""
-            if last:
-                name_string += join([prelast, last])
-            if lineage:
-                name_string += f", {lineage}"
-            if first or middle:
-                name_string += ", "
-                name_string += join([first, middle])
-            return name_string
-
         # Need to concatenate fields and persons dicts
         # but pybtex is still the most efficient solution.
         records_dict = {
@@ -328,25 +260,16 @@ class Dataset:
                 **{Fields.ENTRYTYPE: v.type},
                 **dict(
                     {
-                        # Cast status to Enum
-                        k: colrev.record.RecordState[v] if (Fields.STATUS == k)
-                        # DOIs are case insensitive -> use upper case.
-                        else v.upper() if (Fields.DOI == k)
-                        # Note : the following two lines are a temporary fix
-                        # to converg colrev_origins to list items
-                        else [el.rstrip().lstrip() for el in v.split(";") if "" != el]
-                        if k == Fields.ORIGIN
-                        else [el.rstrip() for el in (v + " ").split("; ") if "" != el]
-                        if k in colrev.record.Record.list_fields_keys
-                        else Dataset.__load_field_dict(value=v, field=k)
-                        if k in colrev.record.Record.dict_fields_keys
-                        else v
+                        k: colrev.records_parser.parse_field_value(key=k, value=v)
                         for k, v in v.fields.items()
                     }
                 ),
                 **dict(
                     {
-                        k: " and ".join(format_name(person) for person in persons)
+                        k: " and ".join(
+                            colrev.records_parser.format_name(person)
+                            for person in persons
+                        )
                         for k, persons in v.persons.items()
                     }
                 ),
@@ -373,7 +296,9 @@ class Dataset:
             if key == Fields.STATUS:
                 return key, colrev.record.RecordState[value]
             if key == Fields.MD_PROV:
-                return key, self.__load_field_dict(value=value, field=key)
+                return key, colrev.records_parser.load_field_dict(
+                    value=value, field=key
+                )
             if key == Fields.FILE:
                 return key, Path(value)
         except IndexError as exc:
@@ -387,7 +312,11 @@ class Dataset:
         # Note : more than 10x faster than the pybtex part of load_records_dict()
 
         # pylint: disable=consider-using-with
+        # pylint: disable=too-many-branches
         if file_object is None:
+            cached_header_items = self.records_cache.load_header_items()
+            if cached_header_items is not None:
+                return cached_header_items
             file_object = open(self.records_file, encoding="utf-8")
 
         # Fields required
@@ -448,6 +377,28 @@ class Dataset:
             for record_header_item in record_header_items
         ]
 
+    @classmethod
+    def parse_records_str(cls, *, load_str: str, fix_commas: bool = False) -> dict:
+        """Parse a records_dict from a bibtex string"""
+        # Note : the native parser covers the canonical format (written by
+        # parse_bibtex_str) in a single pass. Other files are parsed by pybtex.
+        try:
+            return {
+                record_dict[Fields.ID]: record_dict
+                for record_dict in colrev.records_parser.read_records(
+                    file_object=io.StringIO(load_str)
+                )
+            }
+        except colrev_exceptions.NonCanonicalFormatError:
+            pass
+
+        if fix_commas:
+            # Fix missing comma after fields
+            load_str = re.sub(r"(.)}\n", r"\g<1>},\n", load_str)
+        parser = bibtex.Parser()
+        bib_data = parser.parse_string(load_str)
+        return cls.parse_records_dict(records_dict=bib_data.entries)
+
     def load_records_dict(
         self,
         *,
@@ -474,6 +425,8 @@ class Dataset:
             raise colrev_exceptions.ReviewManagerNotNofiedError()
 
         pybtex.errors.set_strict_mode(False)
+        if not file_path and not load_str:
+            self.merge_decision_journal()
         if header_only:
             # Note : currently not parsing screening_criteria to settings.ScreeningCriterion
             # to optimize performance
@@ -487,19 +440,17 @@ class Dataset:
             with open(file_path, encoding="utf-8") as file:
                 load_str = file.read()
 
-        parser = bibtex.Parser()
         if load_str:
-            # Fix missing comma after fields
-            load_str = re.sub(r"(.)}\n", r"\g<1>},\n", load_str)
-            bib_data = parser.parse_string(load_str)
-            records_dict = self.parse_records_dict(records_dict=bib_data.entries)
-
-        elif self.records_file.is_file():
-            bib_data = parser.parse_file(str(self.records_file))
-            records_dict = self.parse_records_dict(records_dict=bib_data.entries)
-        else:
-            records_dict = {}
-
+            return self.parse_records_str(load_str=load_str, fix_commas=True)
+        if not self.records_file.is_file():
+            return {}
+
+        records_dict = self.records_cache.load_records_dict()
+        if records_dict is None:
+            stat = self.records_file.stat()
+            content = self.records_file.read_bytes()
+            records_dict = self.parse_records_str(load_str=content.decode("utf-8"))
+            self.records_cache.save(records=records_dict, content=content, stat=stat)
         return records_dict
 
     @classmethod
@@ -534,38 +485,10 @@ class Dataset:
             except colrev_exceptions.InvalidLanguageCodeException:
                 del record_dict[Fields.LANGUAGE]
 
-            field_order = [
-                Fields.ORIGIN,  # must be in second line
-                Fields.STATUS,
-                Fields.MD_PROV,
-                Fields.D_PROV,
-                Fields.PDF_ID,
-                Fields.SCREENING_CRITERIA,
-                Fields.FILE,  # Note : do not change this order (parsers rely on it)
-                Fields.PRESCREEN_EXCLUSION,
-                Fields.DOI,
-                Fields.GROBID_VERSION,
-                Fields.DBLP_KEY,
-                Fields.SEMANTIC_SCHOLAR_ID,
-                Fields.WEB_OF_SCIENCE_ID,
-                Fields.AUTHOR,
-                Fields.BOOKTITLE,
-                Fields.JOURNAL,
-                Fields.TITLE,
-                Fields.YEAR,
-                Fields.VOLUME,
-                Fields.NUMBER,
-                Fields.PAGES,
-                Fields.EDITOR,
-                Fields.PUBLISHER,
-                Fields.URL,
-                Fields.ABSTRACT,
-            ]
-
             record = colrev.record.Record(data=record_dict)
             record_dict = record.get_data(stringify=True)
 
-            for ordered_field in field_order:
+            for ordered_field in colrev.records_parser.FIELD_ORDER:
                 if ordered_field in record_dict:
                     if record_dict[ordered_field] == "":
                         continue
@@ -574,7 +497,10 @@ class Dataset:
                     )
 
             for key in sorted(record_dict.keys()):
-                if key in field_order + [Fields.ID, Fields.ENTRYTYPE]:
+                if key in colrev.records_parser.FIELD_ORDER + [
+                    Fields.ID,
+                    Fields.ENTRYTYPE,
+                ]:
                     continue
 
                 bibtex_str += format_field(key, record_dict[key])
@@ -592,6 +518,8 @@ class Dataset:
 
         bibtex_str = self.parse_bibtex_str(recs_dict_in=records)
 
+        if save_path == self.records_file:
+            self.records_cache.invalidate()
         with open(save_path, "w", encoding="utf-8") as out:
             out.write(bibtex_str + "\n")
 
@@ -602,11 +530,7 @@ class Dataset:
         else:
             self.add_changes(path=save_path)
 
-    def __save_record_list_by_id(
-        self, *, records: dict, append_new: bool = False
-    ) -> None:
-        # Note : currently no use case for append_new=True??
-
+    def __get_record_strings(self, *, records: dict) -> dict:
         parsed = self.parse_bibtex_str(recs_dict_in=records)
         record_list = [
             {
@@ -617,61 +541,104 @@ class Dataset:
         ]
         # Correct the first item
         record_list[0]["record"] = "@" + record_list[0]["record"][2:]
+        return {item[Fields.ID]: item["record"] for item in record_list}
 
-        current_id_str = "NOTSET"
-        if self.records_file.is_file():
-            with open(self.records_file, "r+b") as file:
-                seekpos = file.tell()
-                line = file.readline()
-                while line:
-                    if b"@" in line[:3]:
-                        current_id = line[line.find(b"{") + 1 : line.rfind(b",")]
-                        current_id_str = current_id.decode("utf-8")
-                    if current_id_str in [x[Fields.ID] for x in record_list]:
-                        replacement = [
-                            x["record"]
-                            for x in record_list
-                            if x[Fields.ID] == current_id_str
-                        ][0]
-                        record_list = [
-                            x for x in record_list if x[Fields.ID] != current_id_str
-                        ]
-                        line = file.readline()
-                        while (
-                            b"@" not in line[:3] and line
-                        ):  # replace: drop the current record
-                            line = file.readline()
-                        remaining = line + file.read()
-                        file.seek(seekpos)
-                        file.write(replacement.encode("utf-8"))
-                        seekpos = file.tell()
-                        file.flush()
-                        os.fsync(file)
-                        file.write(remaining)
-                        file.truncate()  # if the replacement is shorter...
-                        file.seek(seekpos)
-
-                    seekpos = file.tell()
-                    line = file.readline()
-
-        if len(record_list) > 0:
+    def __save_record_strings(
+        self, *, record_strings: dict, append_new: bool = False
+    ) -> None:
+        self.records_cache.invalidate()
+        # Note : replaces the records in-place (based on the records index)
+        remaining = self.records_index.replace_record_strings(
+            record_strings=record_strings
+        )
+        if remaining is not None:
+            record_strings = remaining
+        elif self.records_file.is_file():
+            # Note : replaces the records in a single pass (and replaces the file atomically)
+            record_strings = dict(record_strings)
+            temp_file = self.records_file.with_suffix(".bib.tmp")
+            with open(self.records_file, encoding="utf-8") as file, open(
+                temp_file, "w", encoding="utf-8"
+            ) as out:
+                replaced = False
+                for line in file:
+                    if "@" in line[:3]:
+                        current_id = line[line.find("{") + 1 : line.rfind(",")]
+                        replaced = current_id in record_strings
+                        if replaced:
+                            out.write(record_strings.pop(current_id))
+                    if not replaced:
+                        out.write(line)
+                out.flush()
+                os.fsync(out.fileno())
+            os.replace(temp_file, self.records_file)
+
+        if len(record_strings) > 0:
             if append_new:
                 with open(self.records_file, "a", encoding="utf8") as m_refs:
-                    for item in record_list:
-                        m_refs.write(item["record"])
+                    for record_string in record_strings.values():
+                        m_refs.write(record_string)
             else:
                 self.review_manager.report_logger.error(
-                    "records not written to file: "
-                    f"{[x[Fields.ID] for x in record_list]}"
+                    f"records not written to file: {list(record_strings)}"
                 )
 
         self.__add_record_changes()
 
+    def __save_record_list_by_id(
+        self, *, records: dict, append_new: bool = False
+    ) -> None:
+        # Note : currently no use case for append_new=True??
+        self.__save_record_strings(
+            record_strings=self.__get_record_strings(records=records),
+            append_new=append_new,
+        )
+
+    def journal_records(self, *, records: dict) -> None:
+        """Append records (e.g., screening decisions) to the decision journal
+
+        The journal is merged into the RECORDS_FILE in one pass
+        (before the records are loaded, saved, or committed).
+        """
+
+        record_strings = self.__get_record_strings(records=records)
+        self.decisions_file.parent.mkdir(exist_ok=True)
+        with open(self.decisions_file, "a", encoding="utf-8") as journal:
+            for record_id, record_string in record_strings.items():
+                journal.write(
+                    json.dumps({Fields.ID: record_id, "record": record_string}) + "\n"
+                )
+            journal.flush()
+            os.fsync(journal.fileno())
+
+    def merge_decision_journal(self) -> None:
+        """Merge the decision journal into the RECORDS_FILE
+
+        Note: journals that remain after a crash are replayed.
+        """
+
+        if not self.decisions_file.is_file():
+            return
+        record_strings = {}
+        with open(self.decisions_file, encoding="utf-8") as journal:
+            for line in journal:
+                try:
+                    item = json.loads(line)
+                except json.decoder.JSONDecodeError:
+                    # Note : incomplete line (e.g., after a crash)
+                    continue
+                # Note : later decisions replace earlier ones
+                record_strings[item[Fields.ID]] = item["record"]
+        if record_strings:
+            self.__save_record_strings(record_strings=record_strings)
+        self.decisions_file.unlink()
+
     def save_records_dict(
         self, *, records: dict, partial: bool = False, add_changes: bool = True
     ) -> None:
         """Save the records dict in RECORDS_FILE"""
 
+        self.merge_decision_journal()
         if partial:
             self.__save_record_list_by_id(records=records)
             return
@@ -679,12 +646,48 @@ class Dataset:
             records=records, save_path=self.records_file, add_changes=add_changes
         )
 
+    def __read_records_from_index(self, *, conditions: list) -> Optional[list]:
+        self.merge_decision_journal()
+        entries = self.records_index.load()
+        if entries is None:
+            return None
+        selected_ids = [
+            record_id
+            for record_id, (_, _, status) in entries.items()
+            if any(
+                str(value) == {Fields.ID: record_id, Fields.STATUS: status}[key]
+                for condition in conditions
+                for key, value in condition.items()
+            )
+        ]
+        record_strings = self.records_index.read_record_strings(
+            entries=entries, record_ids=selected_ids
+        )
+        try:
+            return list(
+                colrev.records_parser.read_records(
+                    file_object=io.StringIO("".join(record_strings))
+                )
+            )
+        except colrev_exceptions.NonCanonicalFormatError:
+            return None
+
     def read_next_record(
         self, *, conditions: Optional[list] = None
     ) -> typing.Iterator[dict]:
         """Read records (Iterator) based on condition"""
 
         # Note : matches conditions connected with 'OR'
+        if conditions and all(
+            key in [Fields.ID, Fields.STATUS]
+            for condition in conditions
+            for key in condition
+        ):
+            records_from_index = self.__read_records_from_index(conditions=conditions)
+            if records_from_index is not None:
+                yield from records_from_index
+                return
+
         record_dict = self.load_records_dict()
 
         records = []
@@ -772,14 +775,14 @@ class Dataset:
 
         self.review_manager.create_commit(msg="Reprocess", saved_args=saved_args)
 
-    def __generate_temp_id(
-        self, *, local_index: colrev.env.local_index.LocalIndex, record_dict: dict
-    ) -> str:
+    def __generate_temp_id(self, *, retrieved_records: dict, record_dict: dict) -> str:
         # pylint: disable=too-many-branches
 
         try:
-            retrieved_record = local_index.retrieve(record_dict=record_dict)
-            temp_id = retrieved_record[Fields.ID]
+            # Note : retrieved_records are retrieved from the LocalIndex (in one batch)
+            if record_dict[Fields.ID] not in retrieved_records:
+                raise colrev_exceptions.RecordNotInIndexException()
+            temp_id = retrieved_records[record_dict[Fields.ID]][Fields.ID]
 
             # Do not use IDs from local_index for curated_metadata repositories
             if "curated_metadata" in str(self.review_manager.path):
@@ -834,21 +837,13 @@ class Dataset:
         self,
         *,
         temp_id: str,
-        existing_ids: list,
+        existing_ids: typing.Union[list, colrev.id_allocator.IDAllocator],
     ) -> str:
         """Get the next unique ID"""
 
-        order = 0
-        letters = list(string.ascii_lowercase)
-        next_unique_id = temp_id
-        appends: list = []
-        while next_unique_id.lower() in [i.lower() for i in existing_ids]:
-            if len(appends) == 0:
-                order += 1
-                appends = list(itertools.product(letters, repeat=order))
-            next_unique_id = temp_id + "".join(list(appends.pop(0)))
-        temp_id = next_unique_id
-        return temp_id
+        if not isinstance(existing_ids, colrev.id_allocator.IDAllocator):
+            existing_ids = colrev.id_allocator.IDAllocator(existing_ids=existing_ids)
+        return existing_ids.generate_next_unique_id(temp_id=temp_id)
 
     def propagated_id(self, *, record_id: str) -> bool:
         """Check whether an ID is propagated (i.e., its record's status is beyond md_processed)"""
@@ -865,9 +860,9 @@ class Dataset:
     def __generate_id(
         self,
         *,
-        local_index: colrev.env.local_index.LocalIndex,
+        retrieved_records: dict,
         record_dict: dict,
-        existing_ids: Optional[list] = None,
+        id_allocator: Optional[colrev.id_allocator.IDAllocator] = None,
     ) -> str:
         """Generate a blacklist to avoid setting duplicate IDs"""
 
@@ -882,14 +877,11 @@ class Dataset:
         # (this would break the chain of evidence)
 
         temp_id = self.__generate_temp_id(
-            local_index=local_index, record_dict=record_dict
+            retrieved_records=retrieved_records, record_dict=record_dict
         )
 
-        if existing_ids:
-            temp_id = self.generate_next_unique_id(
-                temp_id=temp_id,
-                existing_ids=existing_ids,
-            )
+        if id_allocator:
+            temp_id = id_allocator.generate_next_unique_id(temp_id=temp_id)
 
         return temp_id
 
@@ -908,23 +900,35 @@ class Dataset:
         if len(records) == 0:
             records = self.load_records_dict()
 
-        id_list = list(records.keys())
+        id_allocator = colrev.id_allocator.IDAllocator(existing_ids=records.keys())
+
+        record_ids = [
+            record_id
+            for record_id, record_dict in records.items()
+            if (selected_ids is None or record_id in selected_ids)
+            and (
+                record_dict[Fields.STATUS]
+                in [
+                    colrev.record.RecordState.md_imported,
+                    colrev.record.RecordState.md_prepared,
+                ]
+                or self.review_manager.force_mode
+            )
+        ]
+        # Note : retrieve the records from the LocalIndex in one batch
+        # (selected records are retrieved with the temporary md_prepared status,
+        # as in the loop below)
+        records_to_retrieve = [deepcopy(records[record_id]) for record_id in record_ids]
+        if selected_ids:
+            for record_dict in records_to_retrieve:
+                colrev.record.Record(data=record_dict).set_status(
+                    target_state=colrev.record.RecordState.md_prepared
+                )
+        retrieved_records = local_index.retrieve_many(records=records_to_retrieve)
 
-        for record_id in tqdm(list(records.keys())):
+        for record_id in tqdm(record_ids):
             try:
                 record_dict = records[record_id]
-                if selected_ids is not None:
-                    if record_id not in selected_ids:
-                        continue
-                if (
-                    record_dict[Fields.STATUS]
-                    not in [
-                        colrev.record.RecordState.md_imported,
-                        colrev.record.RecordState.md_prepared,
-                    ]
-                    and not self.review_manager.force_mode
-                ):
-                    continue
                 old_id = record_id
 
                 temp_stat = record_dict[Fields.STATUS]
@@ -933,16 +937,22 @@ class Dataset:
                     record.set_status(
                         target_state=colrev.record.RecordState.md_prepared
                     )
-                new_id = self.__generate_id(
-                    local_index=local_index,
-                    record_dict=record_dict,
-                    existing_ids=[x for x in id_list if x != record_id],
-                )
+                # Note : the record's own ID is available for the record
+                id_allocator.remove(record_id=record_id)
+                try:
+                    new_id = self.__generate_id(
+                        retrieved_records=retrieved_records,
+                        record_dict=record_dict,
+                        id_allocator=id_allocator,
+                    )
+                except colrev_exceptions.PropagatedIDChange:
+                    id_allocator.add(record_id=record_id)
+                    raise
                 if selected_ids:
                     record = colrev.record.Record(data=record_dict)
                     record.set_status(target_state=temp_stat)
 
-                id_list.append(new_id)
+                id_allocator.add(record_id=new_id)
                 if old_id != new_id:
                     # We need to insert the a new element into records
                     # to make sure that the IDs are actually saved
@@ -952,8 +962,6 @@ class Dataset:
                     self.review_manager.report_logger.info(
                         f"set_ids({old_id}) to {new_id}"
                     )
-                    if old_id in id_list:
-                        id_list.remove(old_id)
             except colrev_exceptions.PropagatedIDChange as exc:
                 print(exc)
 
@@ -1078,6 +1086,9 @@ class Dataset:
             committer=committer,
             skip_hooks=hook_skipping,
         )
+        # Note : the history index is only maintained once it was created
+        if self.records_history.index_path.is_file():
+            self.records_history.update()
 
     def file_in_history(self, *, filepath: Path) -> bool:
         """Check whether a file is in the git history"""
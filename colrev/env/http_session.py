@@ -0,0 +1,245 @@
+#! /usr/bin/env python
+"""Shared HTTP session with per-host rate limits, retries, pooling and cache policies"""
+from __future__ import annotations
+
+import threading
+import time
+import typing
+from dataclasses import dataclass
+from datetime import datetime
+from datetime import timedelta
+from pathlib import Path
+from urllib.parse import urlparse
+
+import requests
+import requests_cache
+from requests.adapters import HTTPAdapter
+from requests_cache.backends.sqlite import SQLiteCache
+from urllib3.util.retry import Retry
+
+
+@dataclass(frozen=True)
+class HostLimit:
+    """Rate limit (token bucket) and concurrency limit of a host"""
+
+    requests_per_second: float
+    max_concurrency: int
+
+
+# Note : based on the (documented or polite) limits of the services
+HOST_LIMITS = {
+    "api.crossref.org": HostLimit(requests_per_second=10, max_concurrency=5),
+    "dblp.org": HostLimit(requests_per_second=2, max_concurrency=2),
+    "eutils.ncbi.nlm.nih.gov": HostLimit(requests_per_second=3, max_concurrency=3),
+    "api.semanticscholar.org": HostLimit(requests_per_second=1, max_concurrency=1),
+    "openlibrary.org": HostLimit(requests_per_second=2, max_concurrency=2),
+    "www.ebi.ac.uk": HostLimit(requests_per_second=10, max_concurrency=5),
+    "doi.org": HostLimit(requests_per_second=10, max_concurrency=10),
+}
+DEFAULT_HOST_LIMIT = HostLimit(requests_per_second=5, max_concurrency=5)
+
+# Note : cache expiration per URL pattern (first match, see requests_cache)
+# Metadata retrieved by identifiers (DOI, PMID, ISBN) changes rarely,
+# search results change frequently.
+METADATA_EXPIRE_AFTER = timedelta(days=180)
+SEARCH_EXPIRE_AFTER = timedelta(days=7)
+DEFAULT_EXPIRE_AFTER = timedelta(days=30)
+URLS_EXPIRE_AFTER = {
+    "api.crossref.org/works[?]": SEARCH_EXPIRE_AFTER,
+    "api.crossref.org/works/": METADATA_EXPIRE_AFTER,
+    "dx.doi.org/": METADATA_EXPIRE_AFTER,
+    "doi.org/": METADATA_EXPIRE_AFTER,
+    "www.doi.org/": METADATA_EXPIRE_AFTER,
+    "dblp.org/search/": SEARCH_EXPIRE_AFTER,
+    "eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi": METADATA_EXPIRE_AFTER,
+    "eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi": SEARCH_EXPIRE_AFTER,
+    "www.ebi.ac.uk/europepmc/webservices/rest/search": SEARCH_EXPIRE_AFTER,
+    "openlibrary.org/isbn/": METADATA_EXPIRE_AFTER,
+    "openlibrary.org/search.json": SEARCH_EXPIRE_AFTER,
+    "api.semanticscholar.org/v1/paper/": METADATA_EXPIRE_AFTER,
+}
+# Note : "not found" responses are cached (negative caching) for a shorter period
+NEGATIVE_EXPIRE_AFTER = timedelta(days=7)
+
+
+# pylint: disable=too-few-public-methods
+class TokenBucket:
+    """Thread-safe token bucket (blocks until a token is available)"""
+
+    def __init__(self, *, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.__tokens = capacity
+        self.__last = time.monotonic()
+        self.__lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Acquire a token"""
+        while True:
+            with self.__lock:
+                now = time.monotonic()
+                self.__tokens = min(
+                    self.capacity, self.__tokens + (now - self.__last) * self.rate
+                )
+                self.__last = now
+                if self.__tokens >= 1:
+                    self.__tokens -= 1
+                    return
+                wait = (1 - self.__tokens) / self.rate
+            time.sleep(wait)
+
+
+class HostLimiter:
+    """Limits the requests per second and the concurrent requests of a host"""
+
+    def __init__(self, *, host_limit: HostLimit) -> None:
+        self.__bucket = TokenBucket(
+            rate=host_limit.requests_per_second,
+            capacity=max(1.0, host_limit.requests_per_second),
+        )
+        self.__semaphore = threading.BoundedSemaphore(host_limit.max_concurrency)
+
+    def __enter__(self) -> HostLimiter:
+        self.__semaphore.acquire()  # pylint: disable=consider-using-with
+        self.__bucket.acquire()
+        return self
+
+    def __exit__(self, *args: typing.Any) -> None:
+        self.__semaphore.release()
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """HTTPAdapter applying the host limits to requests sent over the network
+
+    Responses served from the requests_cache do not reach the adapter.
+    """
+
+    __limiters: typing.Dict[str, HostLimiter] = {}
+    __lock = threading.Lock()
+
+    def __init__(self) -> None:
+        super().__init__(
+            pool_connections=20,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                raise_on_status=False,
+            ),
+        )
+
+    @classmethod
+    def get_host_limiter(cls, *, host: str) -> HostLimiter:
+        """Get the (shared) limiter of a host"""
+        with cls.__lock:
+            if host not in cls.__limiters:
+                cls.__limiters[host] = HostLimiter(
+                    host_limit=HOST_LIMITS.get(host, DEFAULT_HOST_LIMIT)
+                )
+            return cls.__limiters[host]
+
+    # pylint: disable=too-many-arguments
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: typing.Any = None,
+        verify: typing.Union[bool, str] = True,
+        cert: typing.Any = None,
+        proxies: typing.Optional[typing.Dict[str, str]] = None,
+    ) -> requests.Response:
+        host = str(urlparse(str(request.url)).hostname or "")
+        with self.get_host_limiter(host=host):
+            return super().send(
+                request,
+                stream=stream,
+                timeout=timeout,
+                verify=verify,
+                cert=cert,
+                proxies=proxies,
+            )
+
+
+class NegativeCachingSQLiteCache(SQLiteCache):
+    """SQLite cache storing "not found" (404) responses with a shorter expiration"""
+
+    def save_response(
+        self,
+        response: typing.Any,
+        cache_key: typing.Optional[str] = None,
+        expires: typing.Optional[datetime] = None,
+    ) -> None:
+        if response.status_code == 404:
+            # Note : requests_cache uses naive UTC datetimes
+            negative_expires = datetime.utcnow() + NEGATIVE_EXPIRE_AFTER
+            if expires is None or expires > negative_expires:
+                expires = negative_expires
+        super().save_response(response, cache_key=cache_key, expires=expires)  # type: ignore
+
+
+# pylint: disable=abstract-method
+class StatisticsCachedSession(requests_cache.CachedSession):
+    """CachedSession counting cache hits, misses and negative (404) hits"""
+
+    def __init__(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.__statistics = {"hits": 0, "misses": 0, "negative_hits": 0}
+        self.__statistics_lock = threading.Lock()
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        expire_after: typing.Any = None,
+        **kwargs: typing.Any,
+    ) -> typing.Any:
+        response = super().send(request, expire_after=expire_after, **kwargs)
+        with self.__statistics_lock:
+            if getattr(response, "from_cache", False):
+                self.__statistics["hits"] += 1
+                if response.status_code == 404:
+                    self.__statistics["negative_hits"] += 1
+            else:
+                self.__statistics["misses"] += 1
+        return response
+
+    def get_statistics(self) -> dict:
+        """Get the cache statistics (hits, misses, negative_hits, hit_rate)"""
+        with self.__statistics_lock:
+            statistics: dict = dict(self.__statistics)
+        total = statistics["hits"] + statistics["misses"]
+        statistics["hit_rate"] = statistics["hits"] / total if total else 0.0
+        return statistics
+
+
+# pylint: disable=too-few-public-methods
+class SharedSession:
+    """Cached session shared by all threads of the process
+
+    The cache (sqlite, WAL mode) applies the URLS_EXPIRE_AFTER policies
+    and stores "not found" responses (negative caching).
+    """
+
+    __sessions: typing.Dict[str, StatisticsCachedSession] = {}
+    __lock = threading.Lock()
+
+    @classmethod
+    def get(cls, *, cache_path: Path) -> StatisticsCachedSession:
+        """Get the shared session (created upon first use)"""
+        with cls.__lock:
+            if str(cache_path) not in cls.__sessions:
+                cache = NegativeCachingSQLiteCache(str(cache_path))
+                # Note : WAL mode allows concurrent reads while a thread writes
+                with cache.responses.connection(commit=True) as con:
+                    con.execute("PRAGMA journal_mode=WAL")
+                session = StatisticsCachedSession(
+                    backend=cache,
+                    expire_after=DEFAULT_EXPIRE_AFTER,
+                    urls_expire_after=URLS_EXPIRE_AFTER,
+                    allowable_codes=(200, 404),
+                )
+                adapter = RateLimitedAdapter()
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                cls.__sessions[str(cache_path)] = session
+            return cls.__sessions[str(cache_path)]
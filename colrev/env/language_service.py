@@ -2,7 +2,11 @@
 """Service to detect languages and handle language codes"""
 from __future__ import annotations
 
+import threading
+import typing
+
 import pycountry
+from lingua import LanguageDetector
 from lingua import LanguageDetectorBuilder
 
 import colrev.exceptions as colrev_exceptions
@@ -11,28 +15,49 @@ from colrev.constants import Fields
 
 
 class LanguageService:
-    """Service to detect languages and handle language codes"""
-
-    __eng_false_negatives = ["editorial", "introduction"]
+    """Service to detect languages and handle language codes
 
-    def __init__(self) -> None:
-        # Note : Lingua is tested/evaluated relative to other libraries:
-        # https://github.com/pemistahl/lingua-py
-        # It performs particularly well for short strings (single words/word pairs)
-        # The langdetect library is non-deterministic, especially for short strings
-        # https://pypi.org/project/langdetect/
-
-        self.__lingua_language_detector = (
-            LanguageDetectorBuilder.from_all_languages_with_latin_script().build()
-        )
+    The Lingua detector and the language-code mapping are created lazily
+    (upon first use) and shared by all LanguageService instances of the process.
+    """
 
-        # Language formats: ISO 639-1 standard language codes
-        # https://pypi.org/project/langcodes/
-        # https://github.com/flyingcircusio/pycountry
+    __eng_false_negatives = ["editorial", "introduction"]
 
-        self.__lang_code_mapping = {}
-        for country in pycountry.languages:
-            self.__lang_code_mapping[country.name.lower()] = country.alpha_3
+    # Note : frequent language codes (avoid loading the pycountry mapping)
+    __lang_code_shortcuts = {"en": "eng", "fr": "fra", "ar": "ara", "de": "deu"}
+
+    __lingua_language_detector: typing.Optional[LanguageDetector] = None
+    __lang_code_mapping: typing.Optional[dict] = None
+    __lock = threading.Lock()
+
+    @classmethod
+    def __get_lingua_language_detector(cls) -> LanguageDetector:
+        if cls.__lingua_language_detector is None:
+            with cls.__lock:
+                if cls.__lingua_language_detector is None:
+                    # Note : Lingua is tested/evaluated relative to other libraries:
+                    # https://github.com/pemistahl/lingua-py
+                    # It performs particularly well for short strings (single words/word pairs)
+                    # The langdetect library is non-deterministic, especially for short strings
+                    # https://pypi.org/project/langdetect/
+                    cls.__lingua_language_detector = (
+                        LanguageDetectorBuilder.from_all_languages_with_latin_script().build()
+                    )
+        return cls.__lingua_language_detector
+
+    @classmethod
+    def __get_lang_code_mapping(cls) -> dict:
+        if cls.__lang_code_mapping is None:
+            with cls.__lock:
+                if cls.__lang_code_mapping is None:
+                    # Language formats: ISO 639-1 standard language codes
+                    # https://pypi.org/project/langcodes/
+                    # https://github.com/flyingcircusio/pycountry
+                    cls.__lang_code_mapping = {
+                        country.name.lower(): country.alpha_3
+                        for country in pycountry.languages
+                    }
+        return cls.__lang_code_mapping
 
     def compute_language(self, *, text: str) -> str:
         """Compute the most likely language code"""
@@ -40,7 +65,7 @@ class LanguageService:
         if text.lower() in self.__eng_false_negatives:
             return "eng"
 
-        language = self.__lingua_language_detector.detect_language_of(text)
+        language = self.__get_lingua_language_detector().detect_language_of(text)
         if language:
             return language.iso_code_639_3.name.lower()
         return ""
@@ -52,7 +77,7 @@ class LanguageService:
             return [("eng", 1.0)]
 
         predictions = (
-            self.__lingua_language_detector.compute_language_confidence_values(
+            self.__get_lingua_language_detector().compute_language_confidence_values(
                 text=text
             )
         )
@@ -83,23 +108,12 @@ class LanguageService:
         if Fields.LANGUAGE not in record.data:
             return
 
-        if record.data[Fields.LANGUAGE].lower() in ["en"]:
-            record.data[Fields.LANGUAGE] = "eng"
-
-        elif record.data[Fields.LANGUAGE].lower() in ["fr"]:
-            record.data[Fields.LANGUAGE] = "fra"
-
-        elif record.data[Fields.LANGUAGE].lower() in ["ar"]:
-            record.data[Fields.LANGUAGE] = "ara"
-
-        elif record.data[Fields.LANGUAGE].lower() in ["de"]:
-            record.data[Fields.LANGUAGE] = "deu"
-
-        if len(record.data[Fields.LANGUAGE]) != 3:
-            if record.data[Fields.LANGUAGE].lower() in self.__lang_code_mapping:
-                record.data[Fields.LANGUAGE] = self.__lang_code_mapping[
-                    record.data[Fields.LANGUAGE].lower()
-                ]
+        language = record.data[Fields.LANGUAGE]
+        if language.lower() in self.__lang_code_shortcuts:
+            language = self.__lang_code_shortcuts[language.lower()]
+        elif len(language) != 3:
+            language = self.__get_lang_code_mapping().get(language.lower(), language)
+        record.data[Fields.LANGUAGE] = language
 
         self.validate_iso_639_3_language_codes(
             lang_code_list=[record.data[Fields.LANGUAGE]]
@@ -7,7 +7,9 @@ import hashlib
 import json
 import os
 import sqlite3
+import threading
 import typing
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
 from datetime import timedelta
 from multiprocessing import Lock
@@ -61,7 +63,13 @@ class LocalIndex:
 
     __sqlite_available = True
 
-    sqlite_connection = None
+    # Note : sqlite connections are pooled per thread (and per SQLITE_PATH).
+    # The generation of a path is incremented when the database is reinitialized
+    # (connections of other threads are reopened upon their next use).
+    __thread_local_connections = threading.local()
+    __connection_generations: typing.Dict[str, int] = {}
+    __secondary_indexes_checked: typing.Set[str] = set()
+    __connection_lock = threading.Lock()
 
     # Note : records are indexed by id = hash(colrev_id)
     # to ensure that the indexing-ids do not exceed limits
@@ -71,6 +79,8 @@ class LocalIndex:
 
     RECORD_INDEX = "record_index"
     TOC_INDEX = "toc_index"
+    # Note : the repo_index stores the HEAD commits of the indexed repositories
+    REPO_INDEX = "repo_index"
     UPDATE_LAYERD_FIELDS_QUERY = """
             UPDATE record_index SET
             layered_fields=?
@@ -99,6 +109,19 @@ class LocalIndex:
         (RECORD_INDEX, Fields.URL): "SELECT * FROM record_index WHERE url=?",
     }
 
+    # Note : columns of the global_keys (secondary indexes of the record_index)
+    GLOBAL_KEY_COLUMNS = [
+        Fields.DOI,
+        "dblp_key",
+        "colrev_pdf_id",
+        Fields.URL,
+        "colrev_id",
+    ]
+
+    # Note : number of values per IN-list of the prefetch queries
+    # (below the SQLITE_MAX_VARIABLE_NUMBER of older sqlite versions)
+    PREFETCH_CHUNK_SIZE = 500
+
     # AUTHOR_INDEX = "author_index"
     # AUTHOR_RECORD_INDEX = "author_record_index"
     # CITATIONS_INDEX = "citations_index"
@@ -116,7 +139,9 @@ class LocalIndex:
         Fields.DOI,
         "dblp_key",  # Note : no dots in key names
         "colrev_pdf_id",
-        "bibtex",
+        # Note : the record (parsed, as json) and its precomputed colrev_id
+        # are loaded directly (without parsing bibtex upon retrieval)
+        "record",
         "layered_fields"
         # "curation_ID"
     ]
@@ -134,14 +159,84 @@ class LocalIndex:
         self.__index_tei = index_tei
 
         self.thread_lock = Lock()
+        # Note : rows of the record_index loaded by prefetch(), {(key, value): row}
+        # (None: not in the index). Reset when the index is modified.
+        self.__row_cache: typing.Dict[
+            typing.Tuple[str, str], typing.Optional[dict]
+        ] = {}
+
+    def __connect(self, *, sqlite_path: str) -> sqlite3.Connection:
+        connection = sqlite3.connect(sqlite_path, timeout=90)
+        connection.row_factory = self.__dict_factory
+        # Note : WAL allows concurrent readers (threads) while a single writer is active
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        # Note : memory-mapped reads share the OS page cache across connections
+        connection.execute("PRAGMA mmap_size=268435456")
+        connection.execute("PRAGMA cache_size=-32000")
+        return connection
+
+    def __get_sqlite_connection(self) -> sqlite3.Connection:
+        sqlite_path = str(self.SQLITE_PATH)
+        generation = self.__connection_generations.get(sqlite_path, 0)
+        connections = getattr(self.__thread_local_connections, "connections", None)
+        if connections is None:
+            connections = {}
+            self.__thread_local_connections.connections = connections
+
+        if sqlite_path in connections:
+            pooled_generation, connection = connections[sqlite_path]
+            if pooled_generation == generation:
+                return connection
+            connection.close()
+
+        connection = self.__connect(sqlite_path=sqlite_path)
+        connections[sqlite_path] = (generation, connection)
+        self.__create_secondary_indexes(sqlite_path=sqlite_path, connection=connection)
+        return connection
 
     def __get_sqlite_cursor(self, *, init: bool = False) -> sqlite3.Cursor:
         if init:
-            Path(self.SQLITE_PATH).unlink(missing_ok=True)
+            sqlite_path = str(self.SQLITE_PATH)
+            with self.__connection_lock:
+                self.__connection_generations[sqlite_path] = (
+                    self.__connection_generations.get(sqlite_path, 0) + 1
+                )
+                self.__secondary_indexes_checked.discard(sqlite_path)
+            connections = getattr(self.__thread_local_connections, "connections", {})
+            if sqlite_path in connections:
+                connections.pop(sqlite_path)[1].close()
+            for suffix in ["", "-wal", "-shm"]:
+                Path(sqlite_path + suffix).unlink(missing_ok=True)
 
-        self.sqlite_connection = sqlite3.connect(self.SQLITE_PATH, timeout=90)
-        self.sqlite_connection.row_factory = self.__dict_factory
-        return self.sqlite_connection.cursor()
+        return self.__get_sqlite_connection().cursor()
+
+    def __create_secondary_indexes(
+        self, *, sqlite_path: str, connection: sqlite3.Connection
+    ) -> None:
+        """Create the indexes for lookups based on global_keys
+        (if the database was created without them)"""
+        if sqlite_path in self.__secondary_indexes_checked:
+            return
+        with self.__connection_lock:
+            if sqlite_path in self.__secondary_indexes_checked:
+                return
+            try:
+                table_exists = connection.execute(
+                    "SELECT name FROM sqlite_master WHERE type='table' AND name=?",
+                    (self.RECORD_INDEX,),
+                ).fetchone()
+                if table_exists:
+                    for column in self.GLOBAL_KEY_COLUMNS:
+                        connection.execute(
+                            f"CREATE INDEX IF NOT EXISTS {self.RECORD_INDEX}_{column} "
+                            f"ON {self.RECORD_INDEX}({column})"
+                        )
+                    connection.commit()
+                self.__secondary_indexes_checked.add(sqlite_path)
+            except sqlite3.OperationalError:  # pragma: no cover
+                # e.g., read-only databases
+                pass
 
     def load_journal_rankings(self) -> None:
         """Loads journal rankings into sqlite database"""
@@ -170,7 +265,8 @@ class LocalIndex:
         rankings = cur.fetchall()
         return rankings
 
-    def __dict_factory(self, cursor: sqlite3.Cursor, row: dict) -> dict:
+    @staticmethod
+    def __dict_factory(cursor: sqlite3.Cursor, row: tuple) -> dict:
         ret_dict = {}
         for idx, col in enumerate(cursor.description):
             ret_dict[col[0]] = row[idx]
@@ -266,6 +362,12 @@ class LocalIndex:
             if curated_field not in record_dict:
                 continue
             source = record_dict[Fields.D_PROV][curated_field]["source"]
+            # Note : replace the layered field when a repository is re-indexed
+            layered_fields = [
+                x
+                for x in layered_fields
+                if x["key"] != curated_field or x["source"] != source
+            ]
             layered_fields.append(
                 {
                     "key": curated_field,
@@ -334,37 +436,105 @@ class LocalIndex:
 
         return fields_to_remove
 
-    def __add_index_toc(self, *, toc_to_index: dict) -> None:
+    def __add_index_toc(self, *, toc_to_index: dict, upsert: bool = False) -> None:
         list_to_add = list((k, v) for k, v in toc_to_index.items() if v != "DROPPED")
-        if not self.sqlite_connection:
-            return
-        cur = self.sqlite_connection.cursor()
+        sqlite_connection = self.__get_sqlite_connection()
+        cur = sqlite_connection.cursor()
+        self.thread_lock.acquire(timeout=60)
         try:
-            cur.executemany(f"INSERT INTO {self.TOC_INDEX} VALUES(?, ?)", list_to_add)
+            if upsert:
+                list_to_drop = [(k,) for k, v in toc_to_index.items() if v == "DROPPED"]
+                cur.executemany(
+                    f"DELETE FROM {self.TOC_INDEX} WHERE toc_key=?", list_to_drop
+                )
+                cur.executemany(
+                    f"INSERT OR REPLACE INTO {self.TOC_INDEX} VALUES(?, ?)",
+                    list_to_add,
+                )
+            else:
+                cur.executemany(
+                    f"INSERT INTO {self.TOC_INDEX} VALUES(?, ?)", list_to_add
+                )
         except sqlite3.IntegrityError as exc:
             if self.verbose_mode:
                 print(exc)
         finally:
-            if self.sqlite_connection:
-                self.sqlite_connection.commit()
+            sqlite_connection.commit()
+            self.thread_lock.release()
 
-    def __add_index_records(self, *, recs_to_index: list, curated_fields: list) -> None:
+    def __get_upsert_records_query(self) -> str:
+        # Note : records (ids) that are indexed from another repository are not updated
+        # (like the records that are not inserted in the non-incremental mode)
+        columns_to_update = [
+            k for k in self.RECORDS_INDEX_KEYS if k not in ["id", "layered_fields"]
+        ]
+        return (
+            f"INSERT INTO {self.RECORD_INDEX} "
+            f"VALUES(:{', :'.join(self.RECORDS_INDEX_KEYS)}) "
+            "ON CONFLICT(id) DO UPDATE SET "
+            + ", ".join(f"{k}=excluded.{k}" for k in columns_to_update)
+            + f" WHERE json_extract({self.RECORD_INDEX}.record, "
+            "'$.metadata_source_repository_paths') = "
+            "json_extract(excluded.record, '$.metadata_source_repository_paths')"
+        )
+
+    def __add_index_records(
+        self, *, recs_to_index: list, curated_fields: list, upsert: bool = False
+    ) -> None:
         list_to_add = [
             {k: v for k, v in el.items() if k in self.RECORDS_INDEX_KEYS}
             for el in recs_to_index
         ]
+        for item in list_to_add:
+            for records_index_required_key in self.RECORDS_INDEX_KEYS:
+                if records_index_required_key not in item:
+                    item[records_index_required_key] = ""
+            if item["id"] == "":
+                print("NO ID IN RECORD")
+        list_to_add = [item for item in list_to_add if item["id"] != ""]
+
+        self.__row_cache = {}
+        sqlite_connection = self.__get_sqlite_connection()
+        cur = sqlite_connection.cursor()
+        self.thread_lock.acquire(timeout=60)
+        try:
+            if not curated_fields:
+                # Note : records that are already indexed are skipped (or updated)
+                query = (
+                    self.__get_upsert_records_query()
+                    if upsert
+                    else f"INSERT OR IGNORE INTO {self.RECORD_INDEX} "
+                    f"VALUES(:{', :'.join(self.RECORDS_INDEX_KEYS)})"
+                )
+                cur.executemany(query, list_to_add)
+                return
 
-        if not self.sqlite_connection:
-            return
-        cur = self.sqlite_connection.cursor()
+            self.__add_curated_index_records(
+                cur=cur,
+                list_to_add=list_to_add,
+                curated_fields=curated_fields,
+                upsert=upsert,
+            )
+        finally:
+            sqlite_connection.commit()
+            self.thread_lock.release()
+
+    def __add_curated_index_records(
+        self,
+        *,
+        cur: sqlite3.Cursor,
+        list_to_add: list,
+        curated_fields: list,
+        upsert: bool,
+    ) -> None:
         for item in list_to_add:
+            if upsert:
+                # Note : records indexed from this repository are updated,
+                # records indexed from other repositories are amended below
+                cur.execute(self.__get_upsert_records_query(), item)
+                if cur.rowcount == 1:
+                    continue
             while True:
-                for records_index_required_key in self.RECORDS_INDEX_KEYS:
-                    if records_index_required_key not in item:
-                        item[records_index_required_key] = ""
-                if item["id"] == "":
-                    print("NO ID IN RECORD")
-                    break
                 try:
                     cur.execute(
                         f"INSERT INTO {self.RECORD_INDEX} "
@@ -373,8 +543,6 @@ class LocalIndex:
                     )
                     break
                 except sqlite3.IntegrityError:
-                    if not curated_fields:
-                        break
                     try:
                         stored_record = self.__get_item_from_index(
                             index_name=self.RECORD_INDEX,
@@ -413,14 +581,37 @@ class LocalIndex:
                     except colrev_exceptions.RecordNotInIndexException:
                         break
 
-        if self.sqlite_connection:
-            self.sqlite_connection.commit()
+    @classmethod
+    def __serialize_record(cls, *, record_dict: dict) -> str:
+        # Note : parsing the bibtex (once, when indexing) ensures that the stored
+        # record is identical to the one that was retrieved from the bibtex field.
+        bibtex_str = colrev.dataset.Dataset.parse_bibtex_str(
+            recs_dict_in={record_dict[Fields.ID]: record_dict}
+        )
+        parsed_record = list(
+            colrev.dataset.Dataset.parse_records_str(load_str=bibtex_str).values()
+        )[0]
+        if Fields.STATUS in parsed_record:
+            # pylint: disable=colrev-direct-status-assign
+            parsed_record[Fields.STATUS] = parsed_record[Fields.STATUS].name
+        return json.dumps(parsed_record)
 
     def __get_record_from_row(self, *, row: dict) -> dict:
-        parser = bibtex.Parser()
-        bib_data = parser.parse_string(row["bibtex"])
-        ret = colrev.dataset.Dataset.parse_records_dict(records_dict=bib_data.entries)
-        retrieved_record = list(ret.values())[0]
+        if "record" in row:
+            retrieved_record = json.loads(row["record"])
+            if Fields.STATUS in retrieved_record:
+                # pylint: disable=colrev-direct-status-assign
+                retrieved_record[Fields.STATUS] = colrev.record.RecordState[
+                    retrieved_record[Fields.STATUS]
+                ]
+        else:
+            # Note : databases indexed before the record column was introduced
+            parser = bibtex.Parser()
+            bib_data = parser.parse_string(row["bibtex"])
+            ret = colrev.dataset.Dataset.parse_records_dict(
+                records_dict=bib_data.entries
+            )
+            retrieved_record = list(ret.values())[0]
 
         # append layered fields
         if row["layered_fields"]:
@@ -487,28 +678,120 @@ class LocalIndex:
         ret[record_id]["curation_ID"] = record_dict["curation_ID"]
         return ret[record_id]
 
-    def __retrieve_from_record_index(self, *, record_dict: dict) -> dict:
-        # Note : may raise NotEnoughDataToIdentifyException
-
-        record = colrev.record.Record(data=record_dict)
-
+    def __retrieve_from_record_index(
+        self, *, record_dict: dict, cids_to_retrieve: list
+    ) -> dict:
         if not self.__sqlite_available:
             if record_dict.get("curation_ID", "NA").startswith("https://github.com/"):
                 return self._retrieve_from_github_curation(record_dict=record_dict)
             raise colrev_exceptions.RecordNotInIndexException
 
-        if Fields.COLREV_ID in record.data:
-            cid_to_retrieve = record.get_colrev_id()
-        else:
-            cid_to_retrieve = [record.create_colrev_id(assume_complete=True)]
-
         retrieved_record = self.__retrieve_based_on_colrev_id(
-            cids_to_retrieve=cid_to_retrieve
+            cids_to_retrieve=cids_to_retrieve
         )
         if retrieved_record[Fields.ENTRYTYPE] != record_dict[Fields.ENTRYTYPE]:
             raise colrev_exceptions.RecordNotInIndexException
         return retrieved_record
 
+    def __get_lookups(
+        self, *, record_dict: dict
+    ) -> typing.Tuple[list, typing.Optional[typing.Tuple[str, typing.Any]]]:
+        """Get the colrev_ids (1. record index) and the global key (2. key, value)
+        that are used to retrieve the record (without modifying the record_dict)"""
+
+        record = colrev.record.Record(data=record_dict)
+        try:
+            if Fields.COLREV_ID in record.data:
+                cids_to_retrieve = record.get_colrev_id()
+            else:
+                cids_to_retrieve = [record.create_colrev_id(assume_complete=True)]
+        except colrev_exceptions.NotEnoughDataToIdentifyException:
+            cids_to_retrieve = []
+
+        # Note : only the first global key of the record is used
+        for key, value in record_dict.items():
+            if key in self.global_keys:
+                return cids_to_retrieve, (key, value)
+        try:
+            return cids_to_retrieve, (Fields.COLREV_ID, record.create_colrev_id())
+        except colrev_exceptions.NotEnoughDataToIdentifyException:
+            return cids_to_retrieve, None
+
+    def __retrieve_based_on_lookups(
+        self,
+        *,
+        record_dict: dict,
+        cids_to_retrieve: list,
+        global_key: typing.Optional[typing.Tuple[str, typing.Any]],
+    ) -> dict:
+        # 1. Try the record index
+        try:
+            return self.__retrieve_from_record_index(
+                record_dict=record_dict, cids_to_retrieve=cids_to_retrieve
+            )
+        except colrev_exceptions.RecordNotInIndexException as exc:
+            if self.verbose_mode:
+                print(exc)
+                print(f"{record_dict['ID']} - no exact match")
+
+        # 2. Try using global-ids
+        if self.__sqlite_available and global_key is not None:
+            key, value = global_key
+            retrieved_record_dict = self.__get_item_from_index(
+                index_name=self.RECORD_INDEX, key=key, value=value
+            )
+            if key in retrieved_record_dict:
+                if retrieved_record_dict[key] == value:
+                    return retrieved_record_dict
+
+        raise colrev_exceptions.RecordNotInIndexException(
+            record_dict.get(Fields.ID, "no-key")
+        )
+
+    def __prefetch(self, *, lookups: list) -> None:
+        """Load the rows of the record_index for the lookups (set-based queries)"""
+
+        if not self.__sqlite_available:
+            return
+
+        values_by_key: typing.Dict[str, set] = collections.defaultdict(set)
+        for cids_to_retrieve, global_key in lookups:
+            values_by_key[Fields.COLREV_ID].update(cids_to_retrieve)
+            if global_key is not None and isinstance(global_key[1], str):
+                values_by_key[global_key[0]].add(global_key[1])
+
+        row_cache: typing.Dict[typing.Tuple[str, str], typing.Optional[dict]] = {}
+        try:
+            cur = self.__get_sqlite_cursor()
+            for key, values in values_by_key.items():
+                column = self.GLOBAL_KEY_COLUMNS[self.global_keys.index(key)]
+                values_list = sorted(values)
+                for i in range(0, len(values_list), self.PREFETCH_CHUNK_SIZE):
+                    chunk = values_list[i : i + self.PREFETCH_CHUNK_SIZE]
+                    cur.execute(
+                        f"SELECT * FROM {self.RECORD_INDEX} "
+                        f"WHERE {column} IN ({','.join('?' * len(chunk))}) "
+                        f"ORDER BY {column}, rowid",
+                        chunk,
+                    )
+                    # Note : like fetchone() in __get_item_from_index,
+                    # the first row (lowest rowid) is used
+                    for row in cur.fetchall():
+                        row_cache.setdefault((key, row[column]), row)
+                # Note : values that are not in the index are cached as None
+                for value in values_list:
+                    row_cache.setdefault((key, value), None)
+        except sqlite3.OperationalError:
+            return
+
+        self.__row_cache = row_cache
+
+    def prefetch(self, *, records: typing.Iterable[dict]) -> None:
+        """Prefetch the index data required to retrieve the records
+        (subsequent calls of retrieve() do not query the index for these records)"""
+
+        self.__prefetch(lookups=[self.__get_lookups(record_dict=r) for r in records])
+
     def __prepare_record_for_return(
         self,
         *,
@@ -575,7 +858,6 @@ class LocalIndex:
 
         records_to_return = []
         try:
-            self.thread_lock.acquire(timeout=60)
             cur = self.__get_sqlite_cursor()
             selected_row = None
             print(f"{self.SELECT_ALL_QUERIES[self.RECORD_INDEX] } {query}")
@@ -591,8 +873,6 @@ class LocalIndex:
                 records_to_return.append(colrev.record.Record(data=retrieved_record))
         except sqlite3.OperationalError as exc:
             print(exc)
-        finally:
-            self.thread_lock.release()
 
         return records_to_return
 
@@ -795,7 +1075,7 @@ class LocalIndex:
                 toc_to_index[toc_item] = colrev_id
 
     # pylint: disable=too-many-arguments
-    def index_records(
+    def _prepare_index_records(
         self,
         *,
         records: dict,
@@ -803,14 +1083,22 @@ class LocalIndex:
         curation_url: str,
         curated_masterdata: bool,
         curated_fields: list,
-    ) -> None:
-        """Index a CoLRev project"""
+        record_ids_to_index: typing.Optional[set] = None,
+    ) -> typing.Tuple[list, dict]:
+        """Prepare the records (and tocs) of a CoLRev project for indexing
+        (record_ids_to_index: only prepare the selected records, all are used for the tocs)
+        """
 
         recs_to_index = []
         toc_to_index: typing.Dict[str, str] = {}
         for record_dict in tqdm(records.values()):
             copy_for_toc_index = deepcopy(record_dict)
             try:
+                if (
+                    record_ids_to_index is not None
+                    and record_dict[Fields.ID] not in record_ids_to_index
+                ):
+                    continue
                 # Add metadata_source_repository_paths : list of repositories from which
                 # the record was integrated. Important for is_duplicate(...)
                 record_dict.update(
@@ -825,14 +1113,12 @@ class LocalIndex:
                 if curated_masterdata:
                     record_dict[Fields.MD_PROV] = f"CURATED:{curation_url};;"
 
-                # Set absolute file paths and set bibtex field (for simpler retrieval)
+                # Set absolute file paths and set record field (for simpler retrieval)
                 if Fields.FILE in record_dict:
                     record_dict.update(
                         file=repo_source_path / Path(record_dict[Fields.FILE])
                     )
-                record_dict["bibtex"] = colrev.dataset.Dataset.parse_bibtex_str(
-                    recs_dict_in={record_dict[Fields.ID]: record_dict}
-                )
+                record_dict["record"] = self.__serialize_record(record_dict=record_dict)
                 record_dict = self.__get_index_record(record_dict=record_dict)
                 recs_to_index.append(record_dict)
 
@@ -850,8 +1136,34 @@ class LocalIndex:
                     copy_for_toc_index=copy_for_toc_index,
                     curated_masterdata=curated_masterdata,
                 )
-        # Select fields and insert into index (sqlite)
         self.__index_tei_document(recs_to_index=recs_to_index)
+        # Select fields (for the insert into the index)
+        recs_to_index = [
+            {k: v for k, v in el.items() if k in self.RECORDS_INDEX_KEYS}
+            for el in recs_to_index
+        ]
+        return recs_to_index, toc_to_index
+
+    # pylint: disable=too-many-arguments
+    def index_records(
+        self,
+        *,
+        records: dict,
+        repo_source_path: Path,
+        curation_url: str,
+        curated_masterdata: bool,
+        curated_fields: list,
+    ) -> None:
+        """Index a CoLRev project"""
+
+        recs_to_index, toc_to_index = self._prepare_index_records(
+            records=records,
+            repo_source_path=repo_source_path,
+            curation_url=curation_url,
+            curated_masterdata=curated_masterdata,
+            curated_fields=curated_fields,
+        )
+        # Insert into index (sqlite)
         self.__add_index_records(
             recs_to_index=recs_to_index, curated_fields=curated_fields
         )
@@ -879,6 +1191,7 @@ class LocalIndex:
         print(f"Reinitialize {self.RECORD_INDEX} and {self.TOC_INDEX}")
         # Note : the tei-directory should be removed manually.
 
+        self.__row_cache = {}
         cur = self.__get_sqlite_cursor(init=True)
         cur.execute(f"drop table if exists {self.RECORD_INDEX}")
         cur.execute(
@@ -890,19 +1203,84 @@ class LocalIndex:
         cur.execute(
             f"CREATE TABLE {self.TOC_INDEX}(toc_key TEXT PRIMARY KEY, colrev_ids)"
         )
-        if self.sqlite_connection:
-            self.sqlite_connection.commit()
+        # Note : secondary indexes for the lookups in SELECT_KEY_QUERIES
+        for column in self.GLOBAL_KEY_COLUMNS:
+            cur.execute(
+                f"CREATE INDEX {self.RECORD_INDEX}_{column} "
+                f"ON {self.RECORD_INDEX}({column})"
+            )
+        cur.execute(f"drop table if exists {self.REPO_INDEX}")
+        cur.connection.commit()
+        self.__create_repo_index()
+
+    def __create_repo_index(self) -> None:
+        cur = self.__get_sqlite_cursor()
+        cur.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.REPO_INDEX}"
+            "(repo_source_path TEXT PRIMARY KEY, head_commit TEXT)"
+        )
+        cur.connection.commit()
+
+    def __record_index_exists(self) -> bool:
+        """Check whether the record_index exists (with the record column)"""
+        cur = self.__get_sqlite_cursor()
+        # Note : databases created before the record column was introduced
+        # have a bibtex column and must be reinitialized
+        cur.execute(f"PRAGMA table_info({self.RECORD_INDEX})")
+        return "record" in [row["name"] for row in cur.fetchall()]
+
+    def __get_indexed_commits(self) -> dict:
+        """Get the HEAD commits of the indexed repositories"""
+        try:
+            cur = self.__get_sqlite_cursor()
+            cur.execute(f"SELECT * FROM {self.REPO_INDEX}")
+            return {row["repo_source_path"]: row["head_commit"] for row in cur}
+        except sqlite3.OperationalError:
+            return {}
+
+    def __load_indexed_records(
+        self,
+        *,
+        review_manager: colrev.review_manager.ReviewManager,
+        indexed_commit: str,
+    ) -> typing.Optional[dict]:
+        """Load the records of the indexed commit
+        (None if all records should be indexed)"""
+        git_repo = review_manager.dataset.get_repo()
+        try:
+            changed_files = git_repo.git.diff(
+                "--name-only", indexed_commit, "HEAD"
+            ).splitlines()
+            # Note : the settings determine the curated fields/masterdata
+            if review_manager.SETTINGS_RELATIVE.as_posix() in changed_files:
+                return None
+            indexed_records = colrev.dataset.Dataset.parse_records_str(
+                load_str=git_repo.git.show(
+                    f"{indexed_commit}:"
+                    f"{review_manager.dataset.RECORDS_FILE_RELATIVE.as_posix()}"
+                )
+            )
+        except GitCommandError:
+            return None
+        return indexed_records
+
+    def _prepare_colrev_project(
+        self, *, repo_source_path: Path, indexed_commit: str = ""
+    ) -> typing.Optional[dict]:
+        """Prepare a CoLRev project for indexing
+        (None if the project does not need to be indexed)"""
+
+        # pylint: disable=import-outside-toplevel
+        # pylint: disable=redefined-outer-name
+        # pylint: disable=cyclic-import
+        # pylint: disable=too-many-locals
+        import colrev.review_manager
 
-    def index_colrev_project(
-        self, *, repo_source_path: Path
-    ) -> None:  # pragma: no cover
-        """Index a CoLRev project"""
         try:
             if not Path(repo_source_path).is_dir():
                 print(f"Warning {repo_source_path} not a directory")
-                return
+                return None
 
-            print(f"Index records from {repo_source_path}")
             os.chdir(repo_source_path)
             review_manager = colrev.review_manager.ReviewManager(
                 path_str=str(repo_source_path)
@@ -918,8 +1296,33 @@ class LocalIndex:
                 )
 
             if not check_operation.review_manager.dataset.records_file.is_file():
-                return
+                return None
+
+            head_commit = review_manager.dataset.get_last_commit_sha()
+            if indexed_commit == head_commit:
+                print(f"Skip {repo_source_path} (unchanged)")
+                return None
+            print(f"Index records from {repo_source_path}")
+
             records = check_operation.review_manager.dataset.load_records_dict()
+            indexed_records = None
+            if indexed_commit:
+                indexed_records = self.__load_indexed_records(
+                    review_manager=review_manager, indexed_commit=indexed_commit
+                )
+            # Note : records that changed (or were removed) since the indexed commit
+            record_ids_to_index, outdated_records = None, {}
+            if indexed_records is not None:
+                record_ids_to_index = {
+                    record_id
+                    for record_id, record_dict in records.items()
+                    if indexed_records.get(record_id, {}) != record_dict
+                }
+                outdated_records = {
+                    record_id: record_dict
+                    for record_id, record_dict in indexed_records.items()
+                    if records.get(record_id, {}) != record_dict
+                }
 
             curation_endpoints = [
                 x
@@ -944,19 +1347,111 @@ class LocalIndex:
                 check_operation.review_manager.settings.is_curated_masterdata_repo()
             )
 
-            self.index_records(
+            recs_to_index, toc_to_index = self._prepare_index_records(
                 records=records,
                 repo_source_path=repo_source_path,
                 curated_fields=curated_fields,
                 curation_url=curation_url,
                 curated_masterdata=curated_masterdata,
+                record_ids_to_index=record_ids_to_index,
             )
+            outdated_recs, _ = self._prepare_index_records(
+                records=outdated_records,
+                repo_source_path=repo_source_path,
+                curated_fields=curated_fields,
+                curation_url=curation_url,
+                curated_masterdata=curated_masterdata,
+            )
+            ids_to_remove = {x["id"] for x in outdated_recs} - {
+                x["id"] for x in recs_to_index
+            }
 
         except colrev_exceptions.CoLRevException as exc:
             print(exc)
+            return None
+
+        return {
+            "repo_source_path": str(repo_source_path),
+            "head_commit": head_commit,
+            "ids_to_remove": list(ids_to_remove),
+            "recs_to_index": recs_to_index,
+            "toc_to_index": toc_to_index,
+            "curated_fields": curated_fields,
+            "curated_masterdata": curated_masterdata,
+        }
+
+    @staticmethod
+    def _prepare_colrev_project_in_process(
+        args: typing.Tuple[Path, str, bool, bool]
+    ) -> typing.Optional[dict]:  # pragma: no cover
+        """Prepare a CoLRev project for indexing (in a worker process)"""
+        repo_source_path, indexed_commit, index_tei, verbose_mode = args
+        local_index = LocalIndex(index_tei=index_tei, verbose_mode=verbose_mode)
+        return local_index._prepare_colrev_project(  # pylint: disable=protected-access
+            repo_source_path=repo_source_path, indexed_commit=indexed_commit
+        )
+
+    def __write_colrev_project(self, *, project: dict, upsert: bool) -> None:
+        # Note : the (single) writer uses executemany for batch inserts/updates
+        self.__add_index_records(
+            recs_to_index=project["recs_to_index"],
+            curated_fields=project["curated_fields"],
+            upsert=upsert,
+        )
+        if project["curated_masterdata"]:
+            self.__add_index_toc(toc_to_index=project["toc_to_index"], upsert=upsert)
 
-    def index(self) -> None:  # pragma: no cover
-        """Index all registered CoLRev projects"""
+        self.__row_cache = {}
+        self.thread_lock.acquire(timeout=60)
+        try:
+            cur = self.__get_sqlite_cursor()
+            # Note : only records indexed from the same repository are removed
+            cur.executemany(
+                f"DELETE FROM {self.RECORD_INDEX} WHERE id=? AND json_extract(record, "
+                "'$.metadata_source_repository_paths') = ?",
+                [(x, project["repo_source_path"]) for x in project["ids_to_remove"]],
+            )
+            cur.execute(
+                f"INSERT OR REPLACE INTO {self.REPO_INDEX} VALUES(?, ?)",
+                (project["repo_source_path"], project["head_commit"]),
+            )
+            cur.connection.commit()
+        finally:
+            self.thread_lock.release()
+
+    def index_colrev_project(
+        self, *, repo_source_path: Path, incremental: bool = False
+    ) -> None:
+        """Index a CoLRev project
+
+        In the incremental mode, only records that changed
+        since the indexed (HEAD) commit are updated.
+        A database without the (current) record_index is reinitialized.
+        """
+        indexed_commit = ""
+        if not self.__record_index_exists():
+            incremental = False
+            self.reinitialize_sqlite_db()
+        if incremental:
+            self.__create_repo_index()
+            indexed_commit = self.__get_indexed_commits().get(str(repo_source_path), "")
+        project = self._prepare_colrev_project(
+            repo_source_path=repo_source_path, indexed_commit=indexed_commit
+        )
+        if project:
+            self.__write_colrev_project(project=project, upsert=incremental)
+
+    def index(
+        self, *, incremental: bool = False, cpu: typing.Optional[int] = None
+    ) -> None:
+        """Index all registered CoLRev projects
+
+        Projects are prepared in parallel processes (cpu) and written by the main process.
+        In the incremental mode, projects whose HEAD commit is indexed are skipped,
+        and only records that changed since the indexed commit are updated.
+        Records that were removed from a project (or whose colrev_id changed) since the
+        indexed commit are deleted if they were indexed from the same project.
+        """
 
         # pylint: disable=import-outside-toplevel
         # pylint: disable=redefined-outer-name
@@ -978,12 +1473,18 @@ class LocalIndex:
         if self.__outlets_duplicated():
             return
 
-        self.reinitialize_sqlite_db()
+        if incremental and self.__record_index_exists():
+            self.__create_repo_index()
+            indexed_commits = self.__get_indexed_commits()
+        else:
+            incremental = False
+            self.reinitialize_sqlite_db()
+            indexed_commits = {}
 
         repo_source_paths = [
             x["repo_source_path"] for x in self.environment_manager.local_repos()
         ]
-        if not repo_source_paths:
+        if not repo_source_paths:  # pragma: no cover
             env_resources = colrev.env.resources.Resources()
             curated_resources = list(self.__load_masterdata_curations().values())
             for curated_resource in curated_resources:
@@ -996,8 +1497,23 @@ class LocalIndex:
                 x["repo_source_path"] for x in self.environment_manager.local_repos()
             ]
 
-        for repo_source_path in repo_source_paths:
-            self.index_colrev_project(repo_source_path=repo_source_path)
+        # Note : projects are written in the order of the repo_source_paths
+        # (records that are in multiple projects are indexed from the first one)
+        with ProcessPoolExecutor(max_workers=cpu) as executor:
+            for project in executor.map(
+                self._prepare_colrev_project_in_process,
+                [
+                    (
+                        repo_source_path,
+                        indexed_commits.get(str(repo_source_path), ""),
+                        self.__index_tei,
+                        self.verbose_mode,
+                    )
+                    for repo_source_path in repo_source_paths
+                ],
+            ):
+                if project:
+                    self.__write_colrev_project(project=project, upsert=incremental)
 
         # for annotator in self.annotators_path.glob("*/annotate.py"):
         #     print(f"Load {annotator}")
@@ -1043,18 +1559,16 @@ class LocalIndex:
 
     def __toc_exists(self, *, toc_item: str) -> bool:
         try:
-            self.thread_lock.acquire(timeout=60)
             cur = self.__get_sqlite_cursor()
             cur.execute(
                 self.SELECT_KEY_QUERIES[(self.TOC_INDEX, "toc_key")], (toc_item,)
             )
             selected_row = cur.fetchone()
-            self.thread_lock.release()
             if not selected_row:
                 return False
             return True
         except sqlite3.OperationalError:
-            self.thread_lock.release()
+            pass
         except AttributeError:  # ie. no sqlite database available
             return False
         return False
@@ -1176,34 +1690,35 @@ class LocalIndex:
         self, *, index_name: str, query: typing.Tuple[str, list[str]]
     ) -> list:
         try:
-            self.thread_lock.acquire(timeout=60)
             cur = self.__get_sqlite_cursor()
             select_all_query = f"{self.SELECT_ALL_QUERIES[index_name]} {query[0]}"
             cur.execute(select_all_query, query[1])
-            results = cur.fetchall()
-            self.thread_lock.release()
-            return results
+            return cur.fetchall()
 
         except sqlite3.OperationalError as exc:
-            self.thread_lock.release()
             raise colrev_exceptions.RecordNotInIndexException() from exc
         except AttributeError as exc:
             raise colrev_exceptions.RecordNotInIndexException() from exc
 
     def __get_item_from_index(self, *, index_name: str, key: str, value: str) -> dict:
         try:
-            self.thread_lock.acquire(timeout=60)
-            cur = self.__get_sqlite_cursor()
-
             # in the following, collisions should be handled.
             # paper_hash = hashlib.sha256(cid_to_retrieve.encode("utf-8")).hexdigest()
             # Collision
             # paper_hash = self.__increment_hash(paper_hash=paper_hash)
 
-            cur.execute(self.SELECT_KEY_QUERIES[(index_name, key)], (value,))
-
-            selected_row = cur.fetchone()
-            self.thread_lock.release()
+            row_cache = self.__row_cache
+            if (
+                self.RECORD_INDEX == index_name
+                and isinstance(value, str)
+                and (key, value) in row_cache
+            ):
+                selected_row = row_cache[(key, value)]
+            else:
+                # Note : reads do not require the thread_lock (WAL, per-thread connections)
+                cur = self.__get_sqlite_cursor()
+                cur.execute(self.SELECT_KEY_QUERIES[(index_name, key)], (value,))
+                selected_row = cur.fetchone()
 
             if not selected_row:
                 raise colrev_exceptions.RecordNotInIndexException()
@@ -1215,10 +1730,8 @@ class LocalIndex:
                 retrieved_record = selected_row
 
             if key == Fields.COLREV_ID:
-                if (
-                    value
-                    != colrev.record.Record(data=retrieved_record).create_colrev_id()
-                ):
+                # Note : the colrev_id is precomputed when indexing
+                if value != selected_row.get(Fields.COLREV_ID, ""):
                     raise colrev_exceptions.RecordNotInIndexException()
             else:
                 if key not in retrieved_record:
@@ -1229,7 +1742,6 @@ class LocalIndex:
             return retrieved_record
 
         except sqlite3.OperationalError as exc:
-            self.thread_lock.release()
             raise colrev_exceptions.RecordNotInIndexException() from exc
 
     def retrieve_based_on_colrev_pdf_id(self, *, colrev_pdf_id: str) -> dict:
@@ -1263,52 +1775,12 @@ class LocalIndex:
         based on another record_dict
         """
 
-        # To avoid modifications to the original record
-        record_dict = deepcopy(record_dict)
-
-        retrieved_record_dict: typing.Dict = {}
-        # 1. Try the record index
-        try:
-            retrieved_record_dict = self.__retrieve_from_record_index(
-                record_dict=record_dict
-            )
-        except (
-            colrev_exceptions.RecordNotInIndexException,
-            colrev_exceptions.NotEnoughDataToIdentifyException,
-        ) as exc:
-            if self.verbose_mode:
-                print(exc)
-                print(f"{record_dict['ID']} - no exact match")
-
-        # 2. Try using global-ids
-        if not retrieved_record_dict and self.__sqlite_available:
-            remove_colrev_id = False
-            if Fields.COLREV_ID not in record_dict:
-                try:
-                    record_dict[Fields.COLREV_ID] = colrev.record.Record(
-                        data=record_dict
-                    ).create_colrev_id()
-                    remove_colrev_id = True
-                except colrev_exceptions.NotEnoughDataToIdentifyException:
-                    pass
-            for key, value in record_dict.items():
-                if key not in self.global_keys or Fields.ID == key:
-                    continue
-
-                retrieved_record_dict = self.__get_item_from_index(
-                    index_name=self.RECORD_INDEX, key=key, value=value
-                )
-                if key in retrieved_record_dict:
-                    if retrieved_record_dict[key] == value:
-                        break
-                retrieved_record_dict = {}
-            if remove_colrev_id:
-                del record_dict[Fields.COLREV_ID]
-
-        if not retrieved_record_dict:
-            raise colrev_exceptions.RecordNotInIndexException(
-                record_dict.get(Fields.ID, "no-key")
-            )
+        cids_to_retrieve, global_key = self.__get_lookups(record_dict=record_dict)
+        retrieved_record_dict = self.__retrieve_based_on_lookups(
+            record_dict=record_dict,
+            cids_to_retrieve=cids_to_retrieve,
+            global_key=global_key,
+        )
 
         return self.__prepare_record_for_return(
             record_dict=retrieved_record_dict,
@@ -1316,6 +1788,46 @@ class LocalIndex:
             include_colrev_ids=include_colrev_ids,
         )
 
+    def retrieve_many(
+        self,
+        *,
+        records: typing.Iterable[dict],
+        include_file: bool = False,
+        include_colrev_ids: bool = False,
+    ) -> dict:
+        """
+        Retrieve the indexed record_dict metadata for a batch of records
+        (set-based queries instead of one query per record and key)
+
+        Returns {ID: retrieved_record_dict} (records that are not indexed are omitted)
+        """
+
+        lookups = {
+            record_dict[Fields.ID]: (
+                record_dict,
+                *self.__get_lookups(record_dict=record_dict),
+            )
+            for record_dict in records
+        }
+        self.__prefetch(lookups=[lookup[1:] for lookup in lookups.values()])
+
+        retrieved_records = {}
+        for record_id, (record_dict, cids_to_retrieve, global_key) in lookups.items():
+            try:
+                retrieved_record_dict = self.__retrieve_based_on_lookups(
+                    record_dict=record_dict,
+                    cids_to_retrieve=cids_to_retrieve,
+                    global_key=global_key,
+                )
+            except colrev_exceptions.RecordNotInIndexException:
+                continue
+            retrieved_records[record_id] = self.__prepare_record_for_return(
+                record_dict=retrieved_record_dict,
+                include_file=include_file,
+                include_colrev_ids=include_colrev_ids,
+            )
+        return retrieved_records
+
     def is_duplicate(self, *, record1_colrev_id: list, record2_colrev_id: list) -> str:
         """Convenience function to check whether two records are a duplicate"""
 
@@ -495,21 +495,17 @@ class PackageManager:
         return packages
 
     def __flag_installed_packages(self) -> None:
-        for package_type, package_list in self.packages.items():
-            for package_identifier, package in package_list.items():
-                try:
-                    self.load_package_endpoint(
-                        package_type=package_type, package_identifier=package_identifier
+        # Note : metadata-only discovery (find_spec) of the distributions
+        # providing the endpoints. Endpoints are imported when they are loaded.
+        installed_modules: typing.Dict[str, bool] = {}
+        for package_list in self.packages.values():
+            for package in package_list.values():
+                module_name = package["endpoint"].split(".")[0]
+                if module_name not in installed_modules:
+                    installed_modules[module_name] = (
+                        importlib.util.find_spec(module_name) is not None
                     )
-                    package["installed"] = True
-                except (AttributeError, ModuleNotFoundError) as exc:
-                    if hasattr(exc, "name"):
-                        if package_identifier.split(".")[0] != exc.name:  # type: ignore
-                            if self.verbose:
-                                raise exc
-                            print(f"Error loading package {package_identifier}: {exc}")
-
-                    package["installed"] = False
+                package["installed"] = installed_modules[module_name]
 
     def __replace_path_by_str(self, *, orig_dict):  # type: ignore
         for key, value in orig_dict.items():
@@ -606,18 +602,36 @@ class PackageManager:
 
         return package_details
 
+    def discover_package_identifiers(
+        self, *, package_type: PackageEndpointType, installed_only: bool = False
+    ) -> typing.List[str]:
+        """Discover the package identifiers (without importing the packages)"""
+
+        return [
+            package_identifier
+            for package_identifier, package in self.packages[package_type].items()
+            if not installed_only or package["installed"]
+        ]
+
     def discover_packages(
         self, *, package_type: PackageEndpointType, installed_only: bool = False
     ) -> typing.Dict:
-        """Discover packages"""
+        """Discover packages (imports the packages to retrieve their descriptions)"""
 
         discovered_packages = self.packages[package_type]
         for package_identifier, package in discovered_packages.items():
             if installed_only and not package["installed"]:
                 continue
-            package_class = self.load_package_endpoint(
-                package_type=package_type, package_identifier=package_identifier
-            )
+            try:
+                package_class = self.load_package_endpoint(
+                    package_type=package_type, package_identifier=package_identifier
+                )
+            except (AttributeError, ModuleNotFoundError) as exc:
+                if self.verbose:
+                    raise exc
+                print(f"Error loading package {package_identifier}: {exc}")
+                package["installed"] = False
+                continue
             discovered_packages[package_identifier] = package
             discovered_packages[package_identifier][
                 "description"
@@ -702,11 +716,22 @@ class PackageManager:
                         f"Dependency {package_identifier} ({package_type}) not found. "
                         f"Please install it\n  pip install {package_identifier.split('.')[0]}"
                     )
-                packages_dict[package_identifier][
-                    "endpoint"
-                ] = self.load_package_endpoint(
-                    package_type=package_type, package_identifier=package_identifier
-                )
+                try:
+                    packages_dict[package_identifier][
+                        "endpoint"
+                    ] = self.load_package_endpoint(
+                        package_type=package_type, package_identifier=package_identifier
+                    )
+                except (AttributeError, ModuleNotFoundError) as exc:
+                    self.packages[package_type][package_identifier]["installed"] = False
+                    if ignore_not_available:
+                        print(f"Could not load {selected_package}: {exc}")
+                        del packages_dict[package_identifier]
+                        continue
+                    raise colrev_exceptions.MissingDependencyError(
+                        f"Dependency {package_identifier} ({package_type}) "
+                        f"could not be loaded ({exc})"
+                    ) from exc
 
             #     except ModuleNotFoundError as exc:
             #         if ignore_not_available:
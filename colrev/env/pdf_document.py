@@ -0,0 +1,190 @@
+#! /usr/bin/env python
+"""Context of a PDF document (shared by the pdf-prep endpoints)"""
+from __future__ import annotations
+
+import io
+import threading
+import typing
+from pathlib import Path
+
+import fitz
+import pdfminer
+from pdfminer.converter import TextConverter
+from pdfminer.pdfdocument import PDFDocument
+from pdfminer.pdfdocument import PDFTextExtractionNotAllowed
+from pdfminer.pdfinterp import PDFPageInterpreter
+from pdfminer.pdfinterp import PDFResourceManager
+from pdfminer.pdfinterp import resolve1
+from pdfminer.pdfpage import PDFPage
+from pdfminer.pdfparser import PDFParser
+from PyPDF2 import PdfFileReader
+
+import colrev.qm.colrev_pdf_id
+
+
+class PDFDocumentContext:
+    """Context of a PDF document
+
+    The file is read once. The parsers (pdfminer, PyPDF2, fitz) are created upon
+    first use, and the analyses (page count, text per page, page hashes, document info)
+    are memoized. The context is valid as long as the file is not changed.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, *, pdf_path: Path) -> None:
+        self.pdf_path = pdf_path
+        stat = pdf_path.stat()
+        self.__file_key = (stat.st_size, stat.st_mtime_ns)
+        self.__content: typing.Optional[bytes] = None
+        self.__lock = threading.RLock()
+
+        self.__pdfminer_document: typing.Optional[PDFDocument] = None
+        self.__pdfminer_pages: typing.Optional[list] = None
+        self.__pdfminer_page_texts: typing.Dict[int, str] = {}
+        self.__pages_in_file: typing.Optional[int] = None
+
+        self.__pdf_reader: typing.Optional[PdfFileReader] = None
+        self.__page_texts: typing.Dict[int, str] = {}
+
+        self.__fitz_document: typing.Optional[fitz.Document] = None
+        self.__page_hashes: typing.Dict[typing.Tuple[int, int], str] = {}
+
+    def is_valid(self) -> bool:
+        """Check whether the file was not changed (since the context was created)"""
+        try:
+            stat = self.pdf_path.stat()
+        except FileNotFoundError:
+            return False
+        return self.__file_key == (stat.st_size, stat.st_mtime_ns)
+
+    def __get_content(self) -> bytes:
+        if self.__content is None:
+            self.__content = self.pdf_path.read_bytes()
+        return self.__content
+
+    # pdfminer
+
+    def __get_pdfminer_document(self) -> PDFDocument:
+        if self.__pdfminer_document is None:
+            parser = PDFParser(io.BytesIO(self.__get_content()))
+            self.__pdfminer_document = PDFDocument(parser, caching=True)
+        return self.__pdfminer_document
+
+    def get_pages_in_file(self) -> int:
+        """Get the number of pages (based on the pdfminer catalog)"""
+        with self.__lock:
+            if self.__pages_in_file is None:
+                document = self.__get_pdfminer_document()
+                self.__pages_in_file = resolve1(document.catalog["Pages"])["Count"]
+            return self.__pages_in_file
+
+    def __get_pdfminer_pages(self) -> list:
+        if self.__pdfminer_pages is None:
+            document = self.__get_pdfminer_document()
+            if not document.is_extractable:
+                raise PDFTextExtractionNotAllowed(
+                    f"Text extraction is not allowed: {self.pdf_path}"
+                )
+            self.__pdfminer_pages = list(PDFPage.create_pages(document))
+        return self.__pdfminer_pages
+
+    def __extract_pdfminer_page_text(self, *, page: PDFPage) -> str:
+        # https://stackoverflow.com/questions/49457443/python-pdfminer-converts-pdf-file-into-one-chunk-of-string-with-no-spaces-betwee
+        laparams = pdfminer.layout.LAParams()
+        setattr(laparams, "all_texts", True)
+
+        resource_manager = PDFResourceManager()
+        fake_file_handle = io.StringIO()
+        converter = TextConverter(resource_manager, fake_file_handle, laparams=laparams)
+        page_interpreter = PDFPageInterpreter(resource_manager, converter)
+        page_interpreter.process_page(page)
+        text = fake_file_handle.getvalue()
+        converter.close()
+        fake_file_handle.close()
+        return text
+
+    def extract_text_by_page(self, *, pages: typing.Optional[list] = None) -> str:
+        """Extract the text (pdfminer) for a given list of pages (all pages if None)"""
+        with self.__lock:
+            text_list = []
+            try:
+                for page_nr, page in enumerate(self.__get_pdfminer_pages()):
+                    if pages and page_nr not in pages:
+                        continue
+                    if page_nr not in self.__pdfminer_page_texts:
+                        self.__pdfminer_page_texts[
+                            page_nr
+                        ] = self.__extract_pdfminer_page_text(page=page)
+                    text_list.append(self.__pdfminer_page_texts[page_nr])
+            except (TypeError, KeyError):  # pragma: no cover
+                pass
+            return "".join(text_list)
+
+    # PyPDF2
+
+    def __get_pdf_reader(self) -> PdfFileReader:
+        if self.__pdf_reader is None:
+            self.__pdf_reader = PdfFileReader(
+                io.BytesIO(self.__get_content()), strict=False
+            )
+        return self.__pdf_reader
+
+    def get_number_of_pages(self) -> int:
+        """Get the number of pages (based on the PyPDF2 page tree)"""
+        with self.__lock:
+            return len(self.__get_pdf_reader().pages)
+
+    def get_page_text(self, *, page_nr: int) -> str:
+        """Get the text (PyPDF2) of a page (starting with 0)"""
+        with self.__lock:
+            if page_nr not in self.__page_texts:
+                self.__page_texts[page_nr] = (
+                    self.__get_pdf_reader().getPage(page_nr).extract_text()
+                )
+            return self.__page_texts[page_nr]
+
+    def get_document_info(self) -> dict:
+        """Get the document info (metadata)"""
+        with self.__lock:
+            document_info = self.__get_pdf_reader().getDocumentInfo()
+            return dict(document_info) if document_info else {}
+
+    # fitz
+
+    def __get_fitz_document(self) -> fitz.Document:
+        if self.__fitz_document is None:
+            self.__fitz_document = fitz.open(
+                stream=self.__get_content(), filetype="pdf"
+            )
+        return self.__fitz_document
+
+    def get_page_hash(self, *, page_nr: int, hash_size: int = 32) -> str:
+        """Get the image hash of a page (starting with 1)"""
+        with self.__lock:
+            if (page_nr, hash_size) not in self.__page_hashes:
+                self.__page_hashes[
+                    (page_nr, hash_size)
+                ] = colrev.qm.colrev_pdf_id.get_pdf_hash(
+                    pdf_path=self.pdf_path,
+                    page_nr=page_nr,
+                    hash_size=hash_size,
+                    document=self.__get_fitz_document(),
+                    content=self.__get_content(),
+                )
+            return self.__page_hashes[(page_nr, hash_size)]
+
+    def get_colrev_pdf_id(self) -> str:
+        """Get the colrev_pdf_id"""
+        return "cpid2:" + self.get_page_hash(page_nr=1, hash_size=32)
+
+    def close(self) -> None:
+        """Close the parsers"""
+        with self.__lock:
+            if self.__fitz_document is not None:
+                self.__fitz_document.close()
+            self.__fitz_document = None
+            self.__pdfminer_document = None
+            self.__pdfminer_pages = None
+            self.__pdf_reader = None
+            self.__content = None
@@ -795,28 +795,27 @@ class TEIParser:
     def mark_references(self, *, records: dict):  # type: ignore
         """Mark references with the additional record ID"""
 
-        tei_records = self.get_bibliography()
-        for record_dict in tei_records:
-            if Fields.TITLE not in record_dict:
-                continue
-
-            max_sim = 0.9
-            max_sim_record = {}
-            for local_record_dict in records.values():
-                if local_record_dict[Fields.STATUS] not in [
-                    colrev.record.RecordState.rev_included,
-                    colrev.record.RecordState.rev_synthesized,
-                ]:
-                    continue
-                rec_sim = colrev.record.Record.get_record_similarity(
-                    record_a=colrev.record.Record(data=record_dict),
-                    record_b=colrev.record.Record(data=local_record_dict),
-                )
-                if rec_sim > max_sim:
-                    max_sim_record = local_record_dict
-                    max_sim = rec_sim
-            if len(max_sim_record) == 0:
+        tei_records = [r for r in self.get_bibliography() if Fields.TITLE in r]
+        included_records = [
+            r
+            for r in records.values()
+            if r[Fields.STATUS]
+            in [
+                colrev.record.RecordState.rev_included,
+                colrev.record.RecordState.rev_synthesized,
+            ]
+        ]
+        if not included_records:
+            tei_records = []
+        similarities = colrev.record.Record.get_record_similarity_matrix(
+            records_a=[colrev.record.Record(data=r) for r in tei_records],
+            records_b=[colrev.record.Record(data=r) for r in included_records],
+        )
+        for record_dict, record_similarities in zip(tei_records, similarities):
+            best = int(record_similarities.argmax())
+            if record_similarities[best] <= 0.9:
                 continue
+            max_sim_record = included_records[best]
 
             # Record found: mark in tei
             bibliography = self.root.find(f".//{self.ns['tei']}listBibl")
@@ -84,6 +84,17 @@ class BrokenFilesError(CoLRevException):
         super().__init__(self.message)
 
 
+class NonCanonicalFormatError(CoLRevException):
+    """
+    The records file is not in the canonical CoLRev format
+    (the native parser falls back to pybtex).
+    """
+
+    def __init__(self, msg: str) -> None:
+        self.message = f"Non-canonical records format: {msg}"
+        super().__init__(self.message)
+
+
 class CoLRevUpgradeError(CoLRevException):
     """
     The version of the local CoLRev package does not match with the CoLRev version
@@ -0,0 +1,65 @@
+#! /usr/bin/env python
+"""Allocation of unique record IDs."""
+from __future__ import annotations
+
+import string
+import typing
+
+
+def get_id_suffix(*, number: int) -> str:
+    """Get the n-th ID suffix (1: a, ..., 26: z, 27: aa, 28: ab, ...)"""
+    suffix = ""
+    while number > 0:
+        number, remainder = divmod(number - 1, 26)
+        suffix = string.ascii_lowercase[remainder] + suffix
+    return suffix
+
+
+class IDAllocator:
+    """Allocates unique IDs (compared case-insensitively)
+
+    The lower-cased IDs are stored in a set. Per-stem counters store the next suffix
+    to try, so that repeated collisions with the same stem do not restart at "a".
+    """
+
+    def __init__(self, *, existing_ids: typing.Iterable[str] = ()) -> None:
+        self.__ids: typing.Set[str] = {record_id.lower() for record_id in existing_ids}
+        self.__next_suffix: typing.Dict[str, int] = {}
+
+    def __contains__(self, record_id: str) -> bool:
+        return record_id.lower() in self.__ids
+
+    def __len__(self) -> int:
+        return len(self.__ids)
+
+    def add(self, *, record_id: str) -> None:
+        """Add an ID"""
+        self.__ids.add(record_id.lower())
+
+    def remove(self, *, record_id: str) -> None:
+        """Remove an ID (it can be allocated again)"""
+        record_id = record_id.lower()
+        self.__ids.discard(record_id)
+        # Note : reset the counters of the stems that may have produced the ID
+        # (e.g., "smith2020" for "smith2020ab")
+        for i in range(len(record_id) - 1, 0, -1):
+            if record_id[i] not in string.ascii_lowercase:
+                break
+            self.__next_suffix.pop(record_id[:i], None)
+
+    def generate_next_unique_id(self, *, temp_id: str) -> str:
+        """Get the next unique ID (temp_id, or temp_id with the next free suffix)"""
+        if temp_id.lower() not in self.__ids:
+            return temp_id
+        stem = temp_id.lower()
+        number = self.__next_suffix.get(stem, 1)
+        while stem + get_id_suffix(number=number) in self.__ids:
+            number += 1
+        self.__next_suffix[stem] = number
+        return temp_id + get_id_suffix(number=number)
+
+    def allocate(self, *, temp_id: str) -> str:
+        """Allocate the next unique ID"""
+        record_id = self.generate_next_unique_id(temp_id=temp_id)
+        self.add(record_id=record_id)
+        return record_id
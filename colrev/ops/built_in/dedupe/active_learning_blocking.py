@@ -0,0 +1,197 @@
+#! /usr/bin/env python
+"""Incremental blocking for the active-learning dedupe (blocking keys cached in .colrev/)"""
+from __future__ import annotations
+
+import collections
+import hashlib
+import json
+import os
+import pickle  # nosec
+import typing
+from itertools import chain
+from pathlib import Path
+
+# Layout of the cache file (a pickled dict):
+# - settings_hash: sha1 of the learned settings file (i.e., the predicates)
+# - records: {ID: (record_hash, blocking_keys)}, with the record_hash based on the
+#   fields used by the predicates
+# Only the keys of predicates that do not depend on an index (of the corpus) are cached.
+
+
+def is_index_predicate(*, predicate: typing.Any) -> bool:
+    """Check whether a (compound) predicate depends on an index of the corpus"""
+    return any(hasattr(sub_predicate, "index") for sub_predicate in predicate)
+
+
+class BlockingKeysCache:
+    """Blocking keys of the records (validated against the settings and the record data)"""
+
+    CACHE_VERSION = "1"
+
+    def __init__(self, *, cache_path: Path, settings_file: Path) -> None:
+        self.cache_path = cache_path
+        with open(settings_file, "rb") as file:
+            self.settings_hash = hashlib.sha1(file.read()).hexdigest()  # nosec
+
+    def __load(self) -> dict:
+        if self.cache_path.is_file():
+            try:
+                with open(self.cache_path, "rb") as file:
+                    cache = pickle.load(file)  # nosec
+                if (
+                    cache["version"] == self.CACHE_VERSION
+                    and cache["settings_hash"] == self.settings_hash
+                ):
+                    return cache
+            except (EOFError, KeyError, TypeError, pickle.UnpicklingError):
+                pass
+        return {
+            "version": self.CACHE_VERSION,
+            "settings_hash": self.settings_hash,
+            "records": {},
+        }
+
+    def __save(self, *, cache: dict) -> None:
+        self.cache_path.parent.mkdir(exist_ok=True, parents=True)
+        temp_path = self.cache_path.with_suffix(".tmp")
+        with open(temp_path, "wb") as file:
+            pickle.dump(cache, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, self.cache_path)
+
+    def get_blocking_keys(self, *, predicates: list, records: dict) -> dict:
+        """Get the {ID: blocking_keys} of the (enumerated, non-index) predicates,
+        computing only the keys of records that are new or changed"""
+
+        fields = sorted(
+            {
+                sub_predicate.field
+                for _, predicate in predicates
+                for sub_predicate in predicate
+            }
+        )
+        cache = self.__load()
+        cached_records = cache["records"]
+        updated_records = {}
+        changed = len(cached_records) != len(records)
+        for record_id, record in records.items():
+            record_hash = hashlib.sha1(  # nosec
+                json.dumps([record.get(field) for field in fields], default=str).encode(
+                    "utf-8"
+                )
+            ).hexdigest()
+            if (
+                record_id in cached_records
+                and cached_records[record_id][0] == record_hash
+            ):
+                updated_records[record_id] = cached_records[record_id]
+                continue
+            # Note : the keys are suffixed with the predicate number
+            # (as in dedupe's Fingerprinter)
+            blocking_keys = frozenset(
+                f"{block_key}:{i}"
+                for i, predicate in predicates
+                for block_key in predicate(record)
+            )
+            updated_records[record_id] = (record_hash, blocking_keys)
+            changed = True
+
+        if changed:
+            cache["records"] = updated_records
+            self.__save(cache=cache)
+        return {
+            record_id: blocking_keys
+            for record_id, (_, blocking_keys) in updated_records.items()
+        }
+
+    def invalidate(self) -> None:
+        """Remove the cache"""
+        self.cache_path.unlink(missing_ok=True)
+
+
+def __add_index_blocking_keys(
+    *,
+    fingerprinter: typing.Any,
+    index_predicates: list,
+    processed_keys: dict,
+    new_keys: dict,
+    records: dict,
+) -> None:
+    # Note : like dedupe's Gazetteer, the processed records are the targets
+    # (i.e., their keys are their own positions in the index)
+    # and only the new records are searched in the index
+    for field in fingerprinter.index_fields:
+        fingerprinter.index({r[field] for r in records.values() if r[field]}, field)
+    for record_id in processed_keys:
+        processed_keys[record_id].update(
+            f"{block_key}:{i}"
+            for i, predicate in index_predicates
+            for block_key in predicate(records[record_id], target=True)
+        )
+    for record_id in new_keys:
+        new_keys[record_id].update(
+            f"{block_key}:{i}"
+            for i, predicate in index_predicates
+            for target in [False, True]
+            for block_key in predicate(records[record_id], target=target)
+        )
+    fingerprinter.reset_indices()
+
+
+def get_incremental_pairs(
+    *,
+    fingerprinter: typing.Any,
+    blocking_keys_cache: BlockingKeysCache,
+    processed_records: dict,
+    new_records: dict,
+) -> typing.List[typing.Tuple[str, str]]:
+    """Get the pairs of records that share a blocking key
+    and contain at least one new record (pairs of processed records are skipped)"""
+
+    # pylint: disable=too-many-locals
+
+    predicates = list(enumerate(fingerprinter.predicates))
+    static_predicates = [
+        (i, p) for i, p in predicates if not is_index_predicate(predicate=p)
+    ]
+    index_predicates = [
+        (i, p) for i, p in predicates if is_index_predicate(predicate=p)
+    ]
+
+    blocking_keys = blocking_keys_cache.get_blocking_keys(
+        predicates=static_predicates,
+        records={**processed_records, **new_records},
+    )
+    processed_keys = {
+        record_id: set(blocking_keys[record_id]) for record_id in processed_records
+    }
+    new_keys = {record_id: set(blocking_keys[record_id]) for record_id in new_records}
+
+    if index_predicates:
+        __add_index_blocking_keys(
+            fingerprinter=fingerprinter,
+            index_predicates=index_predicates,
+            processed_keys=processed_keys,
+            new_keys=new_keys,
+            records={**processed_records, **new_records},
+        )
+
+    blocks: typing.Dict[str, typing.Tuple[set, set]] = collections.defaultdict(
+        lambda: (set(), set())
+    )
+    for record_id, keys in new_keys.items():
+        for block_key in keys:
+            blocks[block_key][0].add(record_id)
+    for record_id, keys in processed_keys.items():
+        for block_key in keys:
+            if block_key in blocks:
+                blocks[block_key][1].add(record_id)
+
+    pairs = set()
+    for new_ids, processed_ids in blocks.values():
+        for new_id in new_ids:
+            for other_id in chain(new_ids, processed_ids):
+                if new_id != other_id:
+                    pairs.add((min(new_id, other_id), max(new_id, other_id)))
+
+    # Note : dedupe expects the smaller ID first (and each pair only once)
+    return sorted(pairs)
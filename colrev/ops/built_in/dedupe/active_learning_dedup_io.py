@@ -6,6 +6,7 @@ import logging
 import os
 import sqlite3
 import statistics
+import tempfile
 import typing
 from dataclasses import dataclass
 from pathlib import Path
@@ -18,10 +19,12 @@ import zope.interface
 from dataclasses_jsonschema import JsonSchemaMixin
 from dedupe._typing import RecordDictPair as TrainingExample
 from dedupe._typing import TrainingData
+from dedupe.core import BlockingError
 from dedupe.core import unique
 
 import colrev.env.package_manager
 import colrev.exceptions as colrev_exceptions
+import colrev.ops.built_in.dedupe.active_learning_blocking
 import colrev.ops.built_in.dedupe.utils
 import colrev.record
 from colrev.constants import Colors
@@ -621,13 +624,21 @@ class ActiveLearningDedupeAutomated(JsonSchemaMixin):
         endpoint: str
         merge_threshold: float = 0.8
         partition_threshold: float = 0.5
+        incremental: bool = True
 
         _details = {
             "merge_threshold": {"tooltip": "Threshold for merging record pairs"},
             "partition_threshold": {"tooltip": "Threshold for partitioning"},
+            "incremental": {
+                "tooltip": "Only compare new (md_prepared) records "
+                "with each other and with the processed records"
+            },
         }
 
     settings_class = ActiveLearningSettings
+    BLOCKING_KEYS_CACHE_RELATIVE = Path(".colrev/dedupe_blocking_keys.cache")
+    # Note : number of candidate pairs fetched from sqlite at once
+    PAIRS_CHUNK_SIZE = 10000
 
     def __init__(
         self,
@@ -951,6 +962,123 @@ class ActiveLearningDedupeAutomated(JsonSchemaMixin):
             collected_non_duplicates=results["collected_non_duplicates"],
         )
 
+    @classmethod
+    def __get_num_cores(cls) -> int:
+        # Note : scoring is CPU-bound (physical cores, leaving one for the main process)
+        num_cores = psutil.cpu_count(logical=False) or os.cpu_count() or 1
+        return max(1, num_cores - 1)
+
+    def __cluster_new_records(
+        self,
+        *,
+        deduper: dedupe_io.StaticDedupe,
+        processed_records: dict,
+        new_records: dict,
+    ) -> list:
+        """Cluster the new records (compared with each other and the processed records)"""
+
+        blocking_keys_cache = (
+            colrev.ops.built_in.dedupe.active_learning_blocking.BlockingKeysCache(
+                cache_path=self.review_manager.path / self.BLOCKING_KEYS_CACHE_RELATIVE,
+                settings_file=self.settings_file,
+            )
+        )
+        pairs = (
+            colrev.ops.built_in.dedupe.active_learning_blocking.get_incremental_pairs(
+                fingerprinter=deduper.fingerprinter,
+                blocking_keys_cache=blocking_keys_cache,
+                processed_records=processed_records,
+                new_records=new_records,
+            )
+        )
+        self.review_manager.logger.info(f"Number of pairs to compare: {len(pairs)}")
+
+        clustered_dupes = []
+        if pairs:
+            records_data = {**processed_records, **new_records}
+            clustered_dupes = list(
+                deduper.cluster(
+                    deduper.score(
+                        ((id_a, records_data[id_a]), (id_b, records_data[id_b]))
+                        for id_a, id_b in pairs
+                    ),
+                    threshold=self.settings.partition_threshold,
+                )
+            )
+
+        # Note : like partition(), return the (new) records without duplicates
+        clustered_ids = {
+            record_id for records, _ in clustered_dupes for record_id in records
+        }
+        for record_id in new_records:
+            if record_id not in clustered_ids:
+                clustered_dupes.append(((record_id,), (1.0,)))
+        return clustered_dupes
+
+    def __cluster_duplicates_on_disk(
+        self, *, deduper: dedupe_io.StaticDedupe, data_d: dict
+    ) -> list:
+        """Cluster the records based on a blocking map stored in sqlite
+        (candidate pairs are streamed to the deduper)"""
+
+        for field in deduper.fingerprinter.index_fields:
+            field_data = (r[field] for r in data_d.values() if field in r)
+            deduper.fingerprinter.index(field_data, field)
+
+        # use sqlite: light-weight, file-based
+        # https://docs.python.org/3/library/sqlite3.html
+        # https://dedupeio.github.io/dedupe-examples/docs/pgsql_big_dedupe_example.html
+        temp_parent = self.review_manager.path / Path(".colrev")
+        temp_parent.mkdir(exist_ok=True, parents=True)
+        with tempfile.TemporaryDirectory(dir=temp_parent) as temp_dir:
+            con = sqlite3.connect(str(Path(temp_dir) / Path("dedupe.db")))
+            try:
+                con.execute("PRAGMA journal_mode=OFF")
+                con.execute("PRAGMA synchronous=OFF")
+                con.execute("CREATE TABLE blocking_map (block_key TEXT, ID TEXT)")
+                # pylint: disable=not-callable
+                # fingerprinter is callable according to
+                # https://github.com/dedupeio/dedupe/blob/
+                # b9d8f111bcd5ffd177659f79f57354d9a9318359/dedupe/blocking.py
+                con.executemany(
+                    "INSERT INTO blocking_map VALUES (?, ?)",
+                    deduper.fingerprinter((r[Fields.ID], r) for r in data_d.values()),
+                )
+                deduper.fingerprinter.reset_indices()
+                # Note : the (block_key, ID) index covers the self-join
+                con.execute(
+                    "CREATE INDEX block_key_idx ON blocking_map (block_key, ID)"
+                )
+                con.execute("ANALYZE")
+
+                # Note : each unordered pair is selected once (smaller ID first)
+                cursor = con.execute(
+                    """SELECT DISTINCT l.ID, r.ID
+                        FROM blocking_map AS l
+                        INNER JOIN blocking_map AS r
+                        USING (block_key)
+                        WHERE l.ID < r.ID"""
+                )
+
+                def record_pairs() -> typing.Iterator[tuple]:
+                    while True:
+                        rows = cursor.fetchmany(self.PAIRS_CHUNK_SIZE)
+                        if not rows:
+                            break
+                        for id_a, id_b in rows:
+                            yield (id_a, data_d[id_a]), (id_b, data_d[id_b])
+
+                try:
+                    scores = deduper.score(record_pairs())
+                except BlockingError:
+                    return []
+                finally:
+                    cursor.close()
+            finally:
+                con.close()
+
+        return list(deduper.cluster(scores, threshold=0.5))
+
     def __cluster_duplicates(self, *, data_d: dict) -> list:
         # pylint: disable=too-many-locals
 
@@ -968,18 +1096,46 @@ class ActiveLearningDedupeAutomated(JsonSchemaMixin):
         in_memory = sample_size * 5000000 < ram
 
         with open(self.settings_file, "rb") as sett_file:
-            deduper = dedupe_io.StaticDedupe(sett_file, num_cores=4)
+            deduper = dedupe_io.StaticDedupe(
+                sett_file, num_cores=self.__get_num_cores()
+            )
+
+        # Note : processed records (md_processed and beyond) were deduplicated before.
+        # In the incremental mode, only the new (md_prepared) records are compared
+        # (with each other and with the processed records)
+        new_records = {
+            record_id: record
+            for record_id, record in data_d.items()
+            if record[Fields.STATUS] == str(colrev.record.RecordState.md_prepared)
+        }
+        processed_records = {
+            record_id: record
+            for record_id, record in data_d.items()
+            if record_id not in new_records
+        }
 
         # `partition` will return sets of records that dedupe
         # believes are all referring to the same entity.
 
-        if in_memory:
+        clustered_dupes: list
+        if self.settings.incremental and processed_records and new_records:
+            self.review_manager.logger.info(
+                f"Incremental mode: compare {len(new_records)} new records "
+                f"with {len(processed_records)} processed records"
+            )
+            clustered_dupes = self.__cluster_new_records(
+                deduper=deduper,
+                processed_records=processed_records,
+                new_records=new_records,
+            )
+
+        elif in_memory:
             self.review_manager.report_logger.info(
                 f"set partition_threshold: {self.settings.partition_threshold}"
             )
 
-            clustered_dupes = deduper.partition(
-                data_d, self.settings.partition_threshold
+            clustered_dupes = list(
+                deduper.partition(data_d, self.settings.partition_threshold)
             )
 
             # from dedupe.core import BlockingError
@@ -1003,70 +1159,10 @@ class ActiveLearningDedupeAutomated(JsonSchemaMixin):
             #     pass
 
         else:
-            for field in deduper.fingerprinter.index_fields:
-                field_data = (r[field] for r in data_d.values() if field in r)
-                deduper.fingerprinter.index(field_data, field)
-
-            full_data = ((r[Fields.ID], r) for r in data_d.values())
-
-            # pylint: disable=not-callable
-            # fingerprinter is callable according to
-            # https://github.com/dedupeio/dedupe/blob/
-            # b9d8f111bcd5ffd177659f79f57354d9a9318359/dedupe/blocking.py
-            b_data = deduper.fingerprinter(full_data)
-
-            # use sqlite: light-weight, file-based
-            # https://docs.python.org/3/library/sqlite3.html
-            # https://dedupeio.github.io/dedupe-examples/docs/pgsql_big_dedupe_example.html
-
-            dedupe_db = Path("dedupe.db")
-            dedupe_db.unlink(missing_ok=True)
-            con = sqlite3.connect(str(dedupe_db))
-
-            cur = con.cursor()
-
-            cur.execute("""DROP TABLE IF EXISTS blocking_map""")
-            cur.execute("""CREATE TABLE blocking_map (block_key text, ID INTEGER)""")
-            cur.executemany("""INSERT into blocking_map values (?, ?)""", b_data)
-
-            records_data = {r[Fields.ID]: r for r in data_d.values()}
-
-            def record_pairs(result_set: list[tuple]) -> typing.Iterator[tuple]:
-                for row in result_set:
-                    id_a, id_b = row
-                    record_a = (id_a, records_data[id_a])
-                    record_b = (id_b, records_data[id_b])
-
-                    yield record_a, record_b
-
-            cur.execute(
-                """select DISTINCT l.ID as east, r.ID as west
-                        from blocking_map as l
-                        INNER JOIN blocking_map as r
-                        using (block_key)
-                        where east != west"""
+            clustered_dupes = self.__cluster_duplicates_on_disk(
+                deduper=deduper, data_d=data_d
             )
 
-            clustered_dupes = list(
-                deduper.cluster(
-                    deduper.score(record_pairs(cur.fetchall())), threshold=0.5
-                )
-            )
-
-            # import csv
-            # clusterin_results_csv = Path("clusterin_results.csv")
-            # clusterin_results_csv.unlink(missing_ok=True)
-            # with open(clusterin_results_csv, "w") as out:
-            #     csv_out = csv.writer(out)
-            #     csv_out.writerow(["ID1", "ID2", "conf"])
-            #     for row in list(cluster_ids(clustered_dupes)):
-            #         if row[0] != row[1]:  # only focus on non-identical IDs
-            #             csv_out.writerow(row)
-
-            con.commit()
-            con.close()
-            dedupe_db.unlink(missing_ok=True)
-
         self.review_manager.report_logger.info(
             f"Number of duplicate sets {len(clustered_dupes)}"
         )
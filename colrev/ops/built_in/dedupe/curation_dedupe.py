@@ -2,6 +2,7 @@
 """Dedupe functionality dedicated to curated metadata repositories"""
 from __future__ import annotations
 
+import heapq
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -9,7 +10,6 @@ import numpy as np
 import pandas as pd
 import zope.interface
 from dataclasses_jsonschema import JsonSchemaMixin
-from thefuzz import fuzz
 from tqdm import tqdm
 
 import colrev.env.package_manager
@@ -69,68 +69,74 @@ class CurationDedupe(JsonSchemaMixin):
             )
         )
 
-    def __get_similarity(self, *, df_a: pd.Series, df_b: pd.Series) -> float:
-        author_similarity = fuzz.ratio(df_a[Fields.AUTHOR], df_b[Fields.AUTHOR]) / 100
-
-        title_similarity = (
-            fuzz.ratio(df_a[Fields.TITLE].lower(), df_b[Fields.TITLE].lower()) / 100
+    def __get_similarity_matrix(self, *, references: pd.DataFrame) -> np.ndarray:
+        authors = references[Fields.AUTHOR].tolist()
+        titles = [title.lower() for title in references[Fields.TITLE].tolist()]
+        author_similarity = colrev.record.Record.get_ratio_matrix(
+            values_a=authors, values_b=authors
+        )
+        title_similarity = colrev.record.Record.get_ratio_matrix(
+            values_a=titles, values_b=titles
         )
 
         # Note : the toc-based processing means that we are robust against
         # outlet, year, volume, number variations!
         weights = [0.4, 0.6]
-        similarities = [
-            author_similarity,
-            title_similarity,
-        ]
-
-        weighted_average = sum(
-            similarities[g] * weights[g] for g in range(len(similarities))
+        weighted_average = (
+            author_similarity * weights[0] + title_similarity * weights[1]
         )
 
-        similarity_score = round(weighted_average, 4)
-
-        return similarity_score
+        return colrev.record.Record.round_similarities(similarities=weighted_average)
 
     def __calculate_similarities(
         self,
         *,
-        similarity_array: np.ndarray,
         references: pd.DataFrame,
         min_similarity: float,
-    ) -> tuple:
-        # Fill out the similarity matrix first
-        for base_entry_i in range(1, references.shape[0]):
-            for comparison_entry_i in range(1, references.shape[0]):
-                if base_entry_i > comparison_entry_i:
-                    if -1 != similarity_array[base_entry_i, comparison_entry_i]:
-                        similarity_array[
-                            base_entry_i, comparison_entry_i
-                        ] = self.__get_similarity(
-                            df_a=references.iloc[base_entry_i],
-                            df_b=references.iloc[comparison_entry_i],
-                        )
+    ) -> list:
+        # Note : the pairs are scored once (lower triangle, excluding the first entry)
+        # and processed in the order of decreasing similarity
+        # (ties: in the order of the references)
+        if references.shape[0] <= 2:
+            return []
+        similarities = self.__get_similarity_matrix(references=references.iloc[1:])
+        rows, cols = np.nonzero(np.tril(similarities >= min_similarity, k=-1))
+        heap = [
+            (-similarities[row, col], row + 1, col + 1) for row, col in zip(rows, cols)
+        ]
+        heapq.heapify(heap)
 
+        record_ids = references[Fields.ID].tolist()
         tuples_to_process = []
-        maximum_similarity = 1
-        while True:
-            maximum_similarity = np.amax(similarity_array)
-            if maximum_similarity < min_similarity:
-                break
-            result = np.where(similarity_array == np.amax(similarity_array))
-            list_of_coordinates = list(zip(result[0], result[1]))
-            for cord in list_of_coordinates:
-                similarity_array[cord] = 0  # ie., has been processed
-                tuples_to_process.append(
-                    [
-                        references.iloc[cord[0]][Fields.ID],
-                        references.iloc[cord[1]][Fields.ID],
-                        maximum_similarity,
-                        "not_processed",
-                    ]
-                )
-
-        return similarity_array, tuples_to_process
+        while heap:
+            negative_similarity, row, col = heapq.heappop(heap)
+            tuples_to_process.append(
+                [
+                    record_ids[row],
+                    record_ids[col],
+                    -negative_similarity,
+                    "not_processed",
+                ]
+            )
+        return tuples_to_process
+
+    @classmethod
+    def __get_toc_index(cls, *, records_list: list, toc_items: list) -> dict:
+        """Index the records by the fields (and values) of the toc_items"""
+        toc_index: dict = {}
+        for toc_keys in {tuple(sorted(toc_item)) for toc_item in toc_items}:
+            toc_key_index = toc_index.setdefault(toc_keys, {})
+            for record in records_list:
+                toc_key_index.setdefault(
+                    tuple(record.get(k, "NA") for k in toc_keys), []
+                ).append(record)
+        return toc_index
+
+    @classmethod
+    def __get_toc_records(cls, *, toc_index: dict, toc_item: dict) -> list:
+        """Get the records of a toc_item (as returned by __get_toc_items)"""
+        toc_keys = tuple(sorted(toc_item))
+        return toc_index[toc_keys].get(tuple(toc_item[k] for k in toc_keys), [])
 
     def __get_toc_items(self, *, records_list: list) -> list:
         toc_items = []
@@ -213,15 +219,20 @@ class CurationDedupe(JsonSchemaMixin):
         ]
 
         toc_items = self.__get_toc_items(records_list=source_records)
+        toc_index = self.__get_toc_index(
+            records_list=list(records.values()), toc_items=toc_items
+        )
+        source_toc_index = self.__get_toc_index(
+            records_list=source_records, toc_items=toc_items
+        )
 
         for toc_item in toc_items:
             # Note : these would be potential errors (duplicates)
             # because they have the same selected_source
             processed_same_toc_same_source_records = [
                 r
-                for r in records.values()
-                if all(r.get(k, "NA") == v for k, v in toc_item.items())
-                and r[Fields.STATUS]
+                for r in self.__get_toc_records(toc_index=toc_index, toc_item=toc_item)
+                if r[Fields.STATUS]
                 not in [
                     colrev.record.RecordState.md_prepared,
                     colrev.record.RecordState.md_needs_manual_preparation,
@@ -237,18 +248,17 @@ class CurationDedupe(JsonSchemaMixin):
                 print("\n\n")
                 print(toc_item)
 
+                toc_source_records = self.__get_toc_records(
+                    toc_index=source_toc_index, toc_item=toc_item
+                )
                 for source_record_dict in sorted(
-                    source_records, key=lambda d: d[Fields.AUTHOR]
+                    toc_source_records, key=lambda d: d[Fields.AUTHOR]
                 ):
-                    if all(
-                        source_record_dict.get(k, "NA") == v
-                        for k, v in toc_item.items()
-                    ):
-                        # Record(data=sr).print_citation_format()
-                        print(
-                            f"{source_record_dict.get('author', 'NO_AUTHOR')} : "
-                            f"{source_record_dict.get('title', 'NO_TITLE')}"
-                        )
+                    # Record(data=sr).print_citation_format()
+                    print(
+                        f"{source_record_dict.get('author', 'NO_AUTHOR')} : "
+                        f"{source_record_dict.get('title', 'NO_TITLE')}"
+                    )
                 recs_unique = self.review_manager.force_mode
                 if not recs_unique:
                     recs_unique = "y" == input(
@@ -256,17 +266,11 @@ class CurationDedupe(JsonSchemaMixin):
                         "All records unique? Set to md_processed [y]? "
                     )
                 if recs_unique:
-                    for source_record_dict in source_records:
-                        if all(
-                            source_record_dict.get(k, "NA") == v
-                            for k, v in toc_item.items()
-                        ):
-                            source_record = colrev.record.Record(
-                                data=source_record_dict
-                            )
-                            source_record.set_status(
-                                target_state=colrev.record.RecordState.md_processed
-                            )
+                    for source_record_dict in toc_source_records:
+                        source_record = colrev.record.Record(data=source_record_dict)
+                        source_record.set_status(
+                            target_state=colrev.record.RecordState.md_processed
+                        )
             else:
                 print(toc_item)
                 print("Pre-imported records found for this toc_item (skipping)")
@@ -334,13 +338,19 @@ class CurationDedupe(JsonSchemaMixin):
         decision_list: list[dict] = []
         # decision_list =[{'ID1': ID1, 'ID2': ID2, 'decision': 'duplicate'}]
 
+        toc_index = self.__get_toc_index(
+            records_list=list(records.values()), toc_items=toc_items
+        )
+        source_toc_index = self.__get_toc_index(
+            records_list=source_records, toc_items=toc_items
+        )
+
         # match based on overlapping  colrev_ids
         for toc_item in tqdm(toc_items):
             processed_same_toc_records = [
                 r
-                for r in records.values()
-                if all(r.get(k, "NA") == v for k, v in toc_item.items())
-                and r[Fields.STATUS]
+                for r in self.__get_toc_records(toc_index=toc_index, toc_item=toc_item)
+                if r[Fields.STATUS]
                 not in [
                     colrev.record.RecordState.md_imported,
                     colrev.record.RecordState.md_needs_manual_preparation,
@@ -352,11 +362,9 @@ class CurationDedupe(JsonSchemaMixin):
                     for co in r[Fields.ORIGIN]
                 )
             ]
-            new_same_toc_records = [
-                r
-                for r in source_records
-                if all(r.get(k, "NA") == v for k, v in toc_item.items())
-            ]
+            new_same_toc_records = self.__get_toc_records(
+                toc_index=source_toc_index, toc_item=toc_item
+            )
             if len(new_same_toc_records) > 0:
                 # print(new_same_toc_records)
                 for new_same_toc_record in new_same_toc_records:
@@ -401,8 +409,8 @@ class CurationDedupe(JsonSchemaMixin):
         tuple_to_process: tuple,
         records: dict,
         decision_list: list,
-        curated_record_ids: list,
-        pdf_record_ids: list,
+        curated_record_ids: set,
+        pdf_record_ids: set,
     ) -> None:
         rec1 = records[tuple_to_process[0]]
         rec2 = records[tuple_to_process[1]]
@@ -472,13 +480,13 @@ class CurationDedupe(JsonSchemaMixin):
         decision_list: list[dict],
         toc_item: dict,
         records: dict,
-        source_records: list,
+        toc_index: dict,
+        source_toc_index: dict,
     ) -> None:
         processed_same_toc_records = [
             r
-            for r in records.values()
-            if all(r.get(k, "NA") == v for k, v in toc_item.items())
-            and r[Fields.STATUS]
+            for r in self.__get_toc_records(toc_index=toc_index, toc_item=toc_item)
+            if r[Fields.STATUS]
             not in [
                 colrev.record.RecordState.md_imported,
                 colrev.record.RecordState.md_needs_manual_preparation,
@@ -490,31 +498,26 @@ class CurationDedupe(JsonSchemaMixin):
                 for co in r[Fields.ORIGIN]
             )
         ]
-        pdf_same_toc_records = [
-            r
-            for r in source_records
-            if all(r.get(k, "NA") == v for k, v in toc_item.items())
-        ]
+        pdf_same_toc_records = self.__get_toc_records(
+            toc_index=source_toc_index, toc_item=toc_item
+        )
 
         references = pd.DataFrame.from_records(
             processed_same_toc_records + pdf_same_toc_records
         )
 
-        nr_entries = references.shape[0]
-        if nr_entries == 0:
+        if references.shape[0] == 0:
             return
-        similarity_array = np.zeros([nr_entries, nr_entries])
 
         # Note : min_similarity only means that the PDF will be considered
         # for validates_based_on_metadata(...), which is the acutal test!
-        similarity_array, tuples_to_process = self.__calculate_similarities(
-            similarity_array=similarity_array,
+        tuples_to_process = self.__calculate_similarities(
             references=references,
             min_similarity=0.7,
         )
 
-        curated_record_ids = [r[Fields.ID] for r in processed_same_toc_records]
-        pdf_record_ids = [r[Fields.ID] for r in pdf_same_toc_records]
+        curated_record_ids = {r[Fields.ID] for r in processed_same_toc_records}
+        pdf_record_ids = {r[Fields.ID] for r in pdf_same_toc_records}
         for tuple_to_process in tuples_to_process:
             self.__process_pdf_tuple(
                 tuple_to_process=tuple_to_process,
@@ -540,12 +543,20 @@ class CurationDedupe(JsonSchemaMixin):
         decision_list: list[dict] = []
         # decision_list =[{'ID1': ID1, 'ID2': ID2, 'decision': 'duplicate'}]
 
-        for toc_item in tqdm(self.__get_toc_items(records_list=source_records)):
+        toc_items = self.__get_toc_items(records_list=source_records)
+        toc_index = self.__get_toc_index(
+            records_list=list(records.values()), toc_items=toc_items
+        )
+        source_toc_index = self.__get_toc_index(
+            records_list=source_records, toc_items=toc_items
+        )
+        for toc_item in tqdm(toc_items):
             self.__dedupe_pdf_toc_item(
                 decision_list=decision_list,
                 toc_item=toc_item,
                 records=records,
-                source_records=source_records,
+                toc_index=toc_index,
+                source_toc_index=source_toc_index,
             )
 
         return decision_list
@@ -159,10 +159,13 @@ class CurationMissingDedupe(JsonSchemaMixin):
     def __print_same_toc_recs(
         self, *, same_toc_recs: list, record: colrev.record.Record
     ) -> list:
-        for same_toc_rec in same_toc_recs:
-            same_toc_rec["similarity"] = colrev.record.PrepRecord.get_record_similarity(
-                record_a=colrev.record.Record(data=same_toc_rec), record_b=record
-            )
+        if same_toc_recs:
+            similarities = colrev.record.Record.get_record_similarity_matrix(
+                records_a=[colrev.record.Record(data=r) for r in same_toc_recs],
+                records_b=[record],
+            )[:, 0]
+            for same_toc_rec, similarity in zip(same_toc_recs, similarities):
+                same_toc_rec["similarity"] = float(similarity)
 
         same_toc_recs = sorted(
             same_toc_recs, key=lambda d: d["similarity"], reverse=True
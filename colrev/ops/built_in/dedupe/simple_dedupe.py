@@ -2,6 +2,8 @@
 """Simple dedupe functionality (based on similarity thresholds) for small samples"""
 from __future__ import annotations
 
+import typing
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -10,7 +12,6 @@ import zope.interface
 from dataclasses_jsonschema import JsonSchemaMixin
 
 import colrev.env.package_manager
-import colrev.exceptions as colrev_exceptions
 import colrev.ops.built_in.dedupe.utils
 import colrev.record
 from colrev.constants import Colors
@@ -22,6 +23,47 @@ if TYPE_CHECKING:
 # pylint: disable=too-many-arguments
 # pylint: disable=too-few-public-methods
 
+# Note : the (dedupe-prepared) records are set once per (worker) process
+_RECORDS_LIST: typing.List[dict] = []
+# Candidate pairs are scored in a process pool if they exceed this number
+MIN_PAIRS_FOR_PROCESS_POOL = 20000
+
+
+def _set_records_list(records_list: list) -> None:
+    global _RECORDS_LIST  # pylint: disable=global-statement
+    _RECORDS_LIST = records_list
+
+
+def _get_maximum_similarity_record(task: typing.Tuple[int, list]) -> dict:
+    """Get the most similar preceding (candidate) record"""
+    index, candidate_indices = task
+    reference_record = _RECORDS_LIST[index]
+    max_similarity_record = {
+        "reference_record": reference_record[Fields.ID],
+        "record_id": "NA",
+        "similarity": 0,
+    }
+    if not candidate_indices:
+        return max_similarity_record
+
+    similarities = colrev.record.Record.get_similarity_matrix(
+        records_a=[_RECORDS_LIST[i] for i in candidate_indices],
+        records_b=[reference_record],
+    )[:, 0]
+    # Note : the first candidate with the maximum similarity is selected
+    best = int(similarities.argmax())
+    if similarities[best] > 0:
+        candidate_record = _RECORDS_LIST[candidate_indices[best]]
+        sim_details = colrev.record.Record.get_similarity_detailed(
+            record_a=candidate_record,
+            record_b=reference_record,
+        )
+        max_similarity_record["similarity"] = sim_details["score"]
+        max_similarity_record["record_id"] = candidate_record[Fields.ID]
+        max_similarity_record["details"] = sim_details["details"]
+
+    return max_similarity_record
+
 
 @zope.interface.implementer(colrev.env.package_manager.DedupePackageEndpointInterface)
 @dataclass
@@ -70,47 +112,17 @@ class SimpleDedupe(JsonSchemaMixin):
         assert self.settings.merging_dup_threshold >= 0.0
         assert self.settings.merging_dup_threshold <= 1.0
 
-    def __get_maximum_similarity_record(
-        self,
-        *,
-        records_batch: list,
-    ) -> dict:
-        max_similarity_record = {
-            "reference_record": records_batch[len(records_batch) - 1][Fields.ID],
-            "record_id": "NA",
-            "similarity": 0,
-        }
-        for i in range(0, len(records_batch) - 1):
-            sim_details = colrev.record.Record.get_similarity_detailed(
-                record_a=records_batch[i],
-                record_b=records_batch[len(records_batch) - 1],
-            )
-
-            if sim_details["score"] > max_similarity_record["similarity"]:
-                max_similarity_record["similarity"] = sim_details["score"]
-                max_similarity_record["record_id"] = records_batch[i][Fields.ID]
-                max_similarity_record["details"] = sim_details["details"]
-
-        return max_similarity_record
-
-    def __append_merges(self, *, batch_item: dict) -> dict:
-        records_batch = batch_item["queue"]
-
+    def __append_merges(self, *, similarity_dict: dict, first_record: bool) -> dict:
         # if the record is the first one added to the records
         # (in a preceding processing step), it can be propagated
-        if len(records_batch) < 2:
+        if first_record:
             return {
-                "ID1": batch_item["record"],
+                "ID1": similarity_dict["reference_record"],
                 "ID2": "NA",
                 "similarity": 1,
                 "decision": "no_duplicate",
             }
 
-        # df to get_similarities for each other record
-        similarity_dict = self.__get_maximum_similarity_record(
-            records_batch=records_batch
-        )
-
         max_similarity = similarity_dict["similarity"]
 
         ret = {}
@@ -200,19 +212,16 @@ class SimpleDedupe(JsonSchemaMixin):
                 colrev.record.RecordState.md_needs_manual_preparation,
             ]
         ]
-        if len(ids_to_dedupe) > 40:
-            if not self.review_manager.force_mode:
-                self.review_manager.logger.warning(
-                    "Simple duplicate identification selected despite sufficient sample size.\n"
-                    "Active learning algorithms may perform better:\n"
-                    f"{Colors.ORANGE}   colrev settings -m 'dedupe.dedupe_package_endpoints="
-                    '[{"endpoint": "colrev.active_learning_training"},'
-                    f'{{"endpoint": "colrev.active_learning_automated"}}]\'{Colors.END}'
-                )
-                raise colrev_exceptions.CoLRevException(
-                    "To use simple duplicate identification, use\n"
-                    f"{Colors.ORANGE}    colrev dedupe --force{Colors.END}"
-                )
+        # Note : candidate pairs are selected based on blocking keys.
+        # Larger samples are supported but active learning may perform better.
+        if len(ids_to_dedupe) > 40 and not self.review_manager.force_mode:
+            self.review_manager.logger.warning(
+                "Simple duplicate identification selected despite sufficient sample size.\n"
+                "Active learning algorithms may perform better:\n"
+                f"{Colors.ORANGE}   colrev settings -m 'dedupe.dedupe_package_endpoints="
+                '[{"endpoint": "colrev.active_learning_training"},'
+                f'{{"endpoint": "colrev.active_learning_automated"}}]\'{Colors.END}'
+            )
 
         nr_tasks = len(ids_to_dedupe)
         dedupe_data = {
@@ -225,32 +234,50 @@ class SimpleDedupe(JsonSchemaMixin):
         # )
         return dedupe_data
 
-    def __get_record_batch(self, *, dedupe_data: dict) -> list:
+    def __get_records_list(self, *, dedupe_data: dict) -> list:
         records = self.review_manager.dataset.load_records_dict()
 
         # Note: Because we only introduce individual (non-merged records),
         # there should be no semicolons in colrev_origin!
-        records_queue = [
-            record
-            for ID, record in records.items()
-            if ID in dedupe_data["queue"]  # type: ignore
-        ]
+        queue_ids = set(dedupe_data["queue"])
+        records_queue = [record for ID, record in records.items() if ID in queue_ids]
 
         records_df_queue = pd.DataFrame.from_records(records_queue)
         records = self.dedupe_operation.prep_records(records_df=records_df_queue)
         # dedupe.review_manager.p_printer.pprint(records.values())
 
-        items_start = dedupe_data["items_start"]
-        items_start = 0
-        batch_data = []
-        for i in range(items_start, len(dedupe_data["queue"])):  # type: ignore
-            batch_data.append(
-                {
-                    "record": dedupe_data["queue"][i],  # type: ignore
-                    "queue": list(records.values())[: i + 1],
-                }
+        return list(records.values())
+
+    def __get_similarity_dicts(self, *, records_list: list) -> list:
+        """Get the most similar preceding record for each record (in the queue order)
+
+        Only candidate pairs (sharing a blocking key) are compared.
+        """
+
+        candidate_pairs = colrev.ops.built_in.dedupe.utils.get_candidate_pairs(
+            records_list
+        )
+        tasks = [
+            (index, candidate_pairs.get(index, []))
+            for index in range(1, len(records_list))
+        ]
+        nr_pairs = sum(len(candidates) for _, candidates in tasks)
+        self.review_manager.logger.info(
+            f"Compare {nr_pairs} candidate pairs (blocking)"
+        )
+
+        if nr_pairs < MIN_PAIRS_FOR_PROCESS_POOL:
+            _set_records_list(records_list)
+            return [_get_maximum_similarity_record(task) for task in tasks]
+
+        with ProcessPoolExecutor(
+            max_workers=self.dedupe_operation.cpus,
+            initializer=_set_records_list,
+            initargs=(records_list,),
+        ) as executor:
+            return list(
+                executor.map(_get_maximum_similarity_record, tasks, chunksize=100)
             )
-        return batch_data
 
     def __process_potential_duplicates(self, *, dedupe_batch_results: list) -> list:
         potential_duplicates = [
@@ -327,11 +354,17 @@ class SimpleDedupe(JsonSchemaMixin):
             self.review_manager.logger.error("No records to dedupe")
             return
 
-        batch_data = self.__get_record_batch(dedupe_data=dedupe_data)
-
-        dedupe_batch_results = []
-        for item in batch_data:
-            merge_item = self.__append_merges(batch_item=item)
+        records_list = self.__get_records_list(dedupe_data=dedupe_data)
+        dedupe_batch_results = [
+            self.__append_merges(
+                similarity_dict={"reference_record": records_list[0][Fields.ID]},
+                first_record=True,
+            )
+        ]
+        for similarity_dict in self.__get_similarity_dicts(records_list=records_list):
+            merge_item = self.__append_merges(
+                similarity_dict=similarity_dict, first_record=False
+            )
             dedupe_batch_results.append(merge_item)
 
         # dedupe_batch[-1]['queue'].to_csv('last_records.csv')
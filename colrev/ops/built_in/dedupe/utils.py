@@ -1,12 +1,20 @@
 #! /usr/bin/env python
 """Utils for deduplication"""
+import collections
 import os
 import time
+import typing
 
 import colrev.record
+from colrev.constants import Fields
 
 # pylint: disable=too-many-arguments
 
+TITLE_NGRAM_SIZE = 3
+# Note : blocks exceeding the maximum size (e.g., frequent title n-grams)
+# are not distinctive and would lead to a quadratic number of candidate pairs
+MAX_BLOCK_SIZE = 500
+
 
 def console_duplicate_instance_label(
     record_pair: list,
@@ -64,3 +72,68 @@ def console_duplicate_instance_label(
                 if user_input in valid_responses:
                     valid_response = True
     return user_input
+
+
+def __get_value(record_dict: dict, key: str) -> str:
+    value = str(record_dict.get(key, ""))
+    if value.lower() in ["nan", "none", "unknown"]:
+        return ""
+    return value
+
+
+def get_blocking_keys(record_dict: dict) -> set:
+    """Get the blocking keys of a (dedupe-prepared) record
+
+    Keys: normalized title n-grams, first-author surname and year,
+    container title, year and volume
+    """
+
+    blocking_keys = set()
+    title_tokens = (
+        __get_value(record_dict, Fields.TITLE).lower().replace(",", " ").split()
+    )
+    if title_tokens:
+        ngram_size = min(TITLE_NGRAM_SIZE, len(title_tokens))
+        for i in range(len(title_tokens) - ngram_size + 1):
+            blocking_keys.add("title:" + " ".join(title_tokens[i : i + ngram_size]))
+
+    year = __get_value(record_dict, Fields.YEAR)
+    surname = (
+        __get_value(record_dict, Fields.AUTHOR)
+        .split(",", maxsplit=1)[0]
+        .strip()
+        .lower()
+    )
+    if surname and year:
+        blocking_keys.add(f"author_year:{surname}|{year}")
+
+    container_title = __get_value(record_dict, "container_title").lower()
+    if container_title and year:
+        volume = __get_value(record_dict, Fields.VOLUME)
+        blocking_keys.add(f"container_year_volume:{container_title}|{year}|{volume}")
+
+    return blocking_keys
+
+
+def get_candidate_pairs(
+    records: list, *, max_block_size: int = MAX_BLOCK_SIZE
+) -> typing.Dict[int, list]:
+    """Get the candidate pairs for a list of (dedupe-prepared) records
+
+    Returns a dict mapping the index of each record to the (sorted) indices
+    of preceding records that share at least one blocking key.
+    """
+
+    blocks = collections.defaultdict(list)
+    for index, record_dict in enumerate(records):
+        for blocking_key in get_blocking_keys(record_dict):
+            blocks[blocking_key].append(index)
+
+    candidates: typing.Dict[int, set] = collections.defaultdict(set)
+    for indices in blocks.values():
+        if len(indices) < 2 or len(indices) > max_block_size:
+            continue
+        for position, index in enumerate(indices):
+            candidates[index].update(indices[:position])
+
+    return {index: sorted(indices) for index, indices in candidates.items() if indices}
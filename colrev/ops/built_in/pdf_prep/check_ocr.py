@@ -54,9 +54,10 @@ class PDFCheckOCR(JsonSchemaMixin):
     def __apply_ocr(
         self,
         *,
-        review_manager: colrev.review_manager.ReviewManager,
+        pdf_prep_operation: colrev.ops.pdf_prep.PDFPrep,
         record: colrev.record.Record,
     ) -> colrev.record.Record:
+        review_manager = pdf_prep_operation.review_manager
         pdf_path = review_manager.path / Path(record.data[Fields.FILE])
         non_ocred_filename = Path(str(pdf_path).replace(".pdf", "_no_ocr.pdf"))
         pdf_path.rename(non_ocred_filename)
@@ -88,7 +89,10 @@ class PDFCheckOCR(JsonSchemaMixin):
         record.add_data_provenance_note(
             key=Fields.FILE, note="pdf_processed with OCRMYPDF"
         )
-        record.set_text_from_pdf()
+        # Note : the file changed (a new document context is created)
+        record.set_text_from_pdf(
+            pdf_document=pdf_prep_operation.get_pdf_document(record=record)
+        )
         return record
 
     # pylint: disable=unused-argument
@@ -114,7 +118,7 @@ class PDFCheckOCR(JsonSchemaMixin):
                 f"apply_ocr({record.data[Fields.ID]})"
             )
             record = self.__apply_ocr(
-                review_manager=self.review_manager,
+                pdf_prep_operation=pdf_prep_operation,
                 record=record,
             )
 
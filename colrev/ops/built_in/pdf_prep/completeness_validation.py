@@ -15,6 +15,7 @@ import colrev.record
 from colrev.constants import Fields
 
 if TYPE_CHECKING:
+    import colrev.env.pdf_document
     import colrev.ops.pdf_prep
 
 # pylint: disable=too-few-public-methods
@@ -51,6 +52,7 @@ class PDFCompletenessValidation(JsonSchemaMixin):
         *,
         record: colrev.record.Record,
         nr_pages_metadata: int,
+        pdf_document: colrev.env.pdf_document.PDFDocumentContext,
     ) -> bool:
         if 10 < nr_pages_metadata < record.data["pages_in_file"]:
             text = record.extract_text_by_page(
@@ -59,6 +61,7 @@ class PDFCompletenessValidation(JsonSchemaMixin):
                     record.data["pages_in_file"] - 2,
                     record.data["pages_in_file"] - 1,
                 ],
+                pdf_document=pdf_document,
             )
             if "appendi" in text.lower():
                 return True
@@ -72,6 +75,8 @@ class PDFCompletenessValidation(JsonSchemaMixin):
     ) -> dict:
         """Prepare the PDF by validating completeness (based on number of pages)"""
 
+        # pylint: disable=too-many-locals
+
         if colrev.record.RecordState.pdf_imported != record.data.get(
             Fields.STATUS, "NA"
         ):
@@ -122,8 +127,9 @@ class PDFCompletenessValidation(JsonSchemaMixin):
         full_version_purchase_notice = (
             "morepagesareavailableinthefullversionofthisdocument,whichmaybepurchas"
         )
+        pdf_document = pdf_prep_operation.get_pdf_document(record=record)
         if full_version_purchase_notice in record.extract_text_by_page(
-            pages=[0, 1]
+            pages=[0, 1], pdf_document=pdf_document
         ).replace(" ", ""):
             msg = (
                 f"{record.data[Fields.ID]}".ljust(pad - 1, " ")
@@ -173,6 +179,7 @@ class PDFCompletenessValidation(JsonSchemaMixin):
             if self.__longer_with_appendix(
                 record=record,
                 nr_pages_metadata=nr_pages_metadata,
+                pdf_document=pdf_document,
             ):
                 pass
             else:
@@ -10,17 +10,16 @@ from typing import TYPE_CHECKING
 
 import zope.interface
 from dataclasses_jsonschema import JsonSchemaMixin
-from PyPDF2 import PdfFileReader
 
 import colrev.env.package_manager
 import colrev.env.utils
-import colrev.qm.colrev_pdf_id
 import colrev.record
 from colrev.constants import Fields
 
 # pylint: disable=duplicate-code
 
 if TYPE_CHECKING:
+    import colrev.env.pdf_document
     import colrev.ops.pdf_prep
 
 # pylint: disable=too-few-public-methods
@@ -115,19 +114,18 @@ class PDFCoverPage(JsonSchemaMixin):
                 ):
                     coverpages.append(1)
 
-    def __get_coverpages(self, *, pdf: str) -> typing.List[int]:
+    def __get_coverpages(
+        self, *, pdf_document: colrev.env.pdf_document.PDFDocumentContext
+    ) -> typing.List[int]:
         coverpages: typing.List[int] = []
 
         try:
-            pdf_reader = PdfFileReader(str(pdf), strict=False)
+            if pdf_document.get_number_of_pages() == 1:
+                return coverpages
         except ValueError:
             return coverpages
 
-        if len(pdf_reader.pages) == 1:
-            return coverpages
-
-        first_page_average_hash_16 = colrev.qm.colrev_pdf_id.get_pdf_hash(
-            pdf_path=Path(pdf),
+        first_page_average_hash_16 = pdf_document.get_page_hash(
             page_nr=1,
             hash_size=16,
         )
@@ -150,10 +148,10 @@ class PDFCoverPage(JsonSchemaMixin):
         if str(first_page_average_hash_16) in first_page_hashes:
             coverpages.append(0)
 
-        res = pdf_reader.getPage(0).extract_text()
+        res = pdf_document.get_page_text(page_nr=0)
         page0 = res.replace(" ", "").replace("\n", "").lower()
 
-        res = pdf_reader.getPage(1).extract_text()
+        res = pdf_document.get_page_text(page_nr=1)
         page1 = res.replace(" ", "").replace("\n", "").lower()
 
         # input(page0)
@@ -183,7 +181,9 @@ class PDFCoverPage(JsonSchemaMixin):
         cp_path = local_index.local_environment_path / Path(".coverpages")
         cp_path.mkdir(exist_ok=True)
 
-        coverpages = self.__get_coverpages(pdf=record.data[Fields.FILE])
+        coverpages = self.__get_coverpages(
+            pdf_document=pdf_prep_operation.get_pdf_document(record=record)
+        )
         if not coverpages:
             return record.data
         if coverpages:
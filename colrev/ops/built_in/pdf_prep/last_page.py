@@ -10,7 +10,6 @@ from typing import TYPE_CHECKING
 
 import zope.interface
 from dataclasses_jsonschema import JsonSchemaMixin
-from PyPDF2 import PdfFileReader
 
 import colrev.env.package_manager
 import colrev.env.utils
@@ -20,6 +19,7 @@ from colrev.constants import Fields
 # pylint: disable=duplicate-code
 
 if TYPE_CHECKING:
+    import colrev.env.pdf_document
     import colrev.ops.pdf_prep
 
 # pylint: disable=too-few-public-methods
@@ -56,17 +56,16 @@ class PDFLastPage(JsonSchemaMixin):
         lp_path = local_index.local_environment_path / Path(".lastpages")
         lp_path.mkdir(exist_ok=True)
 
-        def __get_last_pages(*, pdf: str) -> typing.List[int]:
+        def __get_last_pages(
+            *, pdf_document: colrev.env.pdf_document.PDFDocumentContext
+        ) -> typing.List[int]:
             last_pages: typing.List[int] = []
             try:
-                pdf_reader = PdfFileReader(str(pdf), strict=False)
+                last_page_nr = pdf_document.get_number_of_pages() - 1
             except ValueError:
                 return last_pages
 
-            last_page_nr = len(pdf_reader.pages) - 1
-
-            last_page_average_hash_16 = colrev.qm.colrev_pdf_id.get_pdf_hash(
-                pdf_path=Path(pdf),
+            last_page_average_hash_16 = pdf_document.get_page_hash(
                 page_nr=last_page_nr + 1,
                 hash_size=16,
             )
@@ -90,7 +89,7 @@ class PDFLastPage(JsonSchemaMixin):
             if str(last_page_average_hash_16) in last_page_hashes:
                 last_pages.append(last_page_nr)
 
-            res = pdf_reader.getPage(last_page_nr).extract_text()
+            res = pdf_document.get_page_text(page_nr=last_page_nr)
             last_page_text = res.replace(" ", "").replace("\n", "").lower()
 
             # ME Sharpe last page
@@ -115,7 +114,9 @@ class PDFLastPage(JsonSchemaMixin):
 
             return list(set(last_pages))
 
-        last_pages = __get_last_pages(pdf=record.data[Fields.FILE])
+        last_pages = __get_last_pages(
+            pdf_document=pdf_prep_operation.get_pdf_document(record=record)
+        )
         if not last_pages:
             return record.data
         if last_pages:
@@ -3,8 +3,8 @@
 from __future__ import annotations
 
 import re
+import typing
 from dataclasses import dataclass
-from pathlib import Path
 from typing import TYPE_CHECKING
 
 import zope.interface
@@ -17,6 +17,7 @@ import colrev.record
 from colrev.constants import Fields
 
 if TYPE_CHECKING:
+    import colrev.env.pdf_document
     import colrev.ops.pdf_prep
 
 # pylint: disable=too-few-public-methods
@@ -43,13 +44,16 @@ class PDFMetadataValidation(JsonSchemaMixin):
         self,
         *,
         record: colrev.record.Record,
+        pdf_document: typing.Optional[
+            colrev.env.pdf_document.PDFDocumentContext
+        ] = None,
     ) -> dict:
         """Validates the PDF based on the metadata (record)"""
 
         validation_info = {"msgs": [], "pdf_prep_hints": [], "validates": True}
 
         if "text_from_pdf" not in record.data:
-            record.set_text_from_pdf()
+            record.set_text_from_pdf(pdf_document=pdf_document)
 
         text = record.data["text_from_pdf"]
         text = text.replace(" ", "").replace("\n", "").lower()
@@ -143,10 +147,9 @@ class PDFMetadataValidation(JsonSchemaMixin):
         try:
             retrieved_record = local_index.retrieve(record_dict=record.data)
 
-            pdf_path = pdf_prep_operation.review_manager.path / Path(
-                record.data[Fields.FILE]
-            )
-            current_cpid = record.get_colrev_pdf_id(pdf_path=pdf_path)
+            current_cpid = pdf_prep_operation.get_pdf_document(
+                record=record
+            ).get_colrev_pdf_id()
 
             if "colrev_pdf_id" in retrieved_record:
                 if retrieved_record["colrev_pdf_id"] == str(current_cpid):
@@ -161,7 +164,10 @@ class PDFMetadataValidation(JsonSchemaMixin):
         except colrev_exceptions.RecordNotInIndexException:
             pass
 
-        validation_info = self.validates_based_on_metadata(record=record)
+        validation_info = self.validates_based_on_metadata(
+            record=record,
+            pdf_document=pdf_prep_operation.get_pdf_document(record=record),
+        )
         if not validation_info["validates"]:
             for msg in validation_info["msgs"]:
                 pdf_prep_operation.review_manager.report_logger.error(msg)
@@ -47,6 +47,14 @@ class LocalIndexPrep(JsonSchemaMixin):
             source_operation=prep_operation
         )
 
+    def prefetch(
+        self,
+        prep_operation: colrev.ops.prep.Prep,  # pylint: disable=unused-argument
+        records: list,
+    ) -> None:
+        """Retrieve the LocalIndex data for all records (in one batch)"""
+        self.local_index_source.local_index.prefetch(records=records)
+
     def prepare(
         self, prep_operation: colrev.ops.prep.Prep, record: colrev.record.PrepRecord
     ) -> colrev.record.Record:
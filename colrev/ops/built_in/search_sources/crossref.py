@@ -493,11 +493,9 @@ class CrossrefSearchSource(JsonSchemaMixin):
             try:
                 self.crossref_lock.acquire(timeout=120)
 
-                # Note : need to reload file because the object is not shared between processes
-                crossref_feed = self.search_source.get_feed(
-                    review_manager=self.review_manager,
+                crossref_feed = prep_operation.get_feed(
+                    search_source=self.search_source,
                     source_identifier=self.source_identifier,
-                    update_only=False,
                 )
 
                 crossref_feed.set_id(record_dict=retrieved_record.data)
@@ -514,7 +512,7 @@ class CrossrefSearchSource(JsonSchemaMixin):
                 )
 
                 if save_feed:
-                    crossref_feed.save_feed_file()
+                    prep_operation.register_feed_change(feed=crossref_feed)
 
             except (
                 colrev_exceptions.InvalidMerge,
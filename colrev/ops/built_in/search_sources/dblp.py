@@ -689,12 +689,9 @@ class DBLPSearchSource(JsonSchemaMixin):
                 try:
                     self.dblp_lock.acquire(timeout=60)
 
-                    # Note : need to reload file
-                    # because the object is not shared between processes
-                    dblp_feed = self.search_source.get_feed(
-                        review_manager=prep_operation.review_manager,
+                    dblp_feed = prep_operation.get_feed(
+                        search_source=self.search_source,
                         source_identifier=self.source_identifier,
-                        update_only=False,
                     )
 
                     dblp_feed.set_id(record_dict=retrieved_record.data)
@@ -717,7 +714,7 @@ class DBLPSearchSource(JsonSchemaMixin):
                         record.prescreen_exclude(reason=FieldValues.RETRACTED)
                         record.remove_field(key="warning")
 
-                    dblp_feed.save_feed_file()
+                    prep_operation.register_feed_change(feed=dblp_feed)
                     self.dblp_lock.release()
                     return record
 
@@ -329,11 +329,9 @@ class EuropePMCSearchSource(JsonSchemaMixin):
                 if similarity > prep_operation.retrieval_similarity:
                     self.europe_pmc_lock.acquire(timeout=60)
 
-                    # Note : need to reload file because the object is not shared between processes
-                    europe_pmc_feed = self.search_source.get_feed(
-                        review_manager=prep_operation.review_manager,
+                    europe_pmc_feed = prep_operation.get_feed(
+                        search_source=self.search_source,
                         source_identifier=self.source_identifier,
-                        update_only=False,
                     )
 
                     try:
@@ -356,7 +354,7 @@ class EuropePMCSearchSource(JsonSchemaMixin):
                         target_state=colrev.record.RecordState.md_prepared
                     )
 
-                    europe_pmc_feed.save_feed_file()
+                    prep_operation.register_feed_change(feed=europe_pmc_feed)
                     self.europe_pmc_lock.release()
                     return record
 
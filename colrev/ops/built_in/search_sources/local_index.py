@@ -413,11 +413,9 @@ class LocalIndexSearchSource(JsonSchemaMixin):
             # lock: to prevent different records from having the same origin
             self.local_index_lock.acquire(timeout=60)
 
-            # Note : need to reload file because the object is not shared between processes
-            local_index_feed = self.search_source.get_feed(
-                review_manager=self.review_manager,
+            local_index_feed = prep_operation.get_feed(
+                search_source=self.search_source,
                 source_identifier=self.source_identifier,
-                update_only=False,
             )
 
             local_index_feed.set_id(record_dict=retrieved_record.data)
@@ -457,7 +455,7 @@ class LocalIndexSearchSource(JsonSchemaMixin):
                     break
 
             try:
-                local_index_feed.save_feed_file()
+                prep_operation.register_feed_change(feed=local_index_feed)
                 # extend fields_to_keep (to retrieve all fields from the index)
                 for key in record.data.keys():
                     if key not in prep_operation.fields_to_keep:
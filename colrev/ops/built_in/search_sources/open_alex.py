@@ -184,7 +184,7 @@ class OpenAlexSearchSource(JsonSchemaMixin):
             record.remove_field(key=Fields.LANGUAGE)
 
     def __get_masterdata_record(
-        self, *, record: colrev.record.Record
+        self, *, prep_operation: colrev.ops.prep.Prep, record: colrev.record.Record
     ) -> colrev.record.Record:
         try:
             retrieved_record = self.__parse_item_to_record(
@@ -193,11 +193,9 @@ class OpenAlexSearchSource(JsonSchemaMixin):
 
             self.open_alex_lock.acquire(timeout=120)
 
-            # Note : need to reload file because the object is not shared between processes
-            open_alex_feed = self.search_source.get_feed(
-                review_manager=self.review_manager,
+            open_alex_feed = prep_operation.get_feed(
+                search_source=self.search_source,
                 source_identifier=self.source_identifier,
-                update_only=False,
             )
 
             open_alex_feed.set_id(record_dict=retrieved_record.data)
@@ -211,7 +209,7 @@ class OpenAlexSearchSource(JsonSchemaMixin):
                 merging_record=retrieved_record,
                 default_source=retrieved_record.data[Fields.ORIGIN][0],
             )
-            open_alex_feed.save_feed_file()
+            prep_operation.register_feed_change(feed=open_alex_feed)
         except (
             colrev_exceptions.InvalidMerge,
             colrev_exceptions.RecordNotParsableException,
@@ -245,7 +243,9 @@ class OpenAlexSearchSource(JsonSchemaMixin):
             # record = self.__check_doi_masterdata(record=record)
             return record
 
-        record = self.__get_masterdata_record(record=record)
+        record = self.__get_masterdata_record(
+            prep_operation=prep_operation, record=record
+        )
 
         return record
 
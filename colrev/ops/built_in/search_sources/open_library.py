@@ -283,10 +283,9 @@ class OpenLibrarySearchSource(JsonSchemaMixin):
             )
 
             self.open_library_lock.acquire(timeout=60)
-            open_library_feed = self.search_source.get_feed(
-                review_manager=prep_operation.review_manager,
+            open_library_feed = prep_operation.get_feed(
+                search_source=self.search_source,
                 source_identifier=self.source_identifier,
-                update_only=False,
             )
 
             open_library_feed.set_id(record_dict=retrieved_record.data)
@@ -297,7 +296,7 @@ class OpenLibrarySearchSource(JsonSchemaMixin):
                 merging_record=retrieved_record,
                 default_source=retrieved_record.data[Fields.ORIGIN][0],
             )
-            open_library_feed.save_feed_file()
+            prep_operation.register_feed_change(feed=open_library_feed)
             self.open_library_lock.release()
 
         except (
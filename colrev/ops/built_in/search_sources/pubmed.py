@@ -438,11 +438,9 @@ class PubMedSearchSource(JsonSchemaMixin):
             try:
                 self.pubmed_lock.acquire(timeout=60)
 
-                # Note : need to reload file because the object is not shared between processes
-                pubmed_feed = self.search_source.get_feed(
-                    review_manager=self.review_manager,
+                pubmed_feed = prep_operation.get_feed(
+                    search_source=self.search_source,
                     source_identifier=self.source_identifier,
-                    update_only=False,
                 )
 
                 pubmed_feed.set_id(record_dict=retrieved_record.data)
@@ -459,7 +457,7 @@ class PubMedSearchSource(JsonSchemaMixin):
                 )
                 record.set_status(target_state=colrev.record.RecordState.md_prepared)
                 if save_feed:
-                    pubmed_feed.save_feed_file()
+                    prep_operation.register_feed_change(feed=pubmed_feed)
                 try:
                     self.pubmed_lock.release()
                 except ValueError:
@@ -201,6 +201,7 @@ class Commit:
     def create(self, *, skip_status_yaml: bool = False) -> bool:
         """Create a commit (including the commit message and details)"""
 
+        self.review_manager.dataset.merge_decision_journal()
         if self.review_manager.dataset.has_changes():
             self.review_manager.logger.debug("Prepare commit: checks and updates")
             if not skip_status_yaml:
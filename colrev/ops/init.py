@@ -78,7 +78,7 @@ class Initializer:
             raise colrev_exceptions.ParameterError(
                 parameter="init.review_type",
                 value=f"'{review_type}'",
-                options=list(res.all_available_packages_names.keys()),
+                options=res.all_available_packages_names,
             ) from exc
 
         self.__check_init_precondition()
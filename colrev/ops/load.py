@@ -2,12 +2,11 @@
 """CoLRev load operation: Load records from search sources into references.bib."""
 from __future__ import annotations
 
-import itertools
-import string
 from pathlib import Path
 
 import colrev.constants as c
 import colrev.exceptions as colrev_exceptions
+import colrev.id_allocator
 import colrev.operation
 import colrev.ops.load_utils_formatter
 import colrev.record
@@ -230,6 +229,7 @@ class Load(colrev.operation.Operation):
     ) -> None:
         self.__setup_source_for_load(source=source)
         records = self.review_manager.dataset.load_records_dict()
+        id_allocator = colrev.id_allocator.IDAllocator(existing_ids=records.keys())
         for source_record in source.search_source.source_records_list:
             colrev.record.Record(data=source_record).prefix_non_standardized_field_keys(
                 prefix=source.search_source.endpoint
@@ -238,18 +238,9 @@ class Load(colrev.operation.Operation):
             source_record = self.__import_record(record_dict=source_record)
 
             # Make sure not to replace existing records
-            order = 0
-            letters = list(string.ascii_lowercase)
-            next_unique_id = source_record[Fields.ID]
-            appends: list = []
-            while next_unique_id in records:
-                if len(appends) == 0:
-                    order += 1
-                    appends = list(itertools.product(letters, repeat=order))
-                next_unique_id = source_record[Fields.ID] + "".join(
-                    list(appends.pop(0))
-                )
-            source_record[Fields.ID] = next_unique_id
+            source_record[Fields.ID] = id_allocator.allocate(
+                temp_id=source_record[Fields.ID]
+            )
 
             records[source_record[Fields.ID]] = source_record
 
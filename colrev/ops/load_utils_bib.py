@@ -32,6 +32,7 @@ import typing
 from typing import TYPE_CHECKING
 
 import colrev.exceptions as colrev_exceptions
+import colrev.id_allocator
 from colrev.constants import Fields
 
 if TYPE_CHECKING:
@@ -83,7 +84,7 @@ def __apply_file_fixes(
     # Errors to fix before pybtex loading:
     # - set_incremental_ids (otherwise, not all records will be loaded)
     # - fix_keys (keys containing white spaces)
-    record_ids: typing.List[str] = []
+    id_allocator = colrev.id_allocator.IDAllocator()
     with open(source.filename, "r+b") as file:
         seekpos = file.tell()
         line = file.readline()
@@ -100,10 +101,10 @@ def __apply_file_fixes(
                     ).encode("utf-8")
                     seekpos = fix_key(file, line, replacement_line, seekpos)
 
-                if current_id_str in record_ids:
+                if current_id_str in id_allocator:
                     next_id = (
                         load_operation.review_manager.dataset.generate_next_unique_id(
-                            temp_id=current_id_str, existing_ids=record_ids
+                            temp_id=current_id_str, existing_ids=id_allocator
                         )
                     )
                     load_operation.review_manager.logger.info(
@@ -127,10 +128,10 @@ def __apply_file_fixes(
                     file.truncate()  # if the replacement is shorter...
                     file.seek(seekpos)
 
-                    record_ids.append(next_id)
+                    id_allocator.add(record_id=next_id)
 
                 else:
-                    record_ids.append(current_id_str)
+                    id_allocator.add(record_id=current_id_str)
 
             # Fix keys
             if re.match(r"^\s*[a-zA-Z0-9]+\s+[a-zA-Z0-9]+\s*\=", line.decode("utf-8")):
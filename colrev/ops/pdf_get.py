@@ -355,14 +355,17 @@ class PDFGet(colrev.operation.Operation):
 
                 max_similarity = 0.0
                 max_sim_record = None
-                for record in records.values():
-                    sim = colrev.record.Record.get_record_similarity(
-                        record_a=colrev.record.Record(data=pdf_record),
-                        record_b=colrev.record.Record(data=record.copy()),
-                    )
-                    if sim > max_similarity:
-                        max_similarity = sim
-                        max_sim_record = record
+                if records:
+                    similarities = colrev.record.Record.get_record_similarity_matrix(
+                        records_a=[colrev.record.Record(data=pdf_record)],
+                        records_b=[
+                            colrev.record.Record(data=r) for r in records.values()
+                        ],
+                    )[0]
+                    best = int(similarities.argmax())
+                    if similarities[best] > 0:
+                        max_similarity = similarities[best]
+                        max_sim_record = list(records.values())[best]
                 if max_sim_record:
                     if max_similarity > 0.5:
                         if (
@@ -398,8 +401,7 @@ class PDFGet(colrev.operation.Operation):
                         # if RecordState.pdf_needs_manual_preparation == colrev_status:
                         #     # revert?
             else:
-                record = records[file.stem]
-                self.link_pdf(record=colrev.record.Record(data=record))
+                self.link_pdf(record=colrev.record.Record(data=records[file.stem]))
 
         self.review_manager.dataset.save_records_dict(records=records)
 
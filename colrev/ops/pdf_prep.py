@@ -5,11 +5,16 @@ from __future__ import annotations
 import logging
 import multiprocessing as mp
 import os
+import threading
+import typing
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
 from multiprocessing.pool import ThreadPool as Pool
 from pathlib import Path
 
 import requests
 
+import colrev.env.pdf_document
 import colrev.exceptions as colrev_exceptions
 import colrev.operation
 import colrev.ops.built_in.pdf_prep.tei_prep
@@ -17,10 +22,55 @@ import colrev.record
 from colrev.constants import Colors
 from colrev.constants import Fields
 
+# Note : in the process-pool mode, each worker process prepares PDFs with its own
+# PDFPrep operation (endpoints are loaded once per process)
+_PDF_PREP_OPERATION: typing.Optional[PDFPrep] = None
+
+
+def _initialize_pdf_prep_worker(path_str: str, verbose_mode: bool) -> None:
+    global _PDF_PREP_OPERATION  # pylint: disable=global-statement
+    # pylint: disable=import-outside-toplevel
+    # pylint: disable=redefined-outer-name
+    # pylint: disable=cyclic-import
+    import colrev.review_manager
+
+    review_manager = colrev.review_manager.ReviewManager(
+        path_str=path_str, verbose_mode=verbose_mode, high_level_operation=True
+    )
+    _PDF_PREP_OPERATION = review_manager.get_pdf_prep_operation(
+        notify_state_transition_operation=False
+    )
+    _PDF_PREP_OPERATION.load_pdf_prep_package_endpoints()
+
+
+def _prepare_pdf_in_process(item: dict) -> dict:
+    """Prepare a PDF in a worker process and return the changed fields"""
+    assert _PDF_PREP_OPERATION is not None
+    original_record_dict = deepcopy(item["record"])
+    record_dict = _PDF_PREP_OPERATION.prepare_pdf(item)
+    return {
+        Fields.ID: original_record_dict[Fields.ID],
+        "changed": {
+            k: v
+            for k, v in record_dict.items()
+            if k not in original_record_dict or original_record_dict[k] != v
+        },
+        "removed": [k for k in original_record_dict if k not in record_dict],
+    }
+
+
+def _get_colrev_pdf_id_in_process(
+    task: typing.Tuple[str, str]
+) -> typing.Tuple[str, str]:
+    record_id, pdf_path = task
+    return record_id, colrev.record.Record.get_colrev_pdf_id(pdf_path=Path(pdf_path))
+
 
 class PDFPrep(colrev.operation.Operation):
     """Prepare PDFs"""
 
+    # pylint: disable=too-many-instance-attributes
+
     to_prepare: int
     pdf_prepared: int
     not_prepared: int
@@ -46,6 +96,40 @@ class PDFPrep(colrev.operation.Operation):
 
         self.cpus = 4
 
+        self.__pdf_documents: typing.Dict[
+            str, colrev.env.pdf_document.PDFDocumentContext
+        ] = {}
+        self.__pdf_documents_lock = threading.Lock()
+
+    def get_pdf_document(
+        self, *, record: colrev.record.Record
+    ) -> colrev.env.pdf_document.PDFDocumentContext:
+        """Get the PDF document context of the record (shared by the endpoints)
+
+        The context is created once per record and re-created when the file changes.
+        """
+        pdf_path = self.review_manager.path / Path(record.data[Fields.FILE])
+        with self.__pdf_documents_lock:
+            pdf_document = self.__pdf_documents.get(record.data[Fields.ID], None)
+            if (
+                pdf_document is None
+                or pdf_document.pdf_path != pdf_path
+                or not pdf_document.is_valid()
+            ):
+                if pdf_document is not None:
+                    pdf_document.close()
+                pdf_document = colrev.env.pdf_document.PDFDocumentContext(
+                    pdf_path=pdf_path
+                )
+                self.__pdf_documents[record.data[Fields.ID]] = pdf_document
+            return pdf_document
+
+    def __close_pdf_document(self, *, record_id: str) -> None:
+        with self.__pdf_documents_lock:
+            pdf_document = self.__pdf_documents.pop(record_id, None)
+        if pdf_document is not None:
+            pdf_document.close()
+
     def __complete_successful_pdf_prep(
         self, *, record: colrev.record.Record, original_filename: str
     ) -> None:
@@ -54,7 +138,9 @@ class PDFPrep(colrev.operation.Operation):
         if pdf_path.suffix == ".pdf":
             try:
                 record.data.update(
-                    colrev_pdf_id=record.get_colrev_pdf_id(pdf_path=pdf_path)
+                    colrev_pdf_id=self.get_pdf_document(
+                        record=record
+                    ).get_colrev_pdf_id()
                 )
             except colrev_exceptions.ServiceNotAvailableException:
                 self.review_manager.logger.error(
@@ -130,7 +216,7 @@ class PDFPrep(colrev.operation.Operation):
 
         record = colrev.record.Record(data=record_dict)
         if record_dict[Fields.FILE].endswith(".pdf"):
-            record.set_text_from_pdf()
+            record.set_text_from_pdf(pdf_document=self.get_pdf_document(record=record))
         original_filename = record_dict[Fields.FILE]
 
         self.review_manager.logger.debug(f"Start PDF prep of {record_dict[Fields.ID]}")
@@ -221,9 +307,46 @@ class PDFPrep(colrev.operation.Operation):
             )
 
         record.cleanup_pdf_processing_fields()
+        self.__close_pdf_document(record_id=record.data[Fields.ID])
 
         return record.get_data()
 
+    def load_pdf_prep_package_endpoints(self) -> None:
+        """Load the pdf-prep package endpoints (selected in the settings)"""
+        package_manager = self.review_manager.get_package_manager()
+        self.pdf_prep_package_endpoints = package_manager.load_packages(
+            package_type=colrev.env.package_manager.PackageEndpointType.pdf_prep,
+            selected_packages=self.review_manager.settings.pdf_prep.pdf_prep_package_endpoints,
+            operation=self,
+            only_ci_supported=self.review_manager.in_ci_environment(),
+        )
+
+    def __get_nr_workers(self) -> int:
+        endpoint_names = [
+            s["endpoint"]
+            for s in self.review_manager.settings.pdf_prep.pdf_prep_package_endpoints
+        ]
+        # Note : limit the workers to avoid overloading the GROBID service
+        if "colrev.create_tei" in endpoint_names:  # type: ignore
+            return max(1, mp.cpu_count() // 2)
+        return self.cpus
+
+    def __prepare_pdfs_in_processes(self, *, items: list) -> list:
+        # Note : workers receive the record dicts and return the changed fields.
+        # The main process applies the changes (single writer).
+        records = {item["record"][Fields.ID]: item["record"] for item in items}
+        with ProcessPoolExecutor(
+            max_workers=self.__get_nr_workers(),
+            initializer=_initialize_pdf_prep_worker,
+            initargs=(str(self.review_manager.path), self.review_manager.verbose_mode),
+        ) as executor:
+            for result in executor.map(_prepare_pdf_in_process, items):
+                record_dict = records[result[Fields.ID]]
+                record_dict.update(result["changed"])
+                for key in result["removed"]:
+                    del record_dict[key]
+        return list(records.values())
+
     def __get_data(self, *, batch_size: int) -> dict:
         records_headers = self.review_manager.dataset.load_records_dict(
             header_only=True
@@ -280,15 +403,27 @@ class PDFPrep(colrev.operation.Operation):
             )
         return record_dict
 
-    def update_colrev_pdf_ids(self) -> None:
+    def update_colrev_pdf_ids(self, *, processes: bool = False) -> None:
         """Update the colrev-pdf-ids"""
         self.review_manager.logger.info("Update colrev_pdf_ids")
         records = self.review_manager.dataset.load_records_dict()
-        pool = Pool(self.cpus)
-        records_list = pool.map(self.__update_colrev_pdf_ids, records.values())
-        pool.close()
-        pool.join()
-        records = {r[Fields.ID]: r for r in records_list}
+        if processes:
+            tasks = [
+                (r[Fields.ID], str(self.review_manager.path / Path(r[Fields.FILE])))
+                for r in records.values()
+                if Fields.FILE in r
+            ]
+            with ProcessPoolExecutor(max_workers=self.cpus) as executor:
+                for record_id, colrev_pdf_id in executor.map(
+                    _get_colrev_pdf_id_in_process, tasks
+                ):
+                    records[record_id].update(colrev_pdf_id=colrev_pdf_id)
+        else:
+            pool = Pool(self.cpus)
+            records_list = pool.map(self.__update_colrev_pdf_ids, records.values())
+            pool.close()
+            pool.join()
+            records = {r[Fields.ID]: r for r in records_list}
         self.review_manager.dataset.save_records_dict(records=records)
         self.review_manager.create_commit(msg="Update colrev_pdf_ids")
 
@@ -383,8 +518,14 @@ class PDFPrep(colrev.operation.Operation):
         *,
         reprocess: bool = False,
         batch_size: int = 0,
+        processes: bool = False,
+        cpu: typing.Optional[int] = None,
     ) -> None:
-        """Prepare PDFs (main entrypoint)"""
+        """Prepare PDFs (main entrypoint)
+
+        In the processes mode, PDFs are prepared in a process pool (with cpu workers)
+        and the results are saved by the main process.
+        """
 
         if self.review_manager.in_ci_environment():
             raise colrev_exceptions.ServiceNotAvailableException(
@@ -413,15 +554,12 @@ class PDFPrep(colrev.operation.Operation):
         if reprocess:
             self.__set_to_reprocess()
 
+        if cpu is not None:
+            self.cpus = cpu
+
         pdf_prep_data = self.__get_data(batch_size=batch_size)
 
-        package_manager = self.review_manager.get_package_manager()
-        self.pdf_prep_package_endpoints = package_manager.load_packages(
-            package_type=colrev.env.package_manager.PackageEndpointType.pdf_prep,
-            selected_packages=self.review_manager.settings.pdf_prep.pdf_prep_package_endpoints,
-            operation=self,
-            only_ci_supported=self.review_manager.in_ci_environment(),
-        )
+        self.load_pdf_prep_package_endpoints()
 
         self.review_manager.logger.info(
             "PDFs to prep".ljust(38) + f'{pdf_prep_data["nr_tasks"]} PDFs'
@@ -436,17 +574,17 @@ class PDFPrep(colrev.operation.Operation):
                 )
 
         else:
-            endpoint_names = [
-                s["endpoint"]
-                for s in self.review_manager.settings.pdf_prep.pdf_prep_package_endpoints
-            ]
-            if "colrev.create_tei" in endpoint_names:  # type: ignore
-                pool = Pool(mp.cpu_count() // 2)
+            if processes:
+                pdf_prep_record_list = self.__prepare_pdfs_in_processes(
+                    items=pdf_prep_data["items"]
+                )
             else:
-                pool = Pool(self.cpus)
-            pdf_prep_record_list = pool.map(self.prepare_pdf, pdf_prep_data["items"])
-            pool.close()
-            pool.join()
+                pool = Pool(self.__get_nr_workers())
+                pdf_prep_record_list = pool.map(
+                    self.prepare_pdf, pdf_prep_data["items"]
+                )
+                pool.close()
+                pool.join()
 
             self.review_manager.dataset.save_records_dict(
                 records={r[Fields.ID]: r for r in pdf_prep_record_list}, partial=True
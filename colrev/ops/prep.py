@@ -6,6 +6,7 @@ import inspect
 import logging
 import multiprocessing as mp
 import random
+import threading
 import time
 import typing
 from copy import deepcopy
@@ -23,6 +24,7 @@ from requests.exceptions import ReadTimeout
 import colrev.env.utils
 import colrev.exceptions as colrev_exceptions
 import colrev.operation
+import colrev.ops.search_feed
 import colrev.record
 import colrev.settings
 from colrev.constants import Colors
@@ -117,6 +119,10 @@ class Prep(colrev.operation.Operation):
     __cpu = 1
     __prep_commit_id = "HEAD"
 
+    # Note : feeds (shared by the prep package endpoints) are saved at the end of
+    # each prep round and after feed_save_interval changes (for crash safety)
+    feed_save_interval = 200
+
     def __init__(
         self,
         *,
@@ -145,6 +151,47 @@ class Prep(colrev.operation.Operation):
         self.current_temp_records = Path(".colrev/cur_temp_recs.bib")
         self.temp_records = Path(".colrev/temp_recs.bib")
 
+        self.__feeds: typing.Dict[str, colrev.ops.search_feed.GeneralOriginFeed] = {}
+        self.__changed_feeds: typing.Set[str] = set()
+        self.__nr_feed_changes = 0
+        self.__feeds_lock = threading.Lock()
+
+    def get_feed(
+        self, *, search_source: colrev.settings.SearchSource, source_identifier: str
+    ) -> colrev.ops.search_feed.GeneralOriginFeed:
+        """Get the feed of a SearchSource (shared by the threads of the prep operation)
+
+        Changes must be registered (register_feed_change()) to be saved.
+        """
+        feed_key = str(search_source.filename)
+        with self.__feeds_lock:
+            if feed_key not in self.__feeds:
+                self.__feeds[feed_key] = search_source.get_feed(
+                    review_manager=self.review_manager,
+                    source_identifier=source_identifier,
+                    update_only=False,
+                )
+            return self.__feeds[feed_key]
+
+    def register_feed_change(
+        self, *, feed: colrev.ops.search_feed.GeneralOriginFeed
+    ) -> None:
+        """Register a change of a feed (feeds are saved periodically)"""
+        with self.__feeds_lock:
+            self.__changed_feeds.add(str(feed.feed_file))
+            self.__nr_feed_changes += 1
+            save_feeds = self.__nr_feed_changes >= self.feed_save_interval
+        if save_feeds:
+            self.save_feeds()
+
+    def save_feeds(self) -> None:
+        """Save the feeds that were changed"""
+        with self.__feeds_lock:
+            for feed_key in self.__changed_feeds:
+                self.__feeds[feed_key].save_feed_file()
+            self.__changed_feeds.clear()
+            self.__nr_feed_changes = 0
+
     def __add_stats(
         self, *, prep_round_package_endpoint: dict, start_time: datetime
     ) -> None:
@@ -1016,6 +1063,18 @@ class Prep(colrev.operation.Operation):
                 )
                 endpoint.check_availability(source_operation=self)  # type: ignore
 
+    def __prefetch(self, *, preparation_data: list) -> None:
+        # Note : endpoints can retrieve data for all records in one batch
+        # (before the records are prepared in parallel)
+        records = [item["record"].get_data() for item in preparation_data]
+        if not records:
+            return
+        for endpoint_name, endpoint in self.prep_package_endpoints.items():
+            prefetch_function = getattr(endpoint, "prefetch", None)
+            if callable(prefetch_function):
+                self.review_manager.logger.debug(f"Prefetch {endpoint_name}")
+                endpoint.prefetch(prep_operation=self, records=records)  # type: ignore
+
     def __log_record_change_scores(
         self, *, preparation_data: list, prepared_records: list
     ) -> None:
@@ -1161,8 +1220,9 @@ class Prep(colrev.operation.Operation):
         if self.__prep_packages_ram_heavy(prep_round=prep_round):
             pool = Pool(mp.cpu_count() // 2)
         else:
-            # Note : if we use too many CPUS,
-            # a "too many open files" exception is thrown
+            # Note : requests share one session (connection pool) and are
+            # limited per host (colrev.env.http_session). Threads waiting
+            # for a host do not open additional connections or files.
             pool = Pool(self.__cpu)
         self.review_manager.logger.info(
             "Info: ✔ = quality-assured by CoLRev community curators"
@@ -1246,23 +1306,27 @@ class Prep(colrev.operation.Operation):
                     polish=polish,
                 )
                 previous_preparation_data = deepcopy(preparation_data)
+                self.__prefetch(preparation_data=preparation_data)
 
                 if len(preparation_data) == 0 and not self.temp_records.is_file():
                     self.review_manager.logger.info("No records to prepare.")
                     print()
                     return
 
-                if self.__cpu == 1:
-                    # Note: preparation_data is not turned into a list of records.
-                    prepared_records = []
-                    for item in preparation_data:
-                        record = self.prepare(item)
-                        prepared_records.append(record)
-                else:
-                    pool = self.__get_prep_pool(prep_round=prep_round)
-                    prepared_records = pool.map(self.prepare, preparation_data)
-                    pool.close()
-                    pool.join()
+                try:
+                    if self.__cpu == 1:
+                        # Note: preparation_data is not turned into a list of records.
+                        prepared_records = []
+                        for item in preparation_data:
+                            record = self.prepare(item)
+                            prepared_records.append(record)
+                    else:
+                        pool = self.__get_prep_pool(prep_round=prep_round)
+                        prepared_records = pool.map(self.prepare, preparation_data)
+                        pool.close()
+                        pool.join()
+                finally:
+                    self.save_feeds()
 
                 self.__complete_resumed_operation(prepared_records=prepared_records)
 
@@ -1288,6 +1352,11 @@ class Prep(colrev.operation.Operation):
                 ) from exc
             raise exc
 
+        self.review_manager.logger.debug(
+            "HTTP cache statistics: "
+            f"{self.review_manager.get_cached_session().get_statistics()}"
+        )
+
         if not keep_ids and not self.debug_mode and not self.polish:
             self.review_manager.logger.info("Set record IDs")
             self.review_manager.dataset.set_ids()
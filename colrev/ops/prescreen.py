@@ -289,8 +289,8 @@ class Prescreen(colrev.operation.Operation):
             record.set_status(
                 target_state=colrev.record.RecordState.rev_prescreen_included
             )
-            self.review_manager.dataset.save_records_dict(
-                records={record.data[Fields.ID]: record.get_data()}, partial=True
+            self.review_manager.dataset.journal_records(
+                records={record.data[Fields.ID]: record.get_data()}
             )
 
         else:
@@ -300,8 +300,8 @@ class Prescreen(colrev.operation.Operation):
             record.set_status(
                 target_state=colrev.record.RecordState.rev_prescreen_excluded
             )
-            self.review_manager.dataset.save_records_dict(
-                records={record.data[Fields.ID]: record.get_data()}, partial=True
+            self.review_manager.dataset.journal_records(
+                records={record.data[Fields.ID]: record.get_data()}
             )
 
     def __auto_include(self, *, records: dict) -> list:
@@ -387,6 +387,7 @@ class Prescreen(colrev.operation.Operation):
                 selected_record_ids=selected_record_ids + selected_auto_include_ids
             )
 
+        self.review_manager.dataset.merge_decision_journal()
         self.review_manager.logger.info(
             "%sCompleted prescreen operation%s", Colors.GREEN, Colors.END
         )
@@ -21,9 +21,11 @@ class ReviewTypes:
         package_manager = review_manager.get_package_manager()
         check_operation = colrev.operation.CheckOperation(review_manager=review_manager)
 
-        self.all_available_packages_names = package_manager.discover_packages(
-            package_type=colrev.env.package_manager.PackageEndpointType.review_type,
-            installed_only=True,
+        self.all_available_packages_names = (
+            package_manager.discover_package_identifiers(
+                package_type=colrev.env.package_manager.PackageEndpointType.review_type,
+                installed_only=True,
+            )
         )
 
         packages_to_load = [{"endpoint": review_type}]
@@ -365,8 +365,8 @@ class Screen(colrev.operation.Operation):
             )
 
         record_dict = record.get_data()
-        self.review_manager.dataset.save_records_dict(
-            records={record_dict[Fields.ID]: record_dict}, partial=True
+        self.review_manager.dataset.journal_records(
+            records={record_dict[Fields.ID]: record_dict}
         )
 
     def __auto_include(self, *, records: dict) -> list:
@@ -467,6 +467,7 @@ class Screen(colrev.operation.Operation):
                 selected_record_ids=selected_record_ids + selected_auto_include_ids
             )
 
+        self.review_manager.dataset.merge_decision_journal()
         self.review_manager.logger.info(
             f"{Colors.GREEN}Completed screen operation{Colors.END}"
         )
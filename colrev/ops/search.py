@@ -395,7 +395,7 @@ class Search(colrev.operation.Operation):
 
         self.review_manager.logger.debug("Load available search_source endpoints...")
 
-        search_source_identifiers = self.package_manager.discover_packages(
+        search_source_identifiers = self.package_manager.discover_package_identifiers(
             package_type=colrev.env.package_manager.PackageEndpointType.search_source,
             installed_only=True,
         )
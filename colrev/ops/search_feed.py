@@ -3,14 +3,14 @@
 from __future__ import annotations
 
 import json
+import threading
 import time
-from copy import deepcopy
+import typing
 from random import randint
 
-from pybtex.database.input import bibtex
-
 import colrev.exceptions as colrev_exceptions
 import colrev.operation
+import colrev.records_parser
 import colrev.settings
 from colrev.constants import Colors
 from colrev.constants import Fields
@@ -53,6 +53,11 @@ class GeneralOriginFeed:
         self.update_only = update_only
         self.review_manager = review_manager
         self.origin_prefix = self.source.get_origin_prefix()
+        # Note : feeds can be shared between threads (e.g., in the prep operation)
+        self.__lock = threading.RLock()
+        self.__origin_index: typing.Dict[str, dict] = {}
+        self.__origin_index_records: typing.Optional[dict] = None
+        self.__origin_index_len = 0
 
         self.__available_ids = {}
         self.__max_id = 1
@@ -101,6 +106,10 @@ class GeneralOriginFeed:
     def add_record(self, *, record: colrev.record.Record) -> bool:
         """Add a record to the feed and set its colrev_origin"""
 
+        with self.__lock:
+            return self.__add_record(record=record)
+
+    def __add_record(self, *, record: colrev.record.Record) -> bool:
         # Feed:
         feed_record_dict = record.data.copy()
         added_new = True
@@ -149,9 +158,10 @@ class GeneralOriginFeed:
         search_operation = self.review_manager.get_search_operation()
         if len(self.feed_records) > 0:
             self.feed_file.parents[0].mkdir(parents=True, exist_ok=True)
-            self.review_manager.dataset.save_records_dict_to_file(
-                records=self.feed_records, save_path=self.feed_file
-            )
+            with self.__lock:
+                self.review_manager.dataset.save_records_dict_to_file(
+                    records=self.feed_records, save_path=self.feed_file
+                )
 
             while True:
                 try:
@@ -175,31 +185,9 @@ class GeneralOriginFeed:
 
     def __have_changed(self, *, record_a_orig: dict, record_b_orig: dict) -> bool:
         # To ignore changes introduced by saving/loading the feed-records,
-        # we parse and load them in the following.
-        record_a = deepcopy(record_a_orig)
-        record_b = deepcopy(record_b_orig)
-
-        bibtex_str = self.review_manager.dataset.parse_bibtex_str(
-            recs_dict_in={record_a[Fields.ID]: record_a}
-        )
-        parser = bibtex.Parser()
-        bib_data = parser.parse_string(bibtex_str)
-        record_a = list(
-            self.review_manager.dataset.parse_records_dict(
-                records_dict=bib_data.entries
-            ).values()
-        )[0]
-
-        bibtex_str = self.review_manager.dataset.parse_bibtex_str(
-            recs_dict_in={record_b[Fields.ID]: record_b}
-        )
-        parser = bibtex.Parser()
-        bib_data = parser.parse_string(bibtex_str)
-        record_b = list(
-            self.review_manager.dataset.parse_records_dict(
-                records_dict=bib_data.entries
-            ).values()
-        )[0]
+        # we normalize them in the following.
+        record_a = colrev.records_parser.normalize_record(record_dict=record_a_orig)
+        record_b = colrev.records_parser.normalize_record(record_dict=record_b_orig)
 
         # Note : record_a can have more keys (that's ok)
         changed = False
@@ -212,11 +200,32 @@ class GeneralOriginFeed:
                 return True
         return changed
 
+    def __build_origin_index(self, *, records: dict) -> None:
+        self.__origin_index = {}
+        for record_dict in records.values():
+            for record_origin in record_dict[Fields.ORIGIN]:
+                self.__origin_index.setdefault(record_origin, record_dict)
+        self.__origin_index_records = records
+        self.__origin_index_len = len(records)
+
     def __get_record_based_on_origin(self, origin: str, records: dict) -> dict:
-        for main_record_dict in records.values():
-            if origin in main_record_dict[Fields.ORIGIN]:
-                return main_record_dict
-        return {}
+        # Note : the origin index is created once per records dict (e.g., per search run)
+        # and rebuilt when records are added/removed. Misses are common (feed records
+        # that are not yet loaded) and do not rebuild the index. Hits are validated
+        # (the record may have been replaced or its origin may have been removed).
+        if (
+            self.__origin_index_records is not records
+            or self.__origin_index_len != len(records)
+        ):
+            self.__build_origin_index(records=records)
+        main_record_dict = self.__origin_index.get(origin, {})
+        if not main_record_dict or (
+            origin in main_record_dict[Fields.ORIGIN]
+            and records.get(main_record_dict[Fields.ID]) is main_record_dict
+        ):
+            return main_record_dict
+        self.__build_origin_index(records=records)
+        return self.__origin_index.get(origin, {})
 
     def __update_existing_record_retract(
         self, *, record: colrev.record.Record, main_record_dict: dict
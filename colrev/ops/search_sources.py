@@ -17,7 +17,7 @@ class SearchSources:
         package_manager = review_manager.get_package_manager()
         check_operation = colrev.operation.CheckOperation(review_manager=review_manager)
 
-        self.all_available_packages_names = package_manager.discover_packages(
+        self.all_available_packages_names = package_manager.discover_package_identifiers(
             package_type=colrev.env.package_manager.PackageEndpointType.search_source,
             installed_only=True,
         )
@@ -28,7 +28,7 @@ class SearchSources:
                 {
                     "endpoint": k,
                 }
-                for k in list(self.all_available_packages_names.keys())
+                for k in self.all_available_packages_names
             ],
             operation=check_operation,
             instantiate_objects=False,
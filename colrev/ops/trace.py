@@ -90,15 +90,15 @@ class Trace(colrev.operation.Operation):
 
         self.review_manager.logger.info(f"Trace record by ID: {record_id}")
 
-        revlist = self.review_manager.dataset.get_repo().iter_commits()
+        git_repo = self.review_manager.dataset.get_repo()
+        records_history = self.review_manager.dataset.records_history
 
+        # Note : only the commits in which the record changed are loaded
         prev_record: dict = {}
-        for commit in reversed(list(revlist)):
-            try:
-                filecontents = (commit.tree / "data" / "records.bib").data_stream.read()
-            except KeyError:
-                continue
-
+        for commit_sha, record_str in records_history.get_record_strings(
+            record_id=record_id
+        ):
+            commit = git_repo.commit(commit_sha)
             commit_message_first_line = str(commit.message).partition("\n")[0]
 
             if self.review_manager.verbose_mode:
@@ -113,14 +113,9 @@ class Trace(colrev.operation.Operation):
                 )
 
             records_dict = self.review_manager.dataset.load_records_dict(
-                load_str=filecontents.decode("utf-8")
+                load_str=record_str
             )
 
-            if record_id not in records_dict:
-                if self.review_manager.verbose_mode:
-                    print(f"record {record_id} not in commit.")
-                continue
-
             prev_record = self.__print_record_changes(
                 commit=commit,
                 records_dict=records_dict,
@@ -28,35 +28,15 @@ class Validate(colrev.operation.Operation):
         self.cpus = 4
 
     def __load_prior_records_dict(self, *, target_commit: str) -> dict:
-        git_repo = self.review_manager.dataset.get_repo()
-
-        revlist = (
-            (
-                commit.hexsha,
-                (commit.tree / "data" / "records.bib").data_stream.read(),
-            )
-            for commit in git_repo.iter_commits(
-                paths=str(self.review_manager.dataset.RECORDS_FILE_RELATIVE)
-            )
+        # Note : without a target_commit, the prior of the last commit is loaded
+        filecontents = self.review_manager.dataset.records_history.load_records_file(
+            commit_sha=target_commit, prior=True
+        )
+        if filecontents is None:
+            return {}
+        return self.review_manager.dataset.load_records_dict(
+            load_str=filecontents.decode("utf-8")
         )
-
-        found_target_commit = False
-        for commit_id, filecontents in list(revlist):
-            if target_commit:
-                if commit_id == target_commit:
-                    found_target_commit = True
-                    continue
-                if not found_target_commit:
-                    continue
-            elif not found_target_commit:
-                # To skip the same commit
-                found_target_commit = True
-                continue
-            prior_records_dict = self.review_manager.dataset.load_records_dict(
-                load_str=filecontents.decode("utf-8")
-            )
-            return prior_records_dict
-        return {}
 
     def validate_preparation_changes(
         self, *, records: list[dict], prior_records_dict: dict
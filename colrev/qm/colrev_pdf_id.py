@@ -2,8 +2,12 @@
 """Creates CoLRev PDF hashes."""
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
+import sqlite3
+import threading
+import typing
 from pathlib import Path
 
 import fitz
@@ -13,9 +17,102 @@ from PIL import Image
 import colrev.exceptions as colrev_exceptions
 from colrev.constants import Colors
 
+# Content-addressed cache: (sha256 of the file, page_nr, hash_size) -> hash
+# Note : PDF hashes are computed repeatedly for the same (unchanged) files,
+# e.g., when relinking PDFs, updating colrev_pdf_ids, or indexing files_dir sources
+PDF_HASH_CACHE_PATH = Path.home().joinpath("colrev") / Path("pdf_hash_cache.db")
+_CACHE_CONNECTIONS = threading.local()
 
-def get_pdf_hash(*, pdf_path: Path, page_nr: int, hash_size: int = 32) -> str:
-    """Get the PDF image hash"""
+
+def _get_cache_connection() -> typing.Optional[sqlite3.Connection]:
+    connections = getattr(_CACHE_CONNECTIONS, "connections", None)
+    if connections is None:
+        connections = _CACHE_CONNECTIONS.connections = {}
+    cache_path = str(PDF_HASH_CACHE_PATH)
+    if cache_path not in connections:
+        try:
+            Path(cache_path).parent.mkdir(exist_ok=True, parents=True)
+            connection = sqlite3.connect(cache_path, timeout=30)
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS pdf_hashes (file_sha256 TEXT, "
+                "page_nr INTEGER, hash_size INTEGER, pdf_hash TEXT, "
+                "PRIMARY KEY (file_sha256, page_nr, hash_size))"
+            )
+            connection.commit()
+        except sqlite3.Error:  # pragma: no cover
+            # Note : hashes are computed without the cache (e.g., read-only home)
+            connection = None
+        connections[cache_path] = connection
+    return connections[cache_path]
+
+
+def _get_cached_pdf_hash(
+    *, file_sha256: str, page_nr: int, hash_size: int
+) -> typing.Optional[str]:
+    connection = _get_cache_connection()
+    if connection is None:  # pragma: no cover
+        return None
+    try:
+        row = connection.execute(
+            "SELECT pdf_hash FROM pdf_hashes "
+            "WHERE file_sha256 = ? AND page_nr = ? AND hash_size = ?",
+            (file_sha256, page_nr, hash_size),
+        ).fetchone()
+    except sqlite3.Error:  # pragma: no cover
+        return None
+    return row[0] if row else None
+
+
+def _cache_pdf_hash(
+    *, file_sha256: str, page_nr: int, hash_size: int, pdf_hash: str
+) -> None:
+    connection = _get_cache_connection()
+    if connection is None:  # pragma: no cover
+        return
+    try:
+        connection.execute(
+            "INSERT OR REPLACE INTO pdf_hashes VALUES (?, ?, ?, ?)",
+            (file_sha256, page_nr, hash_size, pdf_hash),
+        )
+        connection.commit()
+    except sqlite3.Error:  # pragma: no cover
+        pass
+
+
+def _compute_pdf_hash(
+    *, doc: fitz.Document, pdf_path: Path, page_nr: int, hash_size: int
+) -> str:
+    if page_nr > doc.page_count:
+        logging.error(
+            "%sPDF has less than %s pages: %s %s",
+            Colors.RED,
+            page_nr,
+            pdf_path,
+            Colors.END,
+        )
+        raise colrev_exceptions.InvalidPDFException(path=pdf_path)
+
+    # Render only the requested page (in memory)
+    pix = doc.load_page(page_nr - 1).get_pixmap(dpi=200)
+    mode = {1: "L", 3: "RGB", 4: "RGBA"}[pix.n]
+    img = Image.frombytes(mode, (pix.width, pix.height), pix.samples)
+    average_hash = imagehash.average_hash(img, hash_size=int(hash_size))
+    return str(average_hash).replace("\n", "")
+
+
+def get_pdf_hash(
+    *,
+    pdf_path: Path,
+    page_nr: int,
+    hash_size: int = 32,
+    document: typing.Optional[fitz.Document] = None,
+    content: typing.Optional[bytes] = None,
+) -> str:
+    """Get the PDF image hash
+
+    The document (fitz) and the content of the file can be passed if they are
+    available (e.g., in the PDFDocumentContext).
+    """
     assert page_nr > 0
     assert hash_size in [16, 32]
     pdf_path = pdf_path.resolve()
@@ -23,20 +120,31 @@ def get_pdf_hash(*, pdf_path: Path, page_nr: int, hash_size: int = 32) -> str:
         logging.error("%sPDF with size 0: %s %s", Colors.RED, pdf_path, Colors.END)
         raise colrev_exceptions.InvalidPDFException(path=pdf_path)
 
-    doc: fitz.Document = fitz.open(pdf_path)
-    img = None
-    file_name = f".{pdf_path.stem}-{page_nr}.png"
-    page_no = 0
-    for page in doc:
-        pix = page.get_pixmap(dpi=200)
-        pix.save(file_name)  # store image as a PNG
-        page_no += 1
-        if page_no == page_nr:
-            img = Image.open(file_name)
-            break
-    average_hash = imagehash.average_hash(img, hash_size=int(hash_size))
-    Path(file_name).unlink()
-    average_hash_str = str(average_hash).replace("\n", "")
+    if content is None:
+        content = pdf_path.read_bytes()
+    file_sha256 = hashlib.sha256(content).hexdigest()
+    average_hash_str = _get_cached_pdf_hash(
+        file_sha256=file_sha256, page_nr=page_nr, hash_size=hash_size
+    )
+    if average_hash_str is None:
+        if document is not None:
+            average_hash_str = _compute_pdf_hash(
+                doc=document, pdf_path=pdf_path, page_nr=page_nr, hash_size=hash_size
+            )
+        else:
+            with fitz.open(stream=content, filetype="pdf") as doc:
+                average_hash_str = _compute_pdf_hash(
+                    doc=doc, pdf_path=pdf_path, page_nr=page_nr, hash_size=hash_size
+                )
+
+        if len(average_hash_str) * "0" != average_hash_str:
+            _cache_pdf_hash(
+                file_sha256=file_sha256,
+                page_nr=page_nr,
+                hash_size=hash_size,
+                pdf_hash=average_hash_str,
+            )
+
     if len(average_hash_str) * "0" == average_hash_str:
         raise colrev_exceptions.PDFHashError(path=pdf_path)
 
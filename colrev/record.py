@@ -16,7 +16,7 @@ from typing import Optional
 from typing import TYPE_CHECKING
 
 import dictdiffer
-import pandas as pd
+import numpy as np
 import pdfminer
 from nameparser import HumanName
 from pdfminer.converter import TextConverter
@@ -30,6 +30,8 @@ from pdfminer.pdfparser import PDFParser
 from pdfminer.pdfparser import PDFSyntaxError
 from PyPDF2 import PdfFileReader
 from PyPDF2 import PdfFileWriter
+from rapidfuzz import fuzz as rapidfuzz_fuzz
+from rapidfuzz import process as rapidfuzz_process
 from thefuzz import fuzz
 
 import colrev.env.utils
@@ -46,6 +48,7 @@ from colrev.constants import FieldValues
 from colrev.constants import Operations
 
 if TYPE_CHECKING:
+    import colrev.env.pdf_document
     import colrev.review_manager
     import colrev.qm.quality_model
 
@@ -64,6 +67,21 @@ class Record:
     ]
     dict_fields_keys = [Fields.MD_PROV, Fields.D_PROV]
 
+    # Similarity weights (see get_similarity_detailed())
+    # author, title, year, outlet, (volume, number)
+    __weights_journal = [0.2, 0.25, 0.13, 0.2, 0.12, 0.1]
+    __weights_non_distinctive_title = [0.175, 0, 0.175, 0.175, 0.275, 0.2]
+    __weights_non_journal = [0.15, 0.75, 0.05, 0.05]
+    __non_distinctive_titles = [
+        "editorial",
+        "editorial introduction",
+        "editorial notes",
+        "editor's comments",
+        "book reviews",
+        "editorial note",
+        "reviewer ackowledgment",
+    ]
+
     pp = pprint.PrettyPrinter(indent=4, width=140, compact=False)
 
     def __init__(self, *, data: dict) -> None:
@@ -845,10 +863,8 @@ class Record:
         return 1 - fuzz.ratio(str_a.lower(), str_b.lower()) / 100
 
     @classmethod
-    def get_record_similarity(cls, *, record_a: Record, record_b: Record) -> float:
-        """Determine the similarity between two records (their masterdata)"""
-        record_a_dict = record_a.copy().get_data()
-        record_b_dict = record_b.copy().get_data()
+    def __get_similarity_dict(cls, *, record: Record) -> dict:
+        record_dict = record.copy().get_data()
 
         mandatory_fields = [
             Fields.TITLE,
@@ -863,34 +879,41 @@ class Record:
 
         for mandatory_field in mandatory_fields:
             if (
-                record_a_dict.get(mandatory_field, FieldValues.UNKNOWN)
-                == FieldValues.UNKNOWN
-            ):
-                record_a_dict[mandatory_field] = ""
-            if (
-                record_b_dict.get(mandatory_field, FieldValues.UNKNOWN)
+                record_dict.get(mandatory_field, FieldValues.UNKNOWN)
                 == FieldValues.UNKNOWN
             ):
-                record_b_dict[mandatory_field] = ""
+                record_dict[mandatory_field] = ""
 
-        if "container_title" not in record_a_dict:
-            record_a_dict["container_title"] = (
-                record_a_dict.get(Fields.JOURNAL, "")
-                + record_a_dict.get(Fields.BOOKTITLE, "")
-                + record_a_dict.get(Fields.SERIES, "")
+        if "container_title" not in record_dict:
+            record_dict["container_title"] = (
+                record_dict.get(Fields.JOURNAL, "")
+                + record_dict.get(Fields.BOOKTITLE, "")
+                + record_dict.get(Fields.SERIES, "")
             )
+        return record_dict
 
-        if "container_title" not in record_b_dict:
-            record_b_dict["container_title"] = (
-                record_b_dict.get(Fields.JOURNAL, "")
-                + record_b_dict.get(Fields.BOOKTITLE, "")
-                + record_b_dict.get(Fields.SERIES, "")
-            )
+    @classmethod
+    def get_record_similarity(cls, *, record_a: Record, record_b: Record) -> float:
+        """Determine the similarity between two records (their masterdata)"""
 
-        df_a = pd.DataFrame.from_dict([record_a_dict])  # type: ignore
-        df_b = pd.DataFrame.from_dict([record_b_dict])  # type: ignore
+        return Record.get_similarity(
+            df_a=cls.__get_similarity_dict(record=record_a),
+            df_b=cls.__get_similarity_dict(record=record_b),
+        )
 
-        return Record.get_similarity(df_a=df_a.iloc[0], df_b=df_b.iloc[0])
+    @classmethod
+    def get_record_similarity_matrix(
+        cls, *, records_a: typing.List[Record], records_b: typing.List[Record]
+    ) -> np.ndarray:
+        """Determine the similarities between records (their masterdata)
+
+        Returns a matrix with the get_record_similarity() of records_a[i] and records_b[j]
+        """
+
+        return Record.get_similarity_matrix(
+            records_a=[cls.__get_similarity_dict(record=r) for r in records_a],
+            records_b=[cls.__get_similarity_dict(record=r) for r in records_b],
+        )
 
     @classmethod
     def get_similarity(cls, *, df_a: dict, df_b: dict) -> float:
@@ -956,18 +979,13 @@ class Record:
                 # ie., non-distinctive
                 # The list is based on a large export of distinct papers, tabulated
                 # according to titles and sorted by frequency
-                if [record_a[Fields.TITLE], record_b[Fields.TITLE]] in [
-                    ["editorial", "editorial"],
-                    ["editorial introduction", "editorial introduction"],
-                    ["editorial notes", "editorial notes"],
-                    ["editor's comments", "editor's comments"],
-                    ["book reviews", "book reviews"],
-                    ["editorial note", "editorial note"],
-                    ["reviewer ackowledgment", "reviewer ackowledgment"],
-                ]:
-                    weights = [0.175, 0, 0.175, 0.175, 0.275, 0.2]
+                if (
+                    record_a[Fields.TITLE] == record_b[Fields.TITLE]
+                    and record_a[Fields.TITLE] in cls.__non_distinctive_titles
+                ):
+                    weights = cls.__weights_non_distinctive_title
                 else:
-                    weights = [0.2, 0.25, 0.13, 0.2, 0.12, 0.1]
+                    weights = cls.__weights_journal
 
                 sim_names = [
                     Fields.AUTHOR,
@@ -987,7 +1005,7 @@ class Record:
                 ]
 
             else:
-                weights = [0.15, 0.75, 0.05, 0.05]
+                weights = cls.__weights_non_journal
                 sim_names = [
                     Fields.AUTHOR,
                     Fields.TITLE,
@@ -1023,6 +1041,123 @@ class Record:
             details = ""
         return {"score": similarity_score, "details": details}
 
+    @classmethod
+    def get_ratio_matrix(cls, *, values_a: list, values_b: list) -> np.ndarray:
+        """Determine the fuzz.ratio() / 100 of all pairs of values (batch)"""
+        # Note : rapidfuzz scores are rounded like the thefuzz scores
+        return (
+            np.round(
+                rapidfuzz_process.cdist(
+                    [str(v) for v in values_a],
+                    [str(v) for v in values_b],
+                    scorer=rapidfuzz_fuzz.ratio,
+                    dtype=np.float64,
+                )
+            )
+            / 100
+        )
+
+    @classmethod
+    def round_similarities(cls, *, similarities: np.ndarray) -> np.ndarray:
+        """Round similarities (batch) like round(..., 4) in get_similarity_detailed()"""
+        # Note : np.round differs from round() at .5 boundaries
+        return np.vectorize(lambda score: round(float(score), 4), otypes=[float])(
+            similarities
+        )
+
+    @classmethod
+    def get_similarity_matrix(cls, *, records_a: list, records_b: list) -> np.ndarray:
+        """Determine the similarities between records (batch)
+
+        Returns a matrix with the get_similarity_detailed() score of
+        records_a[i] and records_b[j]. The fields are normalized once per record
+        (instead of once per pair).
+        """
+
+        # pylint: disable=too-many-locals
+
+        def normalize_title(record: dict) -> str:
+            return record[Fields.TITLE].lower().replace(":", "").replace("-", "")
+
+        scores = np.zeros((len(records_a), len(records_b)))
+        if not records_a or not records_b:
+            return scores
+
+        # Note : records without a title (str) have a similarity of 0
+        # (like the AttributeError in get_similarity_detailed)
+        rows = [i for i, r in enumerate(records_a) if isinstance(r[Fields.TITLE], str)]
+        cols = [j for j, r in enumerate(records_b) if isinstance(r[Fields.TITLE], str)]
+        if not rows or not cols:
+            return scores
+        records_a = [records_a[i] for i in rows]
+        records_b = [records_b[j] for j in cols]
+
+        def ratios(key: str) -> np.ndarray:
+            return cls.get_ratio_matrix(
+                values_a=[r[key] for r in records_a],
+                values_b=[r[key] for r in records_b],
+            )
+
+        def equal(key: str) -> np.ndarray:
+            values_a: np.ndarray = np.empty(len(records_a), dtype=object)
+            values_a[:] = [r[key] for r in records_a]
+            values_b: np.ndarray = np.empty(len(records_b), dtype=object)
+            values_b[:] = [r[key] for r in records_b]
+            return (values_a[:, None] == values_b[None, :]).astype(float)
+
+        author_similarity = ratios(Fields.AUTHOR)
+        title_similarity = cls.get_ratio_matrix(
+            values_a=[normalize_title(r) for r in records_a],
+            values_b=[normalize_title(r) for r in records_b],
+        )
+        year_similarity = ratios(Fields.YEAR)
+        has_container_a = np.array([bool(r["container_title"]) for r in records_a])
+        has_container_b = np.array([bool(r["container_title"]) for r in records_b])
+        outlet_similarity = np.where(
+            has_container_a[:, None] & has_container_b[None, :],
+            ratios("container_title"),
+            0.0,
+        )
+
+        # Note : the weights depend on whether record_a is a journal paper
+        # and whether both titles are identical and non-distinctive
+        is_journal = np.array([str(r[Fields.JOURNAL]) != "nan" for r in records_a])
+        titles_b = {r[Fields.TITLE] for r in records_b}
+        non_distinctive: np.ndarray = np.zeros(
+            (len(records_a), len(records_b)), dtype=bool
+        )
+        for i, record_a in enumerate(records_a):
+            title = record_a[Fields.TITLE]
+            if title in cls.__non_distinctive_titles and title in titles_b:
+                non_distinctive[i, :] = [r[Fields.TITLE] == title for r in records_b]
+
+        similarities = [author_similarity, title_similarity, year_similarity]
+        similarities += [outlet_similarity]
+        if is_journal.any():
+            similarities += [equal(Fields.VOLUME), equal(Fields.NUMBER)]
+
+        weighted_average = np.zeros((len(records_a), len(records_b)))
+        for g, similarity in enumerate(similarities):
+            if g < len(cls.__weights_non_journal):
+                non_journal_weight = cls.__weights_non_journal[g]
+            else:
+                non_journal_weight = 0.0
+            weights = np.where(
+                is_journal[:, None],
+                np.where(
+                    non_distinctive,
+                    cls.__weights_non_distinctive_title[g],
+                    cls.__weights_journal[g],
+                ),
+                non_journal_weight,
+            )
+            weighted_average = weighted_average + similarity * weights
+
+        scores[np.ix_(rows, cols)] = cls.round_similarities(
+            similarities=weighted_average
+        )
+        return scores
+
     def get_field_provenance(
         self, *, key: str, default_source: str = "ORIGINAL"
     ) -> dict:
@@ -1266,8 +1401,12 @@ class Record:
         self,
         *,
         pages: Optional[list] = None,
+        pdf_document: Optional[colrev.env.pdf_document.PDFDocumentContext] = None,
     ) -> str:
         """Extract the text from the PDF for a given number of pages"""
+        if pdf_document is not None:
+            return pdf_document.extract_text_by_page(pages=pages)
+
         text_list: list = []
         pdf_path = Path(self.data[Fields.FILE]).absolute()
 
@@ -1301,8 +1440,15 @@ class Record:
                 pass
         return "".join(text_list)
 
-    def set_pages_in_pdf(self) -> None:
+    def set_pages_in_pdf(
+        self,
+        *,
+        pdf_document: Optional[colrev.env.pdf_document.PDFDocumentContext] = None,
+    ) -> None:
         """Set the pages_in_file field based on the PDF"""
+        if pdf_document is not None:
+            self.data["pages_in_file"] = pdf_document.get_pages_in_file()
+            return
         pdf_path = Path(self.data[Fields.FILE]).absolute()
         with open(pdf_path, "rb") as file:
             parser = PDFParser(file)
@@ -1310,12 +1456,16 @@ class Record:
             pages_in_file = resolve1(document.catalog["Pages"])["Count"]
         self.data["pages_in_file"] = pages_in_file
 
-    def set_text_from_pdf(self) -> None:
+    def set_text_from_pdf(
+        self,
+        *,
+        pdf_document: Optional[colrev.env.pdf_document.PDFDocumentContext] = None,
+    ) -> None:
         """Set the text_from_pdf field based on the PDF"""
         self.data["text_from_pdf"] = ""
         try:
-            self.set_pages_in_pdf()
-            text = self.extract_text_by_page(pages=[0, 1, 2])
+            self.set_pages_in_pdf(pdf_document=pdf_document)
+            text = self.extract_text_by_page(pages=[0, 1, 2], pdf_document=pdf_document)
             self.data["text_from_pdf"] = text.replace("\n", " ").replace("\x0c", "")
 
         except PDFSyntaxError:  # pragma: no cover
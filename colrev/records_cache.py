@@ -0,0 +1,122 @@
+#! /usr/bin/env python
+"""Binary cache of the parsed records (.colrev/records.cache)."""
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle  # nosec
+import typing
+from pathlib import Path
+
+from colrev.constants import Fields
+
+# Layout of the cache file (three consecutive pickles):
+# 1. the key (size, mtime and git blob sha of the records file it was built from)
+# 2. the header items (see Dataset.load_records_dict(header_only=True))
+# 3. the records dict
+# Reading the header items does not unpickle (allocate) the full records.
+
+HEADER_FIELDS = [
+    Fields.ID,
+    Fields.ORIGIN,
+    Fields.STATUS,
+    Fields.FILE,
+    Fields.SCREENING_CRITERIA,
+    Fields.MD_PROV,
+]
+
+
+class RecordsCache:
+    """Cache of the parsed records, validated against the records file"""
+
+    CACHE_VERSION = "1"
+
+    def __init__(self, *, records_file: Path, cache_path: Path) -> None:
+        self.records_file = records_file
+        self.cache_path = cache_path
+
+    @classmethod
+    def get_blob_sha(cls, *, content: bytes) -> str:
+        """Get the git blob sha of a file content"""
+        header = f"blob {len(content)}\0".encode("utf-8")
+        return hashlib.sha1(header + content).hexdigest()  # nosec
+
+    def __get_key(self, *, stat: os.stat_result) -> dict:
+        return {
+            "version": self.CACHE_VERSION,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        }
+
+    def __is_valid(self, *, cached_key: dict) -> bool:
+        if not self.records_file.is_file():
+            return False
+        key = self.__get_key(stat=self.records_file.stat())
+        if cached_key["version"] != key["version"] or cached_key["size"] != key["size"]:
+            return False
+
+        # Note : like git, we do not trust mtimes that are not older than the cache
+        # (the file may have been changed in the same timestamp-tick)
+        if (
+            cached_key["mtime_ns"] == key["mtime_ns"]
+            and key["mtime_ns"] < self.cache_path.stat().st_mtime_ns
+        ):
+            return True
+        return cached_key["blob_sha"] == self.get_blob_sha(
+            content=self.records_file.read_bytes()
+        )
+
+    def __load(self, *, header_only: bool) -> typing.Any:
+        if not self.cache_path.is_file():
+            return None
+        try:
+            with open(self.cache_path, "rb") as file:
+                cached_key = pickle.load(file)  # nosec
+                if not self.__is_valid(cached_key=cached_key):
+                    return None
+                header_items = pickle.load(file)  # nosec
+                if header_only:
+                    return header_items
+                return pickle.load(file)  # nosec
+        except (EOFError, KeyError, TypeError, pickle.UnpicklingError):
+            return None
+
+    def load_records_dict(self) -> typing.Optional[dict]:
+        """Load the records dict (None if the cache is not valid)"""
+        return self.__load(header_only=False)
+
+    def load_header_items(self) -> typing.Optional[list]:
+        """Load the header items (None if the cache is not valid)"""
+        return self.__load(header_only=True)
+
+    def save(self, *, records: dict, content: bytes, stat: os.stat_result) -> None:
+        """Save the records (parsed from the content of the records file)
+
+        The stat should be retrieved before reading the content.
+        """
+
+        header_items = []
+        for record_dict in records.values():
+            # Note : like the header parser, we skip "NA" values
+            header_item = {
+                k: record_dict[k]
+                for k in HEADER_FIELDS
+                if record_dict.get(k, "NA") != "NA"
+            }
+            if Fields.FILE in header_item:
+                header_item[Fields.FILE] = Path(header_item[Fields.FILE])
+            header_items.append(header_item)
+
+        self.cache_path.parent.mkdir(exist_ok=True, parents=True)
+        temp_path = self.cache_path.with_suffix(".tmp")
+        with open(temp_path, "wb") as file:
+            key = self.__get_key(stat=stat)
+            key["blob_sha"] = self.get_blob_sha(content=content)
+            pickle.dump(key, file)
+            pickle.dump(header_items, file, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(records, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, self.cache_path)
+
+    def invalidate(self) -> None:
+        """Remove the cache (e.g., when the records file is written)"""
+        self.cache_path.unlink(missing_ok=True)
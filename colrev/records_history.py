@@ -0,0 +1,213 @@
+#! /usr/bin/env python
+"""Per-record index of the records file history (.colrev/records_history.index)."""
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle  # nosec
+import re
+import typing
+from pathlib import Path
+
+import git
+from git.exc import GitCommandError
+
+import colrev.records_index
+
+# Layout of the index file (a pickled dict):
+# - head: the last commit that was indexed
+# - commits: [(commit, blob)] of the commits changing the records file (oldest first)
+# - records: {ID: [(commit, blob, start, length, record_hash)]}, with one entry for
+#   each commit in which the record changed (start = -1: the record was removed)
+# - latest: {ID: (record_hash, colrev_status, origins)} in the last indexed commit
+# - origins: {origin: [IDs]}
+# The index is updated incrementally (based on the commits after head).
+
+ORIGIN_PATTERN = re.compile(rb"^\s*colrev_origin\s*=\s*\{([^}]*)\}", re.MULTILINE)
+
+
+class RecordsHistory:
+    """Index of the commits in which records changed (validated against the git head)"""
+
+    INDEX_VERSION = "1"
+
+    def __init__(
+        self, *, git_repo: git.Repo, records_file_relative: Path, index_path: Path
+    ) -> None:
+        self.git_repo = git_repo
+        self.records_file_relative = records_file_relative
+        self.index_path = index_path
+
+    def __get_empty_index(self) -> dict:
+        return {
+            "version": self.INDEX_VERSION,
+            "head": "",
+            "commits": [],
+            "records": {},
+            "latest": {},
+            "origins": {},
+        }
+
+    def __load(self) -> dict:
+        if self.index_path.is_file():
+            try:
+                with open(self.index_path, "rb") as file:
+                    index = pickle.load(file)  # nosec
+                if index["version"] == self.INDEX_VERSION:
+                    return index
+            except (EOFError, KeyError, TypeError, pickle.UnpicklingError):
+                pass
+        return self.__get_empty_index()
+
+    def __save(self, *, index: dict) -> None:
+        self.index_path.parent.mkdir(exist_ok=True, parents=True)
+        temp_path = self.index_path.with_suffix(".tmp")
+        with open(temp_path, "wb") as file:
+            pickle.dump(index, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, self.index_path)
+
+    @classmethod
+    def __get_origins(cls, *, record_bytes: bytes) -> tuple:
+        match = ORIGIN_PATTERN.search(record_bytes)
+        if not match:
+            return ()
+        return tuple(
+            origin.strip()
+            for origin in match.group(1).decode("utf-8").split(";")
+            if origin.strip()
+        )
+
+    # pylint: disable=too-many-locals
+    def __add_commit(
+        self, *, index: dict, commit_sha: str, blob: typing.Optional[git.Blob]
+    ) -> None:
+        blob_sha = blob.hexsha if blob is not None else ""
+        unchanged = index["commits"] and index["commits"][-1][1] == blob_sha
+        index["commits"].append((commit_sha, blob_sha))
+        if unchanged:
+            return
+
+        content = blob.data_stream.read() if blob is not None else b""
+        latest = index["latest"]
+        current_ids = set()
+        offsets = colrev.records_index.iter_record_offsets(content=content)
+        for record_id, start, length, status in offsets:
+            if record_id in current_ids:
+                continue
+            current_ids.add(record_id)
+            record_bytes = content[start : start + length]
+            # Note : trailing whitespace changes when records are appended
+            record_hash = hashlib.sha1(record_bytes.rstrip()).hexdigest()  # nosec
+            if record_id in latest and latest[record_id][0] == record_hash:
+                continue
+            origins = self.__get_origins(record_bytes=record_bytes)
+            index["records"].setdefault(record_id, []).append(
+                (commit_sha, blob_sha, start, length, record_hash)
+            )
+            latest[record_id] = (record_hash, status, origins)
+            for origin in origins:
+                record_ids = index["origins"].setdefault(origin, [])
+                if record_id not in record_ids:
+                    record_ids.append(record_id)
+
+        for record_id in [r for r in latest if r not in current_ids]:
+            index["records"][record_id].append((commit_sha, blob_sha, -1, 0, ""))
+            del latest[record_id]
+
+    def update(self) -> dict:
+        """Update the index (based on the commits that were not yet indexed)"""
+        try:
+            head = self.git_repo.head.commit.hexsha
+        except ValueError:
+            # Note : repository without commits
+            return self.__get_empty_index()
+
+        index = self.__load()
+        if index["head"] == head:
+            return index
+
+        rev = head
+        if index["head"]:
+            try:
+                is_ancestor = self.git_repo.is_ancestor(
+                    self.git_repo.commit(index["head"]), self.git_repo.head.commit
+                )
+            except (GitCommandError, ValueError):
+                # Note : the indexed head may no longer exist
+                is_ancestor = False
+            if is_ancestor:
+                rev = f"{index['head']}..{head}"
+            else:
+                # Note : the history was rewritten (e.g., reset)
+                index = self.__get_empty_index()
+
+        for commit in self.git_repo.iter_commits(
+            rev, paths=str(self.records_file_relative), reverse=True
+        ):
+            try:
+                blob = commit.tree / str(self.records_file_relative)
+            except KeyError:
+                blob = None
+            self.__add_commit(index=index, commit_sha=commit.hexsha, blob=blob)
+
+        index["head"] = head
+        self.__save(index=index)
+        return index
+
+    def __read_blob(self, *, blob_sha: str) -> bytes:
+        return self.git_repo.odb.stream(bytes.fromhex(blob_sha)).read()
+
+    def get_record_strings(
+        self, *, record_id: str
+    ) -> typing.Iterator[typing.Tuple[str, str]]:
+        """Iterate over the (commit, record_str) in which the record changed
+        (oldest first, reading only the records file of these commits)"""
+        index = self.update()
+        for commit_sha, blob_sha, start, length, _ in index["records"].get(
+            record_id, []
+        ):
+            if start == -1:
+                continue
+            content = self.__read_blob(blob_sha=blob_sha)
+            yield commit_sha, content[start : start + length].decode("utf-8")
+
+    def get_record_ids(self, *, origin: str) -> list:
+        """Get the IDs of the records that had the origin"""
+        return list(self.update()["origins"].get(origin, []))
+
+    def get_latest_records(self) -> dict:
+        """Get the {ID: (colrev_status, origins)} in the last commit (of the records file)"""
+        return {
+            record_id: (status, list(origins))
+            for record_id, (_, status, origins) in self.update()["latest"].items()
+        }
+
+    def load_records_file(
+        self, *, commit_sha: str = "", prior: bool = False
+    ) -> typing.Optional[bytes]:
+        """Load the records file as changed in a commit (default: the last commit)
+
+        prior: load the records file as it was before the commit
+        Returns None if the commit did not change the records file.
+        """
+        commits = self.update()["commits"]
+        if not commits:
+            return None
+        position = len(commits) - 1
+        if commit_sha:
+            positions = [i for i, (c, _) in enumerate(commits) if c == commit_sha]
+            if not positions:
+                return None
+            position = positions[0]
+        if prior:
+            position -= 1
+            if position < 0:
+                return None
+        blob_sha = commits[position][1]
+        if not blob_sha:
+            return b""
+        return self.__read_blob(blob_sha=blob_sha)
+
+    def invalidate(self) -> None:
+        """Remove the index"""
+        self.index_path.unlink(missing_ok=True)
@@ -0,0 +1,215 @@
+#! /usr/bin/env python
+"""Byte-offset index of the records file (.colrev/records.index)."""
+from __future__ import annotations
+
+import io
+import os
+import pickle  # nosec
+import typing
+from pathlib import Path
+
+import colrev.records_cache
+
+# Layout of the index file (two consecutive pickles):
+# 1. the key (size, mtime and git blob sha of the records file it was built from)
+# 2. the entries: {ID: (start, length, colrev_status)} (in the order of the file)
+# Records start at lines with an "@" (in the first three characters) and
+# end at the start of the next record (or the end of the file).
+
+
+def iter_record_offsets(
+    *, content: bytes
+) -> typing.Iterator[typing.Tuple[str, int, int, str]]:
+    """Iterate over the (ID, start, length, colrev_status) of the records in content"""
+    current_id, start, status, pos = "", 0, "NA", 0
+    for line in io.BytesIO(content):
+        if b"@" in line[:3]:
+            if current_id:
+                yield current_id, start, pos - start, status
+            current_id = line[line.find(b"{") + 1 : line.rfind(b",")].decode("utf-8")
+            start, status = pos, "NA"
+        elif current_id and line.lstrip().startswith(b"colrev_status"):
+            status = line[line.find(b"{") + 1 : line.rfind(b"}")].decode("utf-8")
+        pos += len(line)
+    if current_id:
+        yield current_id, start, pos - start, status
+
+
+class RecordsIndex:
+    """Byte-offset index of the records, validated against the records file"""
+
+    INDEX_VERSION = "1"
+
+    def __init__(self, *, records_file: Path, index_path: Path) -> None:
+        self.records_file = records_file
+        self.index_path = index_path
+
+    def __get_key(self, *, stat: os.stat_result) -> dict:
+        return {
+            "version": self.INDEX_VERSION,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        }
+
+    def __is_valid(self, *, cached_key: dict) -> bool:
+        key = self.__get_key(stat=self.records_file.stat())
+        if cached_key["version"] != key["version"] or cached_key["size"] != key["size"]:
+            return False
+
+        # Note : like git, we do not trust mtimes that are not older than the index
+        # (the file may have been changed in the same timestamp-tick)
+        if (
+            cached_key["mtime_ns"] == key["mtime_ns"]
+            and key["mtime_ns"] < self.index_path.stat().st_mtime_ns
+        ):
+            return True
+        # Note : indices saved after partial rewrites have no blob_sha
+        return cached_key["blob_sha"] == colrev.records_cache.RecordsCache.get_blob_sha(
+            content=self.records_file.read_bytes()
+        )
+
+    @classmethod
+    def __get_status(cls, *, record_bytes: bytes) -> str:
+        for line in io.BytesIO(record_bytes):
+            if line.lstrip().startswith(b"colrev_status"):
+                return line[line.find(b"{") + 1 : line.rfind(b"}")].decode("utf-8")
+        return "NA"
+
+    @classmethod
+    def __build(cls, *, content: bytes) -> typing.Optional[dict]:
+        entries: typing.Dict[str, typing.Tuple[int, int, str]] = {}
+        for record_id, start, length, status in iter_record_offsets(content=content):
+            if record_id in entries:
+                # Note : records with duplicate IDs cannot be indexed
+                return None
+            entries[record_id] = (start, length, status)
+        return entries
+
+    def __save(
+        self, *, entries: dict, stat: os.stat_result, blob_sha: typing.Optional[str]
+    ) -> None:
+        self.index_path.parent.mkdir(exist_ok=True, parents=True)
+        temp_path = self.index_path.with_suffix(".tmp")
+        with open(temp_path, "wb") as file:
+            key = self.__get_key(stat=stat)
+            key["blob_sha"] = blob_sha
+            pickle.dump(key, file)
+            pickle.dump(entries, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, self.index_path)
+
+    def load(self) -> typing.Optional[dict]:
+        """Load the entries {ID: (start, length, colrev_status)} (rebuilt if necessary)
+
+        Returns None if the records file does not exist or cannot be indexed.
+        """
+        if not self.records_file.is_file():
+            return None
+        if self.index_path.is_file():
+            try:
+                with open(self.index_path, "rb") as file:
+                    cached_key = pickle.load(file)  # nosec
+                    if self.__is_valid(cached_key=cached_key):
+                        return pickle.load(file)  # nosec
+            except (EOFError, KeyError, TypeError, pickle.UnpicklingError):
+                pass
+
+        stat = self.records_file.stat()
+        content = self.records_file.read_bytes()
+        entries = self.__build(content=content)
+        if entries is None:
+            return None
+        self.__save(
+            entries=entries,
+            stat=stat,
+            blob_sha=colrev.records_cache.RecordsCache.get_blob_sha(content=content),
+        )
+        return entries
+
+    def read_record_strings(self, *, entries: dict, record_ids: list) -> list:
+        """Read the record strings (in the order of the file)"""
+        selected = sorted((entries[record_id] for record_id in record_ids))
+        record_strings = []
+        with open(self.records_file, "rb") as file:
+            for start, length, _ in selected:
+                file.seek(start)
+                record_strings.append(file.read(length).decode("utf-8"))
+        return record_strings
+
+    def __replace_in_place(self, *, entries: dict, replacements: dict) -> dict:
+        new_entries = dict(entries)
+        with open(self.records_file, "r+b") as file:
+            for record_id, record_bytes in replacements.items():
+                start, length, _ = entries[record_id]
+                file.seek(start)
+                file.write(record_bytes)
+                new_entries[record_id] = (
+                    start,
+                    length,
+                    self.__get_status(record_bytes=record_bytes),
+                )
+            file.flush()
+            os.fsync(file.fileno())
+        return new_entries
+
+    def __rewrite(self, *, entries: dict, replacements: dict) -> dict:
+        # Note : the records after the first replacement are moved,
+        # i.e., the file is written to a temp file and replaced atomically
+        new_entries = dict(entries)
+        first_start = min(entries[k][0] for k in replacements)
+        temp_file = self.records_file.with_suffix(".bib.tmp")
+        with open(self.records_file, "rb") as file, open(temp_file, "wb") as out:
+            out.write(file.read(first_start))
+            tail = file.read()
+            offset = first_start
+            for record_id, (start, length, status) in entries.items():
+                if start < first_start:
+                    continue
+                if record_id in replacements:
+                    record_bytes = replacements[record_id]
+                    status = self.__get_status(record_bytes=record_bytes)
+                else:
+                    record_bytes = tail[
+                        start - first_start : start - first_start + length
+                    ]
+                new_entries[record_id] = (offset, len(record_bytes), status)
+                out.write(record_bytes)
+                offset += len(record_bytes)
+            out.flush()
+            os.fsync(out.fileno())
+        os.replace(temp_file, self.records_file)
+        return new_entries
+
+    def replace_record_strings(self, *, record_strings: dict) -> typing.Optional[dict]:
+        """Replace records in the records file (based on the offsets)
+
+        Records of the same length are replaced in-place,
+        otherwise the records file is replaced atomically.
+        Returns the record strings that are not in the records file
+        (None if the records file cannot be indexed).
+        """
+
+        entries = self.load()
+        if entries is None:
+            return None
+        replacements = {
+            record_id: record_string.encode("utf-8")
+            for record_id, record_string in record_strings.items()
+            if record_id in entries
+        }
+        remaining = {k: v for k, v in record_strings.items() if k not in entries}
+        if not replacements:
+            return remaining
+
+        if all(len(v) == entries[k][1] for k, v in replacements.items()):
+            new_entries = self.__replace_in_place(
+                entries=entries, replacements=replacements
+            )
+        else:
+            new_entries = self.__rewrite(entries=entries, replacements=replacements)
+
+        self.__save(entries=new_entries, stat=self.records_file.stat(), blob_sha=None)
+        return remaining
+
+    def invalidate(self) -> None:
+        """Remove the index"""
+        self.index_path.unlink(missing_ok=True)
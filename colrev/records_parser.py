@@ -0,0 +1,321 @@
+#! /usr/bin/env python
+"""Native (streaming) parser for the canonical records.bib format."""
+from __future__ import annotations
+
+import re
+import typing
+from copy import deepcopy
+
+from pybtex.bibtex.utils import split_name_list
+from pybtex.database import Person
+
+import colrev.env.language_service
+import colrev.exceptions as colrev_exceptions
+import colrev.record
+from colrev.constants import Fields
+from colrev.constants import FieldValues
+
+# Note : the canonical format is the one written by Dataset.parse_bibtex_str():
+#
+# @article{ID,
+#    colrev_origin                 = {file.bib/ID;},
+#    title                         = {Some title},
+# }
+#
+# Entries that deviate from it (e.g., @string macros, quoted values,
+# concatenations, comments) raise a NonCanonicalFormatError and
+# are handled by the pybtex parser (fallback).
+
+ENTRY_HEADER = re.compile(r"@([A-Za-z]+)\{([^\s,}]+),[ \t]*\n")
+FIELD_START = re.compile(r"\s*([A-Za-z_][\w.\-:]*)[ \t]*=[ \t]*\{")
+ENTRY_END = re.compile(r"\s*\}\s*\Z")
+BRACES = re.compile(r"[{}]")
+NAME_SEPARATOR = re.compile(" [Aa][Nn][Dd] ")
+# Names in "Last, First" format (without braces or escapes)
+# are not changed by pybtex (Person + format_name)
+CANONICAL_NAME = re.compile(
+    r"[^\s,{}\\~-][^,{}\\~]*[^\s,{}\\~-], [^\s,{}\\~-](?:[^,{}\\~]*[^\s,{}\\~-])?"
+)
+
+PERSON_FIELDS = [Fields.AUTHOR, Fields.EDITOR]
+SKIPPED_ENTRY_TYPES = ["string", "preamble", "comment"]
+
+# Note : order of the fields in the canonical format (followed by the other fields)
+FIELD_ORDER = [
+    Fields.ORIGIN,  # must be in second line
+    Fields.STATUS,
+    Fields.MD_PROV,
+    Fields.D_PROV,
+    Fields.PDF_ID,
+    Fields.SCREENING_CRITERIA,
+    Fields.FILE,  # Note : do not change this order (parsers rely on it)
+    Fields.PRESCREEN_EXCLUSION,
+    Fields.DOI,
+    Fields.GROBID_VERSION,
+    Fields.DBLP_KEY,
+    Fields.SEMANTIC_SCHOLAR_ID,
+    Fields.WEB_OF_SCIENCE_ID,
+    Fields.AUTHOR,
+    Fields.BOOKTITLE,
+    Fields.JOURNAL,
+    Fields.TITLE,
+    Fields.YEAR,
+    Fields.VOLUME,
+    Fields.NUMBER,
+    Fields.PAGES,
+    Fields.EDITOR,
+    Fields.PUBLISHER,
+    Fields.URL,
+    Fields.ABSTRACT,
+]
+
+
+def format_name(person: Person) -> str:
+    """Format a pybtex person (last, first)"""
+
+    def join(name_list: list) -> str:
+        return " ".join([name for name in name_list if name])
+
+    first = person.get_part_as_text("first")
+    middle = person.get_part_as_text("middle")
+    prelast = person.get_part_as_text("prelast")
+    last = person.get_part_as_text("last")
+    lineage = person.get_part_as_text("lineage")
+    name_string = ""
+    if last:
+        name_string += join([prelast, last])
+    if lineage:
+        name_string += f", {lineage}"
+    if first or middle:
+        name_string += ", "
+        name_string += join([first, middle])
+    return name_string
+
+
+def load_field_dict(*, value: str, field: str) -> dict:
+    """Parse a provenance field (colrev_masterdata_provenance/colrev_data_provenance)"""
+    # pylint: disable=too-many-branches
+
+    return_dict = {}
+    if field == Fields.MD_PROV:
+        # pylint: disable=colrev-missed-constant-usage
+        if value[:7] == "CURATED":
+            if value.count(";") == 0:
+                value += ";;"  # Note : temporary fix (old format)
+            if value.count(";") == 1:
+                value += ";"  # Note : temporary fix (old format)
+
+            if ":" in value:
+                source = value[value.find(":") + 1 : value[:-1].rfind(";")]
+            else:
+                source = ""
+            return_dict[FieldValues.CURATED] = {
+                "source": source,
+                "note": "",
+            }
+
+        elif value != "":
+            # Pybtex automatically replaces \n in fields.
+            # For consistency, we also do that for header_only mode:
+            if "\n" in value:
+                value = value.replace("\n", " ")
+            items = [x.lstrip() + ";" for x in (value + " ").split("; ") if x != ""]
+
+            for item in items:
+                key_source = item[: item[:-1].rfind(";")]
+                if ":" in key_source:
+                    note = item[item[:-1].rfind(";") + 1 : -1]
+                    key, source = key_source.split(":", 1)
+                    # key = key.rstrip().lstrip()
+                    return_dict[key] = {
+                        "source": source,
+                        "note": note,
+                    }
+                else:
+                    print(f"problem with masterdata_provenance_item {item}")
+
+    elif field == Fields.D_PROV:
+        if value != "":
+            # Note : pybtex replaces \n upon load
+            for item in (value + " ").split("; "):
+                if item == "":
+                    continue
+                item += ";"  # removed by split
+                key_source = item[: item[:-1].rfind(";")]
+                note = item[item[:-1].rfind(";") + 1 : -1]
+                if ":" in key_source:
+                    key, source = key_source.split(":", 1)
+                    return_dict[key] = {
+                        "source": source,
+                        "note": note,
+                    }
+                else:
+                    print(f"problem with data_provenance_item {item}")
+
+    else:
+        print(f"error loading dict_field: {field}")
+
+    return return_dict
+
+
+def parse_field_value(*, key: str, value: str) -> typing.Any:
+    """Convert a (whitespace-normalized) field value to the colrev standard"""
+
+    # Cast status to Enum
+    if key == Fields.STATUS:
+        return colrev.record.RecordState[value]
+    # DOIs are case insensitive -> use upper case.
+    if key == Fields.DOI:
+        return value.upper()
+    # Note : the following two lines are a temporary fix
+    # to converg colrev_origins to list items
+    if key == Fields.ORIGIN:
+        return [el.rstrip().lstrip() for el in value.split(";") if "" != el]
+    if key in colrev.record.Record.list_fields_keys:
+        return [el.rstrip() for el in (value + " ").split("; ") if "" != el]
+    if key in colrev.record.Record.dict_fields_keys:
+        return load_field_dict(value=value, field=key)
+    return value
+
+
+def __split_names(value: str) -> list:
+    if "{" in value:
+        names = split_name_list(value)
+    elif value:
+        names = [name.strip() for name in NAME_SEPARATOR.split(value)]
+    else:
+        names = []
+    # Note : pybtex (Person/format_name) is only needed for non-canonical names
+    return [
+        name if CANONICAL_NAME.fullmatch(name) else format_name(Person(name))
+        for name in names
+    ]
+
+
+def __find_value_end(entry_str: str, value_start: int) -> int:
+    value_end = entry_str.find("}", value_start)
+    if "{" not in entry_str[value_start:value_end]:
+        return value_end
+
+    depth = 1
+    for brace in BRACES.finditer(entry_str, value_start):
+        depth += 1 if brace.group() == "{" else -1
+        if depth == 0:
+            return brace.start()
+    return -1
+
+
+def __parse_entry(entry_str: str) -> dict:
+    header = ENTRY_HEADER.match(entry_str)
+    if not header:
+        raise colrev_exceptions.NonCanonicalFormatError(entry_str[:80])
+    entry_type, record_id = header.group(1), header.group(2)
+    if entry_type.lower() in SKIPPED_ENTRY_TYPES:
+        raise colrev_exceptions.NonCanonicalFormatError(f"@{entry_type}")
+
+    record_dict = {Fields.ID: record_id, Fields.ENTRYTYPE: entry_type.lower()}
+    persons: typing.Dict[str, str] = {}
+    seen_fields = set()
+    pos = header.end()
+    while True:
+        field_start = FIELD_START.match(entry_str, pos)
+        if not field_start:
+            break
+        key = field_start.group(1)
+        if key.lower() in seen_fields:
+            raise colrev_exceptions.NonCanonicalFormatError(
+                f"duplicate field {key} in {record_id}"
+            )
+        seen_fields.add(key.lower())
+
+        value_end = __find_value_end(entry_str, field_start.end())
+        if value_end == -1 or entry_str[value_end + 1 : value_end + 2] != ",":
+            raise colrev_exceptions.NonCanonicalFormatError(
+                f"field {key} in {record_id}"
+            )
+        pos = value_end + 2
+
+        # Note : same whitespace normalization as pybtex
+        value = " ".join(entry_str[field_start.end() : value_end].split())
+        if key.lower() in PERSON_FIELDS:
+            names = __split_names(value)
+            if names:
+                persons[key] = " and ".join(names)
+            continue
+        record_dict[key] = parse_field_value(key=key, value=value)
+
+    if not ENTRY_END.match(entry_str, pos):
+        raise colrev_exceptions.NonCanonicalFormatError(f"end of {record_id}")
+
+    record_dict.update(persons)
+    return record_dict
+
+
+def __read_entry_strings(file_object: typing.TextIO) -> typing.Iterator[str]:
+    entry_lines: typing.List[str] = []
+    for line in file_object:
+        if line[:1] == "@":
+            if entry_lines:
+                yield "".join(entry_lines)
+            entry_lines = [line]
+        elif entry_lines:
+            entry_lines.append(line)
+        elif line.strip():
+            raise colrev_exceptions.NonCanonicalFormatError(line[:80])
+    if entry_lines:
+        yield "".join(entry_lines)
+
+
+def read_records(*, file_object: typing.TextIO) -> typing.Iterator[dict]:
+    """Read records from a records.bib file object (generator, single pass)
+
+    Raises a NonCanonicalFormatError if the file deviates from the canonical format.
+    """
+
+    seen_ids = set()
+    for entry_str in __read_entry_strings(file_object):
+        record_dict = __parse_entry(entry_str)
+        if record_dict[Fields.ID].lower() in seen_ids:
+            raise colrev_exceptions.NonCanonicalFormatError(
+                f"duplicate ID {record_dict[Fields.ID]}"
+            )
+        seen_ids.add(record_dict[Fields.ID].lower())
+        yield record_dict
+
+
+def normalize_record(*, record_dict: dict) -> dict:
+    """Normalize a record dict to the values it has after saving and loading
+
+    Corresponds to Dataset.parse_bibtex_str() followed by parsing
+    (without serializing the record).
+    """
+
+    record_dict = deepcopy(record_dict)
+    try:
+        colrev.env.language_service.LanguageService().unify_to_iso_639_3_language_codes(
+            record=colrev.record.Record(data=record_dict)
+        )
+    except colrev_exceptions.InvalidLanguageCodeException:
+        del record_dict[Fields.LANGUAGE]
+    record_dict = colrev.record.Record(data=record_dict).get_data(stringify=True)
+
+    normalized_dict = {
+        Fields.ID: record_dict[Fields.ID],
+        Fields.ENTRYTYPE: record_dict[Fields.ENTRYTYPE].lower(),
+    }
+    persons = {}
+    for key, value in record_dict.items():
+        if key in [Fields.ID, Fields.ENTRYTYPE]:
+            continue
+        if key in FIELD_ORDER and value == "":
+            continue
+        value = " ".join(str(value).split())
+        if key.lower() in PERSON_FIELDS:
+            names = __split_names(value)
+            if names:
+                persons[key] = " and ".join(names)
+            continue
+        normalized_dict[key] = parse_field_value(key=key, value=value)
+
+    normalized_dict.update(persons)
+    return normalized_dict
@@ -7,12 +7,10 @@ import os
 import pprint
 import typing
 from dataclasses import asdict
-from datetime import timedelta
 from pathlib import Path
 from typing import Optional
 
 import git
-import requests_cache
 import yaml
 
 import colrev.checker
@@ -451,13 +449,13 @@ class ReviewManager:
         return colrev.env.environment_manager.EnvironmentManager()
 
     @classmethod
-    def get_cached_session(cls) -> requests_cache.CachedSession:
-        """Get a cached session"""
+    def get_cached_session(cls) -> colrev.env.http_session.StatisticsCachedSession:
+        """Get a cached session (shared, with per-host rate limits and retries)"""
+        import colrev.env.environment_manager
+        import colrev.env.http_session
 
-        return requests_cache.CachedSession(
-            str(colrev.env.environment_manager.EnvironmentManager.cache_path),
-            backend="sqlite",
-            expire_after=timedelta(days=30),
+        return colrev.env.http_session.SharedSession.get(
+            cache_path=colrev.env.environment_manager.EnvironmentManager.cache_path
         )
 
     @classmethod
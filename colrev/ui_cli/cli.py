@@ -233,7 +233,7 @@ def exit(
 @click.option(
     "--type",
     type=click.Choice(
-        package_manager.discover_packages(
+        package_manager.discover_package_identifiers(
             package_type=colrev.env.package_manager.PackageEndpointType.review_type,
             installed_only=True,
         )
@@ -428,7 +428,7 @@ def retrieve(
     "-a",
     "--add",
     type=click.Choice(
-        package_manager.discover_packages(
+        package_manager.discover_package_identifiers(
             package_type=colrev.env.package_manager.PackageEndpointType.search_source,
             installed_only=True,
         )
@@ -609,7 +609,7 @@ def load(
     "-a",
     "--add",
     type=click.Choice(
-        package_manager.discover_packages(
+        package_manager.discover_package_identifiers(
             package_type=colrev.env.package_manager.PackageEndpointType.prep,
             installed_only=True,
         )
@@ -780,7 +780,7 @@ def prep(
     "-a",
     "--add",
     type=click.Choice(
-        package_manager.discover_packages(
+        package_manager.discover_package_identifiers(
             package_type=colrev.env.package_manager.PackageEndpointType.prep_man,
             installed_only=True,
         )
@@ -871,7 +871,7 @@ def __view_dedupe_details(dedupe_operation: colrev.ops.dedupe.Dedupe) -> None:
     "-a",
     "--add",
     type=click.Choice(
-        package_manager.discover_packages(
+        package_manager.discover_package_identifiers(
             package_type=colrev.env.package_manager.PackageEndpointType.dedupe,
             installed_only=True,
         ),
@@ -1014,7 +1014,7 @@ def dedupe(
     "-a",
     "--add",
     type=click.Choice(
-        package_manager.discover_packages(
+        package_manager.discover_package_identifiers(
             package_type=colrev.env.package_manager.PackageEndpointType.prescreen,
             installed_only=True,
         )
@@ -1174,7 +1174,7 @@ def prescreen(
     "-a",
     "--add",
     type=click.Choice(
-        package_manager.discover_packages(
+        package_manager.discover_package_identifiers(
             package_type=colrev.env.package_manager.PackageEndpointType.screen,
             installed_only=True,
         )
@@ -1428,7 +1428,7 @@ def pdfs(
     "-a",
     "--add",
     type=click.Choice(
-        package_manager.discover_packages(
+        package_manager.discover_package_identifiers(
             package_type=colrev.env.package_manager.PackageEndpointType.pdf_get,
             installed_only=True,
         )
@@ -1542,7 +1542,7 @@ def pdf_get(
     "-a",
     "--add",
     type=click.Choice(
-        package_manager.discover_packages(
+        package_manager.discover_package_identifiers(
             package_type=colrev.env.package_manager.PackageEndpointType.pdf_get_man,
             installed_only=True,
         )
@@ -1700,7 +1700,7 @@ def __print_pdf_hashes(*, pdf_path: Path) -> None:
     "-a",
     "--add",
     type=click.Choice(
-        package_manager.discover_packages(
+        package_manager.discover_package_identifiers(
             package_type=colrev.env.package_manager.PackageEndpointType.pdf_prep,
             installed_only=True,
         )
@@ -1724,6 +1724,17 @@ def __print_pdf_hashes(*, pdf_path: Path) -> None:
     default=0,
     help="Batch size (when not all records should be processed in one batch).",
 )
+@click.option(
+    "--processes",
+    is_flag=True,
+    default=False,
+    help="Prepare PDFs in parallel processes (for CPU-bound preparation).",
+)
+@click.option(
+    "--cpu",
+    type=int,
+    help="Number of parallel processes/threads.",
+)
 @click.option(
     "--reprocess",
     is_flag=True,
@@ -1765,6 +1776,8 @@ def pdf_prep(
     params: str,
     batch_size: int,
     update_colrev_pdf_ids: bool,
+    processes: bool,
+    cpu: int,
     reprocess: bool,
     setup_custom_script: bool,
     tei: bool,
@@ -1799,7 +1812,9 @@ def pdf_prep(
 
     try:
         if update_colrev_pdf_ids:
-            pdf_prep_operation.update_colrev_pdf_ids()
+            if cpu:
+                pdf_prep_operation.cpus = cpu
+            pdf_prep_operation.update_colrev_pdf_ids(processes=processes)
 
         elif setup_custom_script:
             pdf_prep_operation.setup_custom_script()
@@ -1807,7 +1822,7 @@ def pdf_prep(
         elif tei:
             pdf_prep_operation.generate_tei()
         else:
-            pdf_prep_operation.main(batch_size=batch_size)
+            pdf_prep_operation.main(batch_size=batch_size, processes=processes, cpu=cpu)
 
     except KeyboardInterrupt:
         print("Stopped the process")
@@ -1841,7 +1856,7 @@ def __delete_first_pages_cli(
     "-a",
     "--add",
     type=click.Choice(
-        package_manager.discover_packages(
+        package_manager.discover_package_identifiers(
             package_type=colrev.env.package_manager.PackageEndpointType.pdf_prep_man,
             installed_only=True,
         )
@@ -1956,7 +1971,7 @@ def pdf_prep_man(
     "-a",
     "--add",
     type=click.Choice(
-        package_manager.discover_packages(
+        package_manager.discover_package_identifiers(
             package_type=colrev.env.package_manager.PackageEndpointType.data,
             installed_only=True,
         )
@@ -2304,6 +2319,17 @@ def __print_environment_status(
 @click.option(
     "-i", "--index", is_flag=True, default=False, help="Create the LocalIndex"
 )
+@click.option(
+    "--incremental",
+    is_flag=True,
+    default=False,
+    help="Index only repositories/records that changed (--index)",
+)
+@click.option(
+    "--cpu",
+    type=int,
+    help="Number of cpus (parallel processes, --index)",
+)
 @click.option(
     "--install",
     help="Install a new resource providing its url "
@@ -2343,6 +2369,8 @@ def __print_environment_status(
 def env(
     ctx: click.core.Context,
     index: bool,
+    incremental: bool,
+    cpu: int,
     install: str,
     pull: bool,
     status: bool,
@@ -2434,7 +2462,7 @@ def env(
     local_index = review_manager.get_local_index()
 
     if index:
-        local_index.index()
+        local_index.index(incremental=incremental, cpu=cpu)
         local_index.load_journal_rankings()
 
 
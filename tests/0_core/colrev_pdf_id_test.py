@@ -50,3 +50,34 @@ def test_pdf_hash(  # type: ignore
             pdf_path=target_path, page_nr=1, hash_size=32
         )
         assert expected_result == actual
+
+
+def test_pdf_hash_cache(helpers, tmp_path, monkeypatch) -> None:  # type: ignore
+    """Test the pdf hash cache and the page range check"""
+    monkeypatch.setattr(
+        colrev.qm.colrev_pdf_id, "PDF_HASH_CACHE_PATH", tmp_path / Path("cache.db")
+    )
+    pdf_path = tmp_path / Path("SrivastavaShainesh2015.pdf")
+    helpers.retrieve_test_file(
+        source=Path("SrivastavaShainesh2015.pdf"), target=pdf_path
+    )
+
+    expected = colrev.qm.colrev_pdf_id.get_pdf_hash(
+        pdf_path=pdf_path, page_nr=1, hash_size=16
+    )
+    assert (tmp_path / Path("cache.db")).is_file()
+    # Pages are rendered in memory
+    assert not list(tmp_path.glob("*.png"))
+
+    # Cached hashes are returned without rendering the page
+    with monkeypatch.context() as patch:
+        patch.setattr(
+            colrev.qm.colrev_pdf_id, "_compute_pdf_hash", lambda **kwargs: "invalid"
+        )
+        assert expected == colrev.qm.colrev_pdf_id.get_pdf_hash(
+            pdf_path=pdf_path, page_nr=1, hash_size=16
+        )
+
+    with pytest.raises(colrev_exceptions.InvalidPDFException):
+        colrev.qm.colrev_pdf_id.get_pdf_hash(pdf_path=pdf_path, page_nr=2, hash_size=16)
+    assert colrev.qm.colrev_pdf_id.PDF_HASH_CACHE_PATH == tmp_path / Path("cache.db")
@@ -1,2 +1,201 @@
 #!/usr/bin/env python
 """Tests for the dataset"""
+from copy import deepcopy
+
+import colrev.env.local_index
+import colrev.record
+import colrev.review_manager
+from colrev.constants import Fields
+
+
+def test_records_cache(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager, helpers
+) -> None:
+    """Test the records cache (.colrev/records.cache)"""
+
+    helpers.reset_commit(review_manager=base_repo_review_manager, commit="data_commit")
+    dataset = base_repo_review_manager.dataset
+    dataset.records_cache.invalidate()
+
+    header_items = dataset.load_records_dict(header_only=True)
+    records = dataset.load_records_dict()
+    assert dataset.records_cache.cache_path.is_file()
+
+    # Cached versions
+    assert records == dataset.load_records_dict()
+    assert header_items == dataset.load_records_dict(header_only=True)
+    assert header_items == {
+        r[Fields.ID]: r for r in dataset.records_cache.load_header_items()  # type: ignore
+    }
+
+    # Changes in the records file invalidate the cache
+    record_id = list(records.keys())[0]
+    records[record_id][Fields.TITLE] = "Changed title"
+    dataset.records_file.write_text(
+        dataset.parse_bibtex_str(recs_dict_in=records), encoding="utf-8"
+    )
+    assert dataset.records_cache.load_records_dict() is None
+    assert "Changed title" == dataset.load_records_dict()[record_id][Fields.TITLE]
+
+
+def test_records_index(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager, helpers
+) -> None:
+    """Test the records index (.colrev/records.index)"""
+
+    helpers.reset_commit(
+        review_manager=base_repo_review_manager, commit="dedupe_commit"
+    )
+    dataset = base_repo_review_manager.dataset
+    dataset.records_index.invalidate()
+    records = dataset.load_records_dict()
+    record_dict = list(records.values())[0]
+    for i, status in enumerate(
+        [
+            colrev.record.RecordState.md_processed,
+            colrev.record.RecordState.rev_prescreen_included,
+        ]
+    ):
+        records[f"Copy{i}"] = {
+            **deepcopy(record_dict),
+            Fields.ID: f"Copy{i}",
+            Fields.STATUS: status,
+        }
+    dataset.save_records_dict(records=records)
+
+    entries = dataset.records_index.load()
+    assert entries is not None
+    assert list(records.keys()) == list(entries.keys())
+    record_id = list(records.keys())[0]
+    assert str(records[record_id][Fields.STATUS]) == entries[record_id][2]
+
+    # Status-filtered and single-record reads
+    status = records[record_id][Fields.STATUS]
+    expected = [r for r in records.values() if r[Fields.STATUS] == status]
+    assert expected == list(
+        dataset.read_next_record(conditions=[{Fields.STATUS: status}])
+    )
+    assert [records[record_id]] == list(
+        dataset.read_next_record(conditions=[{Fields.ID: record_id}])
+    )
+
+    # Partial rewrites update the index
+    # (records of a different length: the records file is replaced atomically)
+    inode = dataset.records_file.stat().st_ino
+    records[record_id][Fields.TITLE] = "Changed title"
+    dataset.save_records_dict(records={record_id: records[record_id]}, partial=True)
+    assert inode != dataset.records_file.stat().st_ino
+    assert not dataset.records_file.with_suffix(".bib.tmp").is_file()
+    assert dataset.records_file.read_text(encoding="utf-8") == (
+        dataset.parse_bibtex_str(recs_dict_in=records) + "\n"
+    )
+    entries = dataset.records_index.load()
+    assert entries is not None
+    assert records == {
+        r[Fields.ID]: r
+        for r in dataset.read_next_record(
+            conditions=[{Fields.ID: record_id} for record_id in entries]
+        )
+    }
+
+    # Changes in the records file invalidate the index
+    records.pop(record_id)
+    dataset.records_file.write_text(
+        dataset.parse_bibtex_str(recs_dict_in=records) + "\n", encoding="utf-8"
+    )
+    assert record_id not in dataset.records_index.load()  # type: ignore
+
+    helpers.reset_commit(
+        review_manager=base_repo_review_manager, commit="dedupe_commit"
+    )
+
+
+def test_records_history(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager, helpers
+) -> None:
+    """Test the records history (.colrev/records_history.index)"""
+
+    helpers.reset_commit(review_manager=base_repo_review_manager, commit="data_commit")
+    dataset = base_repo_review_manager.dataset
+    records_history = dataset.records_history
+    records_history.invalidate()
+    git_repo = dataset.get_repo()
+    record_id = "SrivastavaShainesh2015"
+
+    # Reference: parse the records file of every commit
+    expected, prev_record = [], {}
+    for commit in git_repo.iter_commits(reverse=True):
+        try:
+            filecontents = (commit.tree / "data" / "records.bib").data_stream.read()
+        except KeyError:
+            continue
+        records_dict = dataset.load_records_dict(load_str=filecontents.decode("utf-8"))
+        if record_id in records_dict and records_dict[record_id] != prev_record:
+            prev_record = records_dict[record_id]
+            expected.append(prev_record)
+
+    versions = [
+        dataset.load_records_dict(load_str=record_str)[record_id]
+        for _, record_str in records_history.get_record_strings(record_id=record_id)
+    ]
+    assert expected == versions
+    assert len(versions) < len(list(git_repo.iter_commits()))
+
+    records = dataset.load_records_dict()
+    assert {
+        r[Fields.ID]: (str(r[Fields.STATUS]), r[Fields.ORIGIN])
+        for r in records.values()
+    } == records_history.get_latest_records()
+    assert [record_id] == records_history.get_record_ids(
+        origin=records[record_id][Fields.ORIGIN][0]
+    )
+
+    # Commits update the index incrementally
+    records[record_id][Fields.TITLE] = "Changed title"
+    dataset.save_records_dict(records=records)
+    dataset.add_changes(path=dataset.RECORDS_FILE_RELATIVE)
+    dataset.create_commit(
+        msg="Change title",
+        author=git_repo.head.commit.author,
+        committer=git_repo.head.commit.committer,
+        hook_skipping=True,
+    )
+    *_, (commit_sha, record_str) = records_history.get_record_strings(
+        record_id=record_id
+    )
+    assert git_repo.head.commit.hexsha == commit_sha
+    assert "Changed title" in record_str
+    assert "Changed title" not in (
+        records_history.load_records_file(prior=True) or b""
+    ).decode("utf-8")
+
+    # Resets (rewritten history) rebuild the index
+    helpers.reset_commit(review_manager=base_repo_review_manager, commit="data_commit")
+    assert expected == [
+        dataset.load_records_dict(load_str=record_str)[record_id]
+        for _, record_str in records_history.get_record_strings(record_id=record_id)
+    ]
+
+
+def test_set_ids_retrieve_selected_as_prepared(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager, helpers, mocker
+) -> None:
+    """Test that set_ids() retrieves selected records with the md_prepared status"""
+
+    helpers.reset_commit(review_manager=base_repo_review_manager, commit="load_commit")
+    dataset = base_repo_review_manager.dataset
+    records = dataset.load_records_dict()
+    record_id = list(records.keys())[0]
+    assert colrev.record.RecordState.md_imported == records[record_id][Fields.STATUS]
+
+    retrieve_many = mocker.spy(colrev.env.local_index.LocalIndex, "retrieve_many")
+    dataset.set_ids(records=records, selected_ids=[record_id])
+    assert [colrev.record.RecordState.md_prepared] == [
+        r[Fields.STATUS] for r in retrieve_many.call_args.kwargs["records"]
+    ]
+    assert (
+        colrev.record.RecordState.md_imported
+        == list(dataset.load_records_dict().values())[0][Fields.STATUS]
+    )
+
+    helpers.reset_commit(review_manager=base_repo_review_manager, commit="load_commit")
@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+"""Tests of the ID allocator"""
+import itertools
+import random
+import string
+
+import pytest
+
+import colrev.id_allocator
+
+
+def reference_next_unique_id(temp_id: str, existing_ids: list) -> str:
+    """Previous (quadratic) implementation of generate_next_unique_id"""
+    order = 0
+    letters = list(string.ascii_lowercase)
+    next_unique_id = temp_id
+    appends: list = []
+    while next_unique_id.lower() in [i.lower() for i in existing_ids]:
+        if len(appends) == 0:
+            order += 1
+            appends = list(itertools.product(letters, repeat=order))
+        next_unique_id = temp_id + "".join(list(appends.pop(0)))
+    return next_unique_id
+
+
+@pytest.mark.parametrize(
+    "number, expected",
+    [(1, "a"), (26, "z"), (27, "aa"), (28, "ab"), (52, "az"), (53, "ba"), (703, "aaa")],
+)
+def test_get_id_suffix(number: int, expected: str) -> None:
+    """Test the ID suffixes"""
+    assert expected == colrev.id_allocator.get_id_suffix(number=number)
+
+
+def test_id_allocator() -> None:
+    """Test the ID allocator against the previous implementation"""
+
+    rng = random.Random(42)
+    stems = ["Smith2020", "smith2020", "Doe2019", "Doe2019a", "Anonymous"]
+    existing_ids: list = []
+    id_allocator = colrev.id_allocator.IDAllocator()
+    for _ in range(800):
+        if existing_ids and rng.random() < 0.3:
+            record_id = existing_ids.pop(rng.randrange(len(existing_ids)))
+            id_allocator.remove(record_id=record_id)
+            assert record_id not in id_allocator
+            continue
+        temp_id = rng.choice(stems)
+        expected = reference_next_unique_id(temp_id, existing_ids)
+        assert expected == id_allocator.allocate(temp_id=temp_id)
+        existing_ids.append(expected)
+    assert len(existing_ids) == len(id_allocator)
@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 """Tests of the Record class"""
+import random
 from pathlib import Path
 
 import pytest
@@ -887,6 +888,74 @@ def test_get_record_similarity() -> None:
     assert expected == actual
 
 
+def test_get_similarity_matrix() -> None:
+    """Test record.get_similarity_matrix()"""
+
+    base = {
+        Fields.AUTHOR: "Rai, Arun",
+        Fields.TITLE: "Editorial",
+        Fields.YEAR: "2020",
+        Fields.JOURNAL: "MIS Quarterly",
+        Fields.VOLUME: "45",
+        Fields.NUMBER: "1",
+        "container_title": "MIS Quarterly",
+    }
+    records = [
+        base,
+        {**base, Fields.TITLE: "editorial"},
+        {**base, Fields.AUTHOR: "Rai, A.", Fields.TITLE: "Editorial: next steps"},
+        {**base, Fields.JOURNAL: "nan", "container_title": "ICIS", Fields.YEAR: 2019},
+        {**base, Fields.AUTHOR: "", Fields.NUMBER: "2", "container_title": ""},
+        {**base, Fields.TITLE: float("nan")},
+    ]
+
+    actual = colrev.record.Record.get_similarity_matrix(
+        records_a=records, records_b=records[::-1]
+    )
+    assert (len(records), len(records)) == actual.shape
+    for i, record_a in enumerate(records):
+        for j, record_b in enumerate(records[::-1]):
+            expected = colrev.record.Record.get_similarity_detailed(
+                record_a=record_a, record_b=record_b
+            )["score"]
+            assert expected == actual[i, j]
+
+    # Randomized records (including non-distinctive titles, i.e., scores with ties
+    # at the rounding boundaries)
+    rng = random.Random(42)
+
+    def random_str(max_len: int) -> str:
+        return "".join(rng.choice("abcde ") for _ in range(rng.randint(1, max_len)))
+
+    records = [
+        {
+            Fields.AUTHOR: random_str(12),
+            Fields.TITLE: rng.choice([random_str(20), "editorial"]),
+            Fields.YEAR: rng.choice(["2019", "2020", "2021"]),
+            Fields.JOURNAL: rng.choice(["MIS Quarterly", "nan"]),
+            Fields.VOLUME: rng.choice(["1", "2"]),
+            Fields.NUMBER: rng.choice(["1", "2"]),
+            "container_title": rng.choice(["", random_str(10)]),
+        }
+        for _ in range(60)
+    ]
+    actual = colrev.record.Record.get_similarity_matrix(
+        records_a=records, records_b=records
+    )
+    for i, record_a in enumerate(records):
+        for j, record_b in enumerate(records):
+            expected = colrev.record.Record.get_similarity_detailed(
+                record_a=record_a, record_b=record_b
+            )["score"]
+            assert expected == actual[i, j]
+
+    expected_record_similarities = [[0.854]]
+    actual = colrev.record.Record.get_record_similarity_matrix(
+        records_a=[r1], records_b=[r2]
+    )
+    assert expected_record_similarities == actual.tolist()
+
+
 def test_merge_select_non_all_caps() -> None:
     """Test record.merge() - all-caps cases"""
     # Select title-case (not all-caps title) and full author name
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+"""Tests for the native records.bib parser"""
+import io
+
+import pytest
+from pybtex.database.input import bibtex
+
+import colrev.dataset
+import colrev.exceptions as colrev_exceptions
+import colrev.records_parser
+from colrev.constants import Fields
+
+CANONICAL_RECORDS = """@article{SmithDoe2020,
+   colrev_origin                 = {dblp.bib/000001;
+                                    search.bib/000002;},
+   colrev_status                 = {md_processed},
+   colrev_masterdata_provenance  = {author:dblp.bib/000001;;
+                                    title:dblp.bib/000001;;},
+   colrev_data_provenance        = {},
+   doi                           = {10.1111/isj.12345},
+   author                        = {Smith, John and van der Berg, J. R. and {World Bank} and X, Y},
+   journal                       = {Information Systems Journal},
+   title                         = {A {Nested {Title}}   with
+                                    line break},
+   year                          = {2020},
+   note                          = {},
+}
+
+@inproceedings{Doe2021,
+   colrev_origin                 = {search.bib/000003;},
+   colrev_status                 = {md_imported},
+   editor                        = {John Doe and Jane Roe},
+   title                         = {Second record},
+}
+"""
+
+
+def test_read_records_canonical() -> None:
+    """The native parser should be equivalent to the pybtex path"""
+
+    records = {
+        r[Fields.ID]: r
+        for r in colrev.records_parser.read_records(
+            file_object=io.StringIO(CANONICAL_RECORDS)
+        )
+    }
+    bib_data = bibtex.Parser().parse_string(CANONICAL_RECORDS)
+    expected = colrev.dataset.Dataset.parse_records_dict(records_dict=bib_data.entries)
+
+    assert expected == records
+    assert ["dblp.bib/000001", "search.bib/000002"] == records["SmithDoe2020"][
+        Fields.ORIGIN
+    ]
+    assert "10.1111/ISJ.12345" == records["SmithDoe2020"][Fields.DOI]
+    assert "Doe, John and Roe, Jane" == records["Doe2021"][Fields.EDITOR]
+
+
+@pytest.mark.parametrize(
+    "records_str",
+    [
+        '@string{MISQ = "MIS Quarterly"}\n',
+        '@article{Smith2020,\n   title = "Quoted title",\n}\n',
+        "@article{Smith2020,\n   title = {Missing comma}\n}\n",
+        "% comment\n@article{Smith2020,\n   title = {Title},\n}\n",
+        "@article{Smith2020,\n   title = {Title},\n}\n\n"
+        "@article{smith2020,\n   title = {Duplicate},\n}\n",
+    ],
+)
+def test_read_records_non_canonical(records_str: str) -> None:
+    """Non-canonical files should raise an error (fallback to pybtex)"""
+
+    with pytest.raises(colrev_exceptions.NonCanonicalFormatError):
+        list(colrev.records_parser.read_records(file_object=io.StringIO(records_str)))
+
+
+def test_normalize_record() -> None:
+    """normalize_record should correspond to saving and loading a record"""
+
+    bib_data = bibtex.Parser().parse_string(CANONICAL_RECORDS)
+    records = colrev.dataset.Dataset.parse_records_dict(records_dict=bib_data.entries)
+    record_dict = records["SmithDoe2020"]
+    record_dict[Fields.TITLE] = "  A {Nested {Title}}\n  with   line break "
+    record_dict[Fields.AUTHOR] = "John Smith and {World Bank}"
+    record_dict[Fields.ABSTRACT] = ""
+    record_dict[Fields.LANGUAGE] = "en"
+
+    bibtex_str = colrev.dataset.Dataset.parse_bibtex_str(
+        recs_dict_in={record_dict[Fields.ID]: record_dict}
+    )
+    bib_data = bibtex.Parser().parse_string(bibtex_str)
+    expected = colrev.dataset.Dataset.parse_records_dict(records_dict=bib_data.entries)
+
+    actual = colrev.records_parser.normalize_record(record_dict=record_dict)
+    assert expected["SmithDoe2020"] == actual
+    assert "eng" == actual[Fields.LANGUAGE]
+    assert Fields.ABSTRACT not in actual
+    # The record is not modified
+    assert "en" == record_dict[Fields.LANGUAGE]
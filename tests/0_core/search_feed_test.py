@@ -2,6 +2,7 @@
 """Tests of the CoLRev search feeds"""
 import pytest
 
+import colrev.ops.search_feed
 import colrev.review_manager
 import colrev.settings
 from colrev.constants import Fields
@@ -10,6 +11,7 @@ from colrev.constants import Fields
 def test_search_feed(  # type: ignore
     base_repo_review_manager: colrev.review_manager.ReviewManager,
     search_feed,
+    mocker,
 ) -> None:
     """Test the search feed"""
 
@@ -37,4 +39,96 @@ def test_search_feed(  # type: ignore
     search_feed.save_feed_file()
     base_repo_review_manager.create_commit(msg="test")
 
+    # Note : main records are retrieved based on their origins
+    record_dict = {Fields.ID: record_dict[Fields.ID], Fields.ENTRYTYPE: "article"}
+    main_record_dict = {
+        Fields.ID: "Smith2020",
+        Fields.ENTRYTYPE: "article",
+        Fields.ORIGIN: [f"{search_feed.origin_prefix}/{record_dict[Fields.ID]}"],
+        Fields.STATUS: colrev.record.RecordState.md_prepared,
+        Fields.MD_PROV: {},
+        Fields.D_PROV: {},
+        Fields.TITLE: "A title",
+    }
+    records = {
+        "Other2020": {Fields.ID: "Other2020", Fields.ORIGIN: ["other.bib/0001"]},
+        "Smith2020": main_record_dict,
+    }
+    prev_record_dict = {**record_dict, Fields.TITLE: "A title"}
+    assert not search_feed.update_existing_record(
+        records=records,
+        record_dict=prev_record_dict,
+        prev_record_dict_version=prev_record_dict,
+        source=search_feed.source,
+        update_time_variant_fields=True,
+    )
+    assert search_feed.update_existing_record(
+        records=records,
+        record_dict={**record_dict, Fields.TITLE: "An updated title"},
+        prev_record_dict_version=prev_record_dict,
+        source=search_feed.source,
+        update_time_variant_fields=True,
+    )
+    assert "An updated title" == main_record_dict[Fields.TITLE]
+    # Note : records and origins that change in-place are found
+    records["Other2020"][Fields.ORIGIN].append(main_record_dict[Fields.ORIGIN][0])
+    main_record_dict[Fields.ORIGIN] = []
+    assert search_feed.update_existing_record(
+        records=records,
+        record_dict={**record_dict, Fields.TITLE: "A changed title"},
+        prev_record_dict_version=prev_record_dict,
+        source=search_feed.source,
+        update_time_variant_fields=True,
+    )
+    assert "A changed title" == records["Other2020"][Fields.TITLE]
+    assert "An updated title" == main_record_dict[Fields.TITLE]
+    other_record_dict = records.pop("Other2020")
+    assert not search_feed.update_existing_record(
+        records=records,
+        record_dict={**record_dict, Fields.TITLE: "Another title"},
+        prev_record_dict_version=prev_record_dict,
+        source=search_feed.source,
+        update_time_variant_fields=True,
+    )
+    # Note : misses do not rebuild the origin index (records that are not yet loaded)
+    build_origin_index = mocker.spy(
+        colrev.ops.search_feed.GeneralOriginFeed,
+        "_GeneralOriginFeed__build_origin_index",
+    )
+    other_feed_record_dict = {**prev_record_dict, Fields.ID: "0002"}
+    for _ in range(3):
+        assert not search_feed.update_existing_record(
+            records=records,
+            record_dict={**other_feed_record_dict, Fields.TITLE: "A new title"},
+            prev_record_dict_version=other_feed_record_dict,
+            source=search_feed.source,
+            update_time_variant_fields=True,
+        )
+    assert 0 == build_origin_index.call_count
+
+    # Note : records that are added (e.g., loaded) are found
+    records["New2020"] = {
+        **main_record_dict,
+        Fields.ID: "New2020",
+        Fields.ORIGIN: [f"{search_feed.origin_prefix}/0002"],
+        Fields.TITLE: "A title",
+    }
+    assert search_feed.update_existing_record(
+        records=records,
+        record_dict={**other_feed_record_dict, Fields.TITLE: "A new title"},
+        prev_record_dict_version=other_feed_record_dict,
+        source=search_feed.source,
+        update_time_variant_fields=True,
+    )
+    assert "A new title" == records["New2020"][Fields.TITLE]
+    assert 1 == build_origin_index.call_count
+    other_record_dict[Fields.ORIGIN] = ["other.bib/0001"]
+    assert not search_feed.update_existing_record(
+        records={"Other2020": other_record_dict},
+        record_dict={**record_dict, Fields.TITLE: "Another title"},
+        prev_record_dict_version=prev_record_dict,
+        source=search_feed.source,
+        update_time_variant_fields=True,
+    )
+
     # TODO : integrate crossref_feed.nr_added += 1 into feed (including update_existing_record())
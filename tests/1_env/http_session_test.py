@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+"""Test the shared http session"""
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from datetime import timedelta
+from pathlib import Path
+
+import requests_mock
+
+import colrev.env.http_session
+
+
+def test_token_bucket() -> None:
+    """Test the token bucket"""
+
+    bucket = colrev.env.http_session.TokenBucket(rate=20, capacity=2)
+    start = time.monotonic()
+    for _ in range(4):
+        bucket.acquire()
+    # The first two tokens are available immediately, the others after 1/20 s each
+    assert time.monotonic() - start >= 0.09
+
+
+def test_host_limiter_concurrency() -> None:
+    """Test the concurrency limit of the host limiter"""
+
+    limiter = colrev.env.http_session.HostLimiter(
+        host_limit=colrev.env.http_session.HostLimit(
+            requests_per_second=1000, max_concurrency=2
+        )
+    )
+    active, max_active = [0], [0]
+    lock = threading.Lock()
+
+    def request() -> None:
+        with limiter:
+            with lock:
+                active[0] += 1
+                max_active[0] = max(max_active[0], active[0])
+            time.sleep(0.01)
+            with lock:
+                active[0] -= 1
+
+    threads = [threading.Thread(target=request) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert max_active[0] == 2
+
+
+def test_shared_session(tmp_path: Path) -> None:
+    """Test the shared session"""
+
+    session = colrev.env.http_session.SharedSession.get(
+        cache_path=tmp_path / "requests_cache"
+    )
+    assert session is colrev.env.http_session.SharedSession.get(
+        cache_path=tmp_path / "requests_cache"
+    )
+    assert isinstance(
+        session.get_adapter("https://api.crossref.org/works"),
+        colrev.env.http_session.RateLimitedAdapter,
+    )
+    assert colrev.env.http_session.RateLimitedAdapter.get_host_limiter(
+        host="api.crossref.org"
+    ) is colrev.env.http_session.RateLimitedAdapter.get_host_limiter(
+        host="api.crossref.org"
+    )
+
+
+def test_shared_session_cache_policies(tmp_path: Path) -> None:
+    """Test the expiration policies, negative caching and statistics"""
+
+    session = colrev.env.http_session.SharedSession.get(
+        cache_path=tmp_path / "policies_cache"
+    )
+    with sqlite3.connect(session.cache.responses.db_path) as con:
+        assert "wal" == con.execute("PRAGMA journal_mode").fetchone()[0]
+
+    doi_url = "https://api.crossref.org/works/10.1000/found"
+    missing_url = "https://api.crossref.org/works/10.1000/missing"
+    search_url = "https://api.crossref.org/works?query.bibliographic=test"
+    with requests_mock.Mocker() as req_mock:
+        req_mock.get(doi_url, json={"status": "ok"})
+        req_mock.get(missing_url, status_code=404)
+        req_mock.get(search_url, json={"status": "ok"})
+        for _ in range(2):
+            found = session.get(doi_url)
+            missing = session.get(missing_url)
+            search = session.get(search_url)
+        assert 3 == req_mock.call_count
+
+    assert found.from_cache and missing.from_cache and search.from_cache
+    now = datetime.utcnow()
+    assert found.expires > now + timedelta(days=100)
+    assert missing.expires < now + timedelta(days=8)
+    assert search.expires < now + timedelta(days=8)
+    assert {
+        "hits": 3,
+        "misses": 3,
+        "negative_hits": 1,
+        "hit_rate": 0.5,
+    } == session.get_statistics()
@@ -1,5 +1,8 @@
 #!/usr/bin/env python
 """Test the local_index"""
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
 from pathlib import Path
 
 import pytest
@@ -67,6 +70,89 @@ def test_get_year_from_toc(local_index) -> None:  # type: ignore
     assert expected == actual
 
 
+def test_sqlite_indexes_and_concurrent_reads(local_index) -> None:  # type: ignore
+    """Test the secondary indexes and (lock-free) reads from multiple threads"""
+
+    conn = sqlite3.connect(str(local_index.SQLITE_PATH))
+    index_names = [
+        row[0]
+        for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='index' AND tbl_name=?",
+            (local_index.RECORD_INDEX,),
+        )
+    ]
+    journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    conn.close()
+    assert "wal" == journal_mode
+    for column in local_index.GLOBAL_KEY_COLUMNS:
+        assert f"{local_index.RECORD_INDEX}_{column}" in index_names
+
+    record_dict = {
+        Fields.ENTRYTYPE: ENTRYTYPES.ARTICLE,
+        Fields.JOURNAL: "MIS Quarterly",
+        Fields.VOLUME: "42",
+        Fields.NUMBER: "2",
+    }
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        years = list(
+            executor.map(
+                lambda _: local_index.get_year_from_toc(record_dict=record_dict),
+                range(32),
+            )
+        )
+    assert ["2018"] * 32 == years
+
+
+def test_retrieve_many(local_index, local_index_test_records_dict) -> None:  # type: ignore
+    """Test retrieve_many() (batched) against retrieve()"""
+
+    records = []
+    for record_dict in local_index_test_records_dict[Path("misq.bib")].values():
+        record_dict = deepcopy(record_dict)
+        record_dict.pop(Fields.COLREV_ID, None)
+        records.append(record_dict)
+    # Records that can only be retrieved based on the global keys (or not at all)
+    records.append(
+        {
+            Fields.ID: "DOIOnly",
+            Fields.ENTRYTYPE: ENTRYTYPES.ARTICLE,
+            Fields.DOI: records[0].get(Fields.DOI, "10.1000/unknown"),
+        }
+    )
+    records.append(
+        {
+            Fields.ID: "NotIndexed",
+            Fields.ENTRYTYPE: ENTRYTYPES.ARTICLE,
+            Fields.TITLE: "A record that is not indexed",
+            Fields.AUTHOR: "Doe, John",
+        }
+    )
+
+    expected = {}
+    for record_dict in records:
+        try:
+            expected[record_dict[Fields.ID]] = local_index.retrieve(
+                record_dict=record_dict
+            )
+        except colrev.exceptions.RecordNotInIndexException:
+            pass
+
+    records_before = deepcopy(records)
+    actual = local_index.retrieve_many(records=records)
+    assert expected == actual
+    assert records_before == records
+    assert "NotIndexed" not in actual
+    assert len(actual) > 1
+
+    # retrieve() uses the prefetched rows
+    local_index.prefetch(records=records)
+    for record_dict in records:
+        if record_dict[Fields.ID] in expected:
+            assert expected[record_dict[Fields.ID]] == local_index.retrieve(
+                record_dict=record_dict
+            )
+
+
 def test_search(local_index) -> None:  # type: ignore
     """Test search()"""
 
@@ -107,13 +193,14 @@ def test_search(local_index) -> None:  # type: ignore
                 Fields.D_PROV: {
                     Fields.DOI: {"note": "", "source": "CROSSREF.bib/000516"},
                     Fields.URL: {"note": "", "source": "DBLP.bib/000528"},
+                    "literature_review": {"note": "", "source": "CURATED:gh..."},
                 },
                 Fields.MD_PROV: {"CURATED": {"note": "", "source": "gh..."}},
                 Fields.STATUS: colrev.record.RecordState.md_prepared,
                 "curation_ID": "gh...#AlaviLeidner2001",
                 Fields.DOI: "10.2307/3250961",
                 Fields.JOURNAL: "MIS Quarterly",
-                # TODO : should expect literature_review = True (layered field?!)
+                "literature_review": "yes",
                 Fields.LANGUAGE: "eng",
                 Fields.NUMBER: "1",
                 Fields.TITLE: "Review: Knowledge Management and Knowledge Management Systems: Conceptual Foundations and Research Issues",
@@ -236,3 +323,144 @@ def test_retrieve_based_on_colrev_pdf_id(local_index) -> None:  # type: ignore
 # and the index_tei immediately returns.
 
 # def method(): # pragma: no cover
+
+
+def test_index_colrev_project_incremental(  # type: ignore
+    base_repo_review_manager, helpers, mocker, tmp_path, capsys
+) -> None:
+    """Test the incremental indexing of a CoLRev project"""
+
+    helpers.reset_commit(review_manager=base_repo_review_manager, commit="data_commit")
+    mocker.patch.object(
+        colrev.env.local_index.LocalIndex,
+        "SQLITE_PATH",
+        tmp_path / Path("sqlite_index_incremental_test.db"),
+    )
+    local_index = colrev.env.local_index.LocalIndex()
+    local_index.reinitialize_sqlite_db()
+    repo_source_path = base_repo_review_manager.path
+
+    local_index.index_colrev_project(
+        repo_source_path=repo_source_path, incremental=True
+    )
+    indexed_records = local_index.search(query="title LIKE '%'")
+    assert ["SrivastavaShainesh2015"] == [r.data[Fields.ID] for r in indexed_records]
+
+    # Unchanged repositories are skipped
+    capsys.readouterr()
+    local_index.index_colrev_project(
+        repo_source_path=repo_source_path, incremental=True
+    )
+    assert "(unchanged)" in capsys.readouterr().out
+
+    # Changed records are updated (and outdated versions are removed)
+    records = base_repo_review_manager.dataset.load_records_dict()
+    records["SrivastavaShainesh2015"][Fields.TITLE] = "Changed title"
+    base_repo_review_manager.dataset.save_records_dict(records=records)
+    base_repo_review_manager.create_commit(msg="change title")
+    local_index.index_colrev_project(
+        repo_source_path=repo_source_path, incremental=True
+    )
+    indexed_records = local_index.search(query="title LIKE '%'")
+    assert ["Changed title"] == [r.data[Fields.TITLE] for r in indexed_records]
+
+
+def test_index_colrev_project_incremental_curated(  # type: ignore
+    base_repo_review_manager, helpers, mocker, tmp_path
+) -> None:
+    """Test the incremental indexing of a project with curated fields"""
+
+    helpers.reset_commit(review_manager=base_repo_review_manager, commit="data_commit")
+    mocker.patch.object(
+        colrev.env.local_index.LocalIndex,
+        "SQLITE_PATH",
+        tmp_path / Path("sqlite_index_incremental_curated_test.db"),
+    )
+    local_index = colrev.env.local_index.LocalIndex()
+    local_index.reinitialize_sqlite_db()
+    repo_source_path = base_repo_review_manager.path
+
+    base_repo_review_manager.settings.data.data_package_endpoints.append(
+        {
+            "endpoint": "colrev.colrev_curation",
+            "curation_url": "https://github.com/CoLRev-curations/test",
+            "curated_masterdata": False,
+            "masterdata_restrictions": {},
+            "curated_fields": [Fields.DOI],
+        }
+    )
+    base_repo_review_manager.save_settings()
+    base_repo_review_manager.create_commit(msg="add curation endpoint")
+    local_index.index_colrev_project(
+        repo_source_path=repo_source_path, incremental=True
+    )
+
+    # Changed records (with the same colrev_id) are updated
+    # (not only amended with layered fields)
+    records = base_repo_review_manager.dataset.load_records_dict()
+    records["SrivastavaShainesh2015"][Fields.ABSTRACT] = "Changed abstract"
+    base_repo_review_manager.dataset.save_records_dict(records=records)
+    base_repo_review_manager.create_commit(msg="change abstract")
+    local_index.index_colrev_project(
+        repo_source_path=repo_source_path, incremental=True
+    )
+    indexed_records = local_index.search(query="title LIKE '%'")
+    assert ["Changed abstract"] == [r.data[Fields.ABSTRACT] for r in indexed_records]
+
+
+def test_index_incremental_legacy_schema(  # type: ignore
+    base_repo_review_manager, helpers, mocker, tmp_path
+) -> None:
+    """Test that databases with the legacy schema (bibtex column) are reinitialized"""
+
+    helpers.reset_commit(review_manager=base_repo_review_manager, commit="data_commit")
+    sqlite_path = tmp_path / Path("sqlite_index_legacy_test.db")
+    mocker.patch.object(colrev.env.local_index.LocalIndex, "SQLITE_PATH", sqlite_path)
+    legacy_columns = [
+        "colrev_id",
+        "citation_key",
+        "title",
+        "abstract",
+        "file",
+        "tei",
+        "fulltext",
+        "url",
+        "doi",
+        "dblp_key",
+        "colrev_pdf_id",
+        "bibtex",
+        "layered_fields",
+    ]
+    conn = sqlite3.connect(str(sqlite_path))
+    conn.execute(
+        "CREATE TABLE record_index(id TEXT PRIMARY KEY, "
+        + ",".join(legacy_columns)
+        + ")"
+    )
+    conn.execute("CREATE TABLE toc_index(toc_key TEXT PRIMARY KEY, colrev_ids)")
+    conn.commit()
+    conn.close()
+
+    mocker.patch.object(
+        colrev.env.environment_manager.EnvironmentManager,
+        "local_repos",
+        return_value=[{"repo_source_path": base_repo_review_manager.path}],
+    )
+    mocker.patch.object(
+        colrev.env.environment_manager.EnvironmentManager,
+        "get_curated_outlets",
+        return_value=[],
+    )
+    mocker.patch("colrev.env.local_index.requests_cache.CachedSession")
+    mocker.patch("colrev.env.local_index.Timer")
+    mocker.patch("colrev.env.local_index.ProcessPoolExecutor", ThreadPoolExecutor)
+
+    local_index = colrev.env.local_index.LocalIndex()
+    local_index.index(incremental=True)
+
+    conn = sqlite3.connect(str(sqlite_path))
+    columns = [row[1] for row in conn.execute("PRAGMA table_info(record_index)")]
+    conn.close()
+    assert "record" in columns and "bibtex" not in columns
+    indexed_records = local_index.search(query="title LIKE '%'")
+    assert ["SrivastavaShainesh2015"] == [r.data[Fields.ID] for r in indexed_records]
@@ -1,7 +1,10 @@
 #!/usr/bin/env python
 """Tests for the colrev package manager"""
 import importlib.util
+import json
 import os
+import subprocess  # nosec
+import sys
 from pathlib import Path
 
 import pytest
@@ -398,3 +401,36 @@ def test_update_package_list(
 
     os.chdir(Path(colrev_spec.origin).parents[1])  # type: ignore
     package_manager.update_package_list()
+
+
+def test_cli_import_time() -> None:
+    """Test that importing the CLI does not import the package endpoints
+
+    The import-time profile (python -X importtime) tracks the CLI cold-start latency.
+    """
+
+    endpoint_modules = {
+        package_item["endpoint"].rsplit(".", 1)[0]
+        for package_list in json.loads(
+            colrev.env.utils.get_package_file_content(  # type: ignore
+                file_path=Path("template/package_endpoints.json")
+            ).decode("utf-8")
+        ).values()
+        for package_item in package_list
+    }
+
+    result = subprocess.run(  # nosec
+        [sys.executable, "-X", "importtime", "-c", "import colrev.ui_cli.cli"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Format: "import time: self [us] | cumulative | imported package"
+    import_times = {
+        line.split("|")[2].strip(): int(line.split("|")[1])
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and line.split("|")[1].strip().isdigit()
+    }
+    print(f"CLI import time: {import_times['colrev.ui_cli.cli'] / 1e6:.2f}s")
+
+    assert not endpoint_modules & set(import_times)
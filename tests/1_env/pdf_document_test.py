@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+"""Tests of the PDFDocumentContext"""
+import os
+from pathlib import Path
+
+import colrev.env.pdf_document
+import colrev.qm.colrev_pdf_id
+import colrev.record
+from colrev.constants import Fields
+
+
+def test_pdf_document_context(helpers, tmp_path) -> None:  # type: ignore
+    """Test the PDFDocumentContext"""
+
+    pdf_path = tmp_path / Path("WagnerLukyanenkoParEtAl2022.pdf")
+    helpers.retrieve_test_file(
+        source=Path("WagnerLukyanenkoParEtAl2022.pdf"), target=pdf_path
+    )
+    pdf_document = colrev.env.pdf_document.PDFDocumentContext(pdf_path=pdf_path)
+    record = colrev.record.Record(data={Fields.ID: "WagnerLukyanenkoParEtAl2022"})
+
+    record.set_pages_in_pdf(pdf_document=pdf_document)
+    assert 18 == record.data["pages_in_file"]
+    assert 18 == pdf_document.get_number_of_pages()
+
+    expected = (
+        helpers.test_data_path / Path("WagnerLukyanenkoParEtAl2022_content.txt")
+    ).read_text(encoding="utf-8")
+    actual = record.extract_text_by_page(pages=[0], pdf_document=pdf_document)
+    assert expected == actual.rstrip()
+    # Memoized pages are combined with new ones
+    assert actual in pdf_document.extract_text_by_page(pages=[0, 1])
+
+    expected = colrev.qm.colrev_pdf_id.get_pdf_hash(
+        pdf_path=pdf_path, page_nr=1, hash_size=16
+    )
+    assert expected == pdf_document.get_page_hash(page_nr=1, hash_size=16)
+    assert pdf_document.get_colrev_pdf_id() == colrev.record.Record.get_colrev_pdf_id(
+        pdf_path=pdf_path
+    )
+    assert pdf_document.get_page_text(page_nr=0)
+
+    # Changes of the file invalidate the context
+    assert pdf_document.is_valid()
+    stat = pdf_path.stat()
+    os.utime(pdf_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+    assert not pdf_document.is_valid()
+    pdf_document.close()
@@ -4,7 +4,11 @@ import platform
 from dataclasses import asdict
 from pathlib import Path
 
+import colrev.record
 import colrev.review_manager
+from colrev.constants import Fields
+
+# pylint: disable=protected-access
 
 
 def test_checks(  # type: ignore
@@ -70,3 +74,63 @@ def test_checks(  # type: ignore
             },
         ]
         assert expected == actual
+
+
+def test_check_repo_loads_records_once(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager, monkeypatch
+) -> None:
+    """Test that the checks share one records load"""
+
+    dataset = base_repo_review_manager.dataset
+    load_records_dict = dataset.load_records_dict
+    calls = []
+
+    def counting_load_records_dict(**kwargs):  # type: ignore
+        calls.append(kwargs)
+        return load_records_dict(**kwargs)
+
+    monkeypatch.setattr(dataset, "load_records_dict", counting_load_records_dict)
+    checker = colrev.checker.Checker(review_manager=base_repo_review_manager)
+    assert {"status": 0, "msg": "Everything ok."} == checker.check_repo()
+    assert [{}] == calls
+
+    assert (
+        "prep"
+        == colrev.checker.TRANSITION_TRIGGERS[
+            (
+                colrev.record.RecordState.md_imported,
+                colrev.record.RecordState.md_prepared,
+            )
+        ]
+    )
+
+    # Transitions other than load are reported (and not listed as invalid)
+    prior = {
+        Fields.STATUS: {
+            "test.bib/001": (0, colrev.record.RecordState.md_imported),
+            "test.bib/002": (1, colrev.record.RecordState.md_imported),
+        },
+        "persisted_IDs": [],
+    }
+    records = {
+        "Prepared2020": {
+            Fields.ID: "Prepared2020",
+            Fields.ORIGIN: ["test.bib/001"],
+            Fields.STATUS: colrev.record.RecordState.md_prepared,
+        },
+        "Included2020": {
+            Fields.ID: "Included2020",
+            Fields.ORIGIN: ["test.bib/002"],
+            Fields.STATUS: colrev.record.RecordState.rev_included,
+        },
+    }
+    status_data = checker._Checker__retrieve_status_data(  # type: ignore
+        prior=prior, records=records
+    )
+    assert [
+        {"Prepared2020": "prep"},
+        {"Included2020": "load"},
+    ] == status_data["status_transitions"]
+    assert ["Included2020: md_imported to rev_included"] == status_data[
+        "invalid_state_transitions"
+    ]
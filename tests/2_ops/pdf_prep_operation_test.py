@@ -1,6 +1,11 @@
 #!/usr/bin/env python
 """Tests of the CoLRev pdf-prep operations"""
+import multiprocessing as mp
+from pathlib import Path
+
+import colrev.record
 import colrev.review_manager
+from colrev.constants import Fields
 
 
 def test_pdf_prep(  # type: ignore
@@ -17,6 +22,67 @@ def test_pdf_prep(  # type: ignore
     pdf_prep_operation.main(batch_size=0)
 
 
+def test_pdf_prep_processes(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager, helpers
+) -> None:
+    """Test the pdf-prep operation (process-pool mode)"""
+
+    helpers.reset_commit(
+        review_manager=base_repo_review_manager, commit="pdf_get_commit"
+    )
+    helpers.retrieve_test_file(
+        source=Path("WagnerLukyanenkoParEtAl2022.pdf"),
+        target=base_repo_review_manager.path / Path("data/pdfs/test.pdf"),
+    )
+    records = base_repo_review_manager.dataset.load_records_dict()
+    for record_dict in records.values():
+        record_dict[Fields.FILE] = "data/pdfs/test.pdf"
+        record_dict[  # pylint: disable=colrev-direct-status-assign
+            Fields.STATUS
+        ] = colrev.record.RecordState.pdf_imported
+    base_repo_review_manager.dataset.save_records_dict(records=records)
+    base_repo_review_manager.dataset.add_changes(path=Path("data/pdfs/test.pdf"))
+    base_repo_review_manager.create_commit(msg="Add PDF")
+    commit_sha = base_repo_review_manager.dataset.get_last_commit_sha()
+
+    pdf_prep_operation = base_repo_review_manager.get_pdf_prep_operation()
+    pdf_prep_operation.main(batch_size=0)
+    expected = base_repo_review_manager.dataset.load_records_dict()
+    assert all(
+        colrev.record.RecordState.pdf_prepared == r[Fields.STATUS]
+        for r in expected.values()
+    )
+
+    helpers.reset_commit(review_manager=base_repo_review_manager, commit_sha=commit_sha)
+    pdf_prep_operation = base_repo_review_manager.get_pdf_prep_operation()
+    pdf_prep_operation.main(batch_size=0, processes=True, cpu=2)
+    actual = base_repo_review_manager.dataset.load_records_dict()
+    assert expected == actual
+
+
+def test_pdf_prep_nr_workers(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager, monkeypatch
+) -> None:
+    """Test the number of pdf-prep workers (create_tei limits the workers)"""
+
+    # pylint: disable=protected-access
+    pdf_prep_operation = base_repo_review_manager.get_pdf_prep_operation()
+    pdf_prep_operation.cpus = 8
+    pdf_prep_settings = base_repo_review_manager.settings.pdf_prep
+    monkeypatch.setattr(
+        pdf_prep_settings,
+        "pdf_prep_package_endpoints",
+        [{"endpoint": "colrev.pdf_check_ocr"}],
+    )
+    assert 8 == pdf_prep_operation._PDFPrep__get_nr_workers()
+    monkeypatch.setattr(
+        pdf_prep_settings,
+        "pdf_prep_package_endpoints",
+        [{"endpoint": "colrev.pdf_check_ocr"}, {"endpoint": "colrev.create_tei"}],
+    )
+    assert max(1, mp.cpu_count() // 2) == pdf_prep_operation._PDFPrep__get_nr_workers()
+
+
 def test_pdf_discard(  # type: ignore
     base_repo_review_manager: colrev.review_manager.ReviewManager, helpers
 ) -> None:
@@ -1,6 +1,10 @@
 #!/usr/bin/env python
 """Tests of the CoLRev prep operation"""
+from pathlib import Path
+
+import colrev.record
 import colrev.review_manager
+import colrev.settings
 
 
 def test_prep(  # type: ignore
@@ -61,4 +65,43 @@ def test_prep_reset_records(  # type: ignore
     prep_operation.reset_records(reset_ids=["Srivastava2015"])
 
 
+def test_prep_feeds(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager, helpers
+) -> None:
+    """Test the feeds shared in the prep operation"""
+
+    helpers.reset_commit(review_manager=base_repo_review_manager, commit="load_commit")
+    prep_operation = base_repo_review_manager.get_prep_operation()
+    prep_operation.feed_save_interval = 2
+    source = colrev.settings.SearchSource(
+        endpoint="colrev.crossref",
+        filename=Path("data/search/prep_feed.bib"),
+        search_type=colrev.settings.SearchType.API,
+        search_parameters={},
+        comment="",
+    )
+    feed = prep_operation.get_feed(search_source=source, source_identifier="doi")
+    assert feed is prep_operation.get_feed(
+        search_source=source, source_identifier="doi"
+    )
+
+    for doi in ["10.1/1", "10.1/2"]:
+        record = colrev.record.Record(
+            data={"ID": "", "ENTRYTYPE": "article", "doi": doi, "title": doi}
+        )
+        feed.set_id(record_dict=record.data)
+        feed.add_record(record=record)
+        # Note : the feed is not saved for each change
+        assert not (base_repo_review_manager.path / source.filename).is_file()
+        prep_operation.register_feed_change(feed=feed)
+
+    assert "prep_feed.bib/000002" in record.data["colrev_origin"][0]
+    feed_records = base_repo_review_manager.dataset.load_records_dict(
+        file_path=base_repo_review_manager.path / source.filename
+    )
+    assert 2 == len(feed_records)
+
+    helpers.reset_commit(review_manager=base_repo_review_manager, commit="load_commit")
+
+
 # TODO : difference set_ids - reset_ids?
@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 """Tests of the CoLRev prescreen operation"""
+import colrev.record
 import colrev.review_manager
+from colrev.constants import Fields
 
 
 def test_prescreen(  # type: ignore
@@ -20,3 +22,52 @@ def test_prescreen(  # type: ignore
         review_manager=base_repo_review_manager, commit="dedupe_commit"
     )
     prescreen_operation.setup_custom_script()
+
+
+def test_prescreen_decision_journal(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager, helpers
+) -> None:
+    """Test the prescreen decisions (journaled and merged into the records)"""
+
+    helpers.reset_commit(
+        review_manager=base_repo_review_manager, commit="dedupe_commit"
+    )
+    dataset = base_repo_review_manager.dataset
+    prescreen_operation = base_repo_review_manager.get_prescreen_operation()
+    records = dataset.load_records_dict()
+    records_file_content = dataset.records_file.read_text(encoding="utf-8")
+
+    record_ids = [
+        r[Fields.ID]
+        for r in records.values()
+        if colrev.record.RecordState.md_processed == r[Fields.STATUS]
+    ]
+    assert record_ids
+    for i, record_id in enumerate(record_ids):
+        prescreen_operation.prescreen(
+            record=colrev.record.Record(data=records[record_id]),
+            prescreen_inclusion=i % 2 == 0,
+        )
+
+    # Decisions are journaled (the records file is not rewritten for each decision)
+    assert dataset.decisions_file.is_file()
+    assert records_file_content == dataset.records_file.read_text(encoding="utf-8")
+
+    # Incomplete journal entries (e.g., after a crash) are skipped
+    with open(dataset.decisions_file, "a", encoding="utf-8") as journal:
+        journal.write('{"ID": "incomplete')
+
+    loaded_records = dataset.load_records_dict()
+    assert not dataset.decisions_file.is_file()
+    assert records == loaded_records
+    assert (
+        colrev.record.RecordState.rev_prescreen_included
+        == loaded_records[record_ids[0]][Fields.STATUS]
+    )
+    assert dataset.records_file.read_text(encoding="utf-8") == (
+        dataset.parse_bibtex_str(recs_dict_in=records) + "\n"
+    )
+
+    helpers.reset_commit(
+        review_manager=base_repo_review_manager, commit="dedupe_commit"
+    )
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+"""Test the incremental blocking of the active-learning dedupe"""
+from pathlib import Path
+
+import dedupe.blocking
+import dedupe.predicates
+
+import colrev.ops.built_in.dedupe.active_learning_blocking
+from colrev.constants import Fields
+
+
+def test_get_incremental_pairs(tmp_path: Path) -> None:
+    """Test get_incremental_pairs() and the BlockingKeysCache"""
+
+    calls = []
+
+    def whole_field(field: str) -> frozenset:
+        calls.append(field)
+        return frozenset((field,))
+
+    fingerprinter = dedupe.blocking.Fingerprinter(
+        [
+            dedupe.predicates.SimplePredicate(whole_field, Fields.YEAR),
+            dedupe.predicates.LevenshteinSearchPredicate(1, Fields.TITLE),
+        ]
+    )
+    settings_file = tmp_path / "learned_settings"
+    settings_file.write_bytes(b"settings")
+    blocking_keys_cache = (
+        colrev.ops.built_in.dedupe.active_learning_blocking.BlockingKeysCache(
+            cache_path=tmp_path / ".colrev" / "dedupe_blocking_keys.cache",
+            settings_file=settings_file,
+        )
+    )
+
+    processed_records = {
+        "P1": {Fields.YEAR: "2010", Fields.TITLE: "exploring the erp pathways"},
+        "P2": {Fields.YEAR: "2010", Fields.TITLE: "a different paper"},
+        "P3": {Fields.YEAR: "2015", Fields.TITLE: "digital platforms"},
+    }
+    new_records = {
+        "N1": {Fields.YEAR: "2012", Fields.TITLE: "exploring the erp pathways"},
+        "N2": {Fields.YEAR: "2015", Fields.TITLE: "a new paper on blockchains"},
+    }
+
+    expected = [("N1", "P1"), ("N2", "P3")]
+    actual = colrev.ops.built_in.dedupe.active_learning_blocking.get_incremental_pairs(
+        fingerprinter=fingerprinter,
+        blocking_keys_cache=blocking_keys_cache,
+        processed_records=processed_records,
+        new_records=new_records,
+    )
+    assert expected == actual
+    assert 5 == len(calls)
+
+    # The keys of the processed records are loaded from the cache
+    calls.clear()
+    new_records = {
+        "N3": {Fields.YEAR: "2010", Fields.TITLE: "something else"},
+        "N4": {Fields.YEAR: "2010", Fields.TITLE: "another topic"},
+    }
+    expected = [("N3", "N4"), ("N3", "P1"), ("N3", "P2"), ("N4", "P1"), ("N4", "P2")]
+    actual = colrev.ops.built_in.dedupe.active_learning_blocking.get_incremental_pairs(
+        fingerprinter=fingerprinter,
+        blocking_keys_cache=blocking_keys_cache,
+        processed_records=processed_records,
+        new_records=new_records,
+    )
+    assert expected == actual
+    assert 2 == len(calls)
+
+    # Changes of the settings (predicates) invalidate the cache
+    calls.clear()
+    settings_file.write_bytes(b"retrained settings")
+    colrev.ops.built_in.dedupe.active_learning_blocking.BlockingKeysCache(
+        cache_path=tmp_path / ".colrev" / "dedupe_blocking_keys.cache",
+        settings_file=settings_file,
+    ).get_blocking_keys(
+        predicates=[(0, fingerprinter.predicates[0])], records=processed_records
+    )
+    assert 3 == len(calls)
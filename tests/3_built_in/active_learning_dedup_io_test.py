@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+"""Test the (on-disk) clustering of the active-learning dedupe"""
+import collections
+from pathlib import Path
+
+import dedupe.blocking
+import dedupe.clustering
+import dedupe.core
+import dedupe.predicates
+import numpy as np
+
+import colrev.ops.built_in.dedupe.active_learning_dedup_io
+from colrev.constants import Fields
+
+# pylint: disable=protected-access
+
+
+class _Deduper:
+    """Deduper scoring records with identical titles as duplicates
+    (based on dedupe's scoreDuplicates and cluster)"""
+
+    def __init__(self) -> None:
+        self.fingerprinter = dedupe.blocking.Fingerprinter(
+            [
+                dedupe.predicates.SimplePredicate(
+                    dedupe.predicates.wholeFieldPredicate, Fields.YEAR
+                ),
+                dedupe.predicates.LevenshteinSearchPredicate(1, Fields.TITLE),
+            ]
+        )
+        self.scored_pairs: list = []
+
+    def __featurize(self, record_pairs: list) -> np.ndarray:
+        self.scored_pairs.extend(record_pairs)
+        return np.array(
+            [[float(a[Fields.TITLE] == b[Fields.TITLE])] for a, b in record_pairs]
+        )
+
+    class _Classifier:  # pylint: disable=too-few-public-methods
+        def predict_proba(self, features: np.ndarray) -> np.ndarray:
+            """Predict the probabilities (non-duplicate, duplicate)"""
+            scores = features[:, 0] * 0.8 + 0.1
+            return np.column_stack([1 - scores, scores])
+
+    def score(self, pairs):  # type: ignore
+        """Score the pairs"""
+        return dedupe.core.scoreDuplicates(
+            pairs, self.__featurize, self._Classifier(), 1
+        )
+
+    def cluster(self, scores, threshold):  # type: ignore
+        """Cluster the scored pairs"""
+        return dedupe.clustering.cluster(scores, threshold)
+
+
+def test_cluster_duplicates_on_disk(mocker, tmp_path: Path) -> None:  # type: ignore
+    """Test __cluster_duplicates_on_disk()"""
+
+    active_learning_class = (
+        colrev.ops.built_in.dedupe.active_learning_dedup_io.ActiveLearningDedupeAutomated
+    )
+    dedupe_operation = mocker.MagicMock()
+    dedupe_operation.review_manager.path = tmp_path
+    active_learning = active_learning_class(
+        dedupe_operation=dedupe_operation,
+        settings={"endpoint": "colrev.active_learning_automated"},
+    )
+    # Note : pairs are streamed in multiple chunks
+    mocker.patch.object(active_learning_class, "PAIRS_CHUNK_SIZE", 2)
+
+    # Note : numeric-looking IDs are stored as TEXT
+    data_d = {
+        record_id: {Fields.ID: record_id, Fields.YEAR: year, Fields.TITLE: title}
+        for record_id, year, title in [
+            ("2020", "2010", "exploring the erp pathways"),
+            ("Staehr2010", "2010", "exploring the erp pathways"),
+            ("Other2010", "2010", "a different paper"),
+            ("Staehr2012", "2012", "exploring the erp pathway"),
+            ("Single2015", "2015", "digital platforms"),
+        ]
+    }
+
+    deduper = _Deduper()
+    clustered_dupes = (
+        active_learning._ActiveLearningDedupeAutomated__cluster_duplicates_on_disk(
+            deduper=deduper, data_d=data_d
+        )
+    )
+    assert [("2020", "Staehr2010")] == [
+        tuple(sorted(record_ids)) for record_ids, _ in clustered_dupes
+    ]
+
+    # Each unordered pair (sharing a block) is scored once
+    scored_pairs = collections.Counter(
+        frozenset((a[Fields.ID], b[Fields.ID])) for a, b in deduper.scored_pairs
+    )
+    assert {
+        frozenset(("2020", "Staehr2010")),
+        frozenset(("2020", "Other2010")),
+        frozenset(("Staehr2010", "Other2010")),
+        frozenset(("2020", "Staehr2012")),
+        frozenset(("Staehr2010", "Staehr2012")),
+    } == set(scored_pairs)
+    assert {1} == set(scored_pairs.values())
+
+    # Records that are not blocked together
+    data_d = {record_id: data_d[record_id] for record_id in ["Other2010", "Single2015"]}
+    assert (
+        []
+        == active_learning._ActiveLearningDedupeAutomated__cluster_duplicates_on_disk(
+            deduper=_Deduper(), data_d=data_d
+        )
+    )
+
+    # The temporary blocking map is removed
+    assert not list((tmp_path / Path(".colrev")).iterdir())
+    assert not Path("dedupe.db").is_file()
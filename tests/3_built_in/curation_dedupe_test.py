@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+"""Test the curation dedupe"""
+import numpy as np
+import pandas as pd
+
+import colrev.ops.built_in.dedupe.curation_dedupe
+from colrev.constants import ENTRYTYPES
+from colrev.constants import Fields
+
+# pylint: disable=protected-access
+
+
+def test_calculate_similarities(mocker) -> None:  # type: ignore
+    """Test __calculate_similarities() against the (previous) amax/where extraction"""
+
+    curation_dedupe_class = colrev.ops.built_in.dedupe.curation_dedupe.CurationDedupe
+    # Note : similarities of the references (excluding the first entry), with ties
+    similarities = np.array(
+        [
+            [1.0, 0.9, 0.8, 0.75, 0.2],
+            [0.9, 1.0, 0.9, 0.8, 0.9],
+            [0.8, 0.9, 1.0, 0.75, 0.6],
+            [0.75, 0.8, 0.75, 1.0, 0.9],
+            [0.2, 0.9, 0.6, 0.9, 1.0],
+        ]
+    )
+    mocker.patch.object(
+        curation_dedupe_class,
+        "_CurationDedupe__get_similarity_matrix",
+        return_value=similarities,
+    )
+    references = pd.DataFrame.from_records(
+        [{Fields.ID: f"R{i}"} for i in range(similarities.shape[0] + 1)]
+    )
+    min_similarity = 0.7
+
+    # Reference: the extraction based on np.amax/np.where
+    similarity_array = np.zeros([references.shape[0], references.shape[0]])
+    lower_triangle = np.tril(np.ones(similarities.shape, dtype=bool), k=-1)
+    similarity_array[1:, 1:][lower_triangle] = similarities[lower_triangle]
+    expected = []
+    while np.amax(similarity_array) >= min_similarity:
+        maximum_similarity = np.amax(similarity_array)
+        for cord in zip(*np.where(similarity_array == maximum_similarity)):
+            similarity_array[cord] = 0
+            expected.append(
+                [
+                    references.iloc[cord[0]][Fields.ID],
+                    references.iloc[cord[1]][Fields.ID],
+                    maximum_similarity,
+                    "not_processed",
+                ]
+            )
+
+    curation_dedupe = curation_dedupe_class.__new__(curation_dedupe_class)
+    actual = curation_dedupe._CurationDedupe__calculate_similarities(
+        references=references, min_similarity=min_similarity
+    )
+    assert expected == actual
+    assert 8 == len(actual)
+
+
+def test_get_toc_records() -> None:
+    """Test __get_toc_records() against the (previous) per-item filters"""
+
+    curation_dedupe_class = colrev.ops.built_in.dedupe.curation_dedupe.CurationDedupe
+    records_list = [
+        {
+            Fields.ID: "A1",
+            Fields.ENTRYTYPE: ENTRYTYPES.ARTICLE,
+            Fields.JOURNAL: "MIS Quarterly",
+            Fields.VOLUME: "42",
+            Fields.NUMBER: "1",
+        },
+        {
+            Fields.ID: "A2",
+            Fields.ENTRYTYPE: ENTRYTYPES.ARTICLE,
+            Fields.JOURNAL: "MIS Quarterly",
+            Fields.VOLUME: "42",
+            Fields.NUMBER: "2",
+        },
+        {
+            Fields.ID: "A3",
+            Fields.ENTRYTYPE: ENTRYTYPES.ARTICLE,
+            Fields.JOURNAL: "MIS Quarterly",
+            Fields.VOLUME: "42",
+        },
+        {
+            Fields.ID: "A4",
+            Fields.ENTRYTYPE: ENTRYTYPES.ARTICLE,
+            Fields.JOURNAL: "MIS Quarterly",
+            Fields.VOLUME: "NA",
+        },
+        {
+            Fields.ID: "P1",
+            Fields.ENTRYTYPE: ENTRYTYPES.INPROCEEDINGS,
+            Fields.BOOKTITLE: "ICIS",
+            Fields.YEAR: "2020",
+        },
+        {
+            Fields.ID: "P2",
+            Fields.ENTRYTYPE: ENTRYTYPES.INPROCEEDINGS,
+            Fields.BOOKTITLE: "ICIS",
+            Fields.YEAR: "2021",
+        },
+    ]
+    toc_items = [
+        {Fields.JOURNAL: "MIS Quarterly", Fields.VOLUME: "42", Fields.NUMBER: "1"},
+        {Fields.JOURNAL: "MIS Quarterly", Fields.VOLUME: "42"},
+        {Fields.JOURNAL: "MIS Quarterly", Fields.VOLUME: "NA"},
+        {Fields.NUMBER: "NA", Fields.VOLUME: "42", Fields.JOURNAL: "MIS Quarterly"},
+        {Fields.BOOKTITLE: "ICIS", Fields.YEAR: "2020"},
+        {Fields.BOOKTITLE: "ICIS", Fields.YEAR: "2019"},
+    ]
+
+    toc_index = curation_dedupe_class._CurationDedupe__get_toc_index(
+        records_list=records_list, toc_items=toc_items
+    )
+    for toc_item in toc_items:
+        expected = [
+            r
+            for r in records_list
+            if all(r.get(k, "NA") == v for k, v in toc_item.items())
+        ]
+        actual = curation_dedupe_class._CurationDedupe__get_toc_records(
+            toc_index=toc_index, toc_item=toc_item
+        )
+        assert expected == actual
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+"""Test the dedupe utils (blocking)"""
+import colrev.ops.built_in.dedupe.utils
+from colrev.constants import Fields
+
+
+def test_get_blocking_keys() -> None:
+    """Test get_blocking_keys()"""
+
+    record_dict = {
+        Fields.ID: "Staehr2010",
+        Fields.TITLE: "exploring the erp pathways",
+        Fields.AUTHOR: "Staehr, Lorraine and Shanks, Graeme",
+        Fields.YEAR: "2010",
+        "container_title": "information systems journal",
+        Fields.VOLUME: "20",
+    }
+    expected = {
+        "title:exploring the erp",
+        "title:the erp pathways",
+        "author_year:staehr|2010",
+        "container_year_volume:information systems journal|2010|20",
+    }
+    actual = colrev.ops.built_in.dedupe.utils.get_blocking_keys(record_dict)
+    assert expected == actual
+
+    # Short titles, missing values
+    record_dict = {
+        Fields.ID: "Editorial",
+        Fields.TITLE: "editorial",
+        Fields.YEAR: "nan",
+    }
+    expected = {"title:editorial"}
+    actual = colrev.ops.built_in.dedupe.utils.get_blocking_keys(record_dict)
+    assert expected == actual
+
+
+def test_get_candidate_pairs() -> None:
+    """Test get_candidate_pairs()"""
+
+    records = [
+        {Fields.TITLE: "exploring the erp pathways", Fields.YEAR: "2010"},
+        {Fields.TITLE: "a different paper", Fields.YEAR: "2010"},
+        {Fields.TITLE: "exploring the erp pathway", Fields.YEAR: "2011"},
+        {Fields.TITLE: "a different paper", Fields.YEAR: "2012"},
+    ]
+    expected = {2: [0], 3: [1]}
+    actual = colrev.ops.built_in.dedupe.utils.get_candidate_pairs(records)
+    assert expected == actual
+
+    # Blocks exceeding the maximum size are not considered
+    actual = colrev.ops.built_in.dedupe.utils.get_candidate_pairs(
+        records, max_block_size=1
+    )
+    assert {} == actual
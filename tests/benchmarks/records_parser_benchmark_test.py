@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+"""Benchmark: native records.bib parser vs. pybtex (synthetic records files)
+
+The benchmarks only run if COLREV_BENCHMARK is set:
+
+    COLREV_BENCHMARK=1 pytest tests/benchmarks -s
+"""
+from __future__ import annotations
+
+import io
+import os
+import time
+
+import pybtex.errors
+import pytest
+from pybtex.database.input import bibtex
+
+import colrev.dataset
+import colrev.record
+import colrev.records_parser
+from colrev.constants import ENTRYTYPES
+from colrev.constants import Fields
+
+
+def get_synthetic_records_str(*, nr_records: int) -> str:
+    """Create a canonical records.bib string with nr_records entries"""
+
+    template_record = {
+        "Template": {
+            Fields.ID: "Template",
+            Fields.ENTRYTYPE: ENTRYTYPES.ARTICLE,
+            Fields.ORIGIN: ["search.bib/000001", "dblp.bib/000002"],
+            Fields.STATUS: colrev.record.RecordState.md_processed,
+            Fields.MD_PROV: {
+                Fields.AUTHOR: {"source": "search.bib/000001", "note": ""},
+                Fields.TITLE: {"source": "search.bib/000001", "note": ""},
+            },
+            Fields.D_PROV: {},
+            Fields.DOI: "10.1111/ISJ.12345",
+            Fields.AUTHOR: "Smith, John and Doe, Jane and von Neumann, John",
+            Fields.JOURNAL: "Information Systems Journal",
+            Fields.TITLE: "A synthetic title on digital work in organizations",
+            Fields.YEAR: "2020",
+            Fields.VOLUME: "30",
+            Fields.NUMBER: "2",
+            Fields.PAGES: "1--20",
+            Fields.ABSTRACT: "An abstract " * 30,
+        }
+    }
+    template = colrev.dataset.Dataset.parse_bibtex_str(recs_dict_in=template_record)
+    return "\n".join(
+        template.replace("Template", f"Record{i:06}") for i in range(nr_records)
+    )
+
+
+@pytest.mark.skipif(
+    not os.getenv("COLREV_BENCHMARK"), reason="benchmarks require COLREV_BENCHMARK"
+)
+@pytest.mark.parametrize("nr_records", [10_000, 100_000])
+def test_records_parser_benchmark(nr_records: int) -> None:
+    """Compare the native parser with the pybtex path"""
+
+    records_str = get_synthetic_records_str(nr_records=nr_records)
+    pybtex.errors.set_strict_mode(False)
+
+    start = time.perf_counter()
+    records_native = {
+        r[Fields.ID]: r
+        for r in colrev.records_parser.read_records(
+            file_object=io.StringIO(records_str)
+        )
+    }
+    native_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    bib_data = bibtex.Parser().parse_string(records_str)
+    records_pybtex = colrev.dataset.Dataset.parse_records_dict(
+        records_dict=bib_data.entries
+    )
+    pybtex_time = time.perf_counter() - start
+
+    assert records_native == records_pybtex
+    print(
+        f"\n{nr_records:>8} records: native {native_time:7.2f}s | "
+        f"pybtex {pybtex_time:7.2f}s | speedup {pybtex_time / native_time:5.1f}x"
+    )